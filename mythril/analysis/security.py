@@ -8,6 +8,9 @@ import logging
 
 OPCODE_LIST = [c[0] for _, c in opcodes.items()]
 
+# Names of the detection modules, found on first use
+_module_names = None
+
 
 def reset_callback_modules():
     modules = get_detection_modules("callback")
@@ -41,13 +44,10 @@ def get_detection_modules(entrypoint, include_modules=()):
     _modules = []
 
     if not include_modules:
-        for loader, module_name, _ in pkgutil.walk_packages(modules.__path__):
-            if module_name != "base":
-                module = importlib.import_module(
-                    "mythril.analysis.modules." + module_name
-                )
-                if module.detector.entrypoint == entrypoint:
-                    _modules.append(module)
+        for module_name in _get_module_names():
+            module = importlib.import_module("mythril.analysis.modules." + module_name)
+            if module.detector.entrypoint == entrypoint:
+                _modules.append(module)
     else:
         for module_name in include_modules:
             module = importlib.import_module("mythril.analysis.modules." + module_name)
@@ -58,7 +58,22 @@ def get_detection_modules(entrypoint, include_modules=()):
     return _modules
 
 
+def _get_module_names():
+    global _module_names
+    if _module_names is None:
+        _module_names = [
+            module_name
+            for _, module_name, _ in pkgutil.walk_packages(modules.__path__)
+            if module_name != "base"
+        ]
+    return _module_names
+
+
 def fire_lasers(statespace, module_names=()):
+    if getattr(statespace, "issues", None) is not None:
+        # The worker processes of a parallel exploration already ran the modules
+        return statespace.issues
+
     logging.info("Starting analysis")
 
     issues = []
@@ -1,5 +1,6 @@
-from z3 import Solver, simplify, sat, unknown, FuncInterp, UGE, Optimize
+from z3 import Solver, simplify, sat, unsat, unknown, FuncInterp, UGE, Optimize
 from mythril.exceptions import UnsatError
+from mythril.laser.ethereum.state.constraints import Constraints
 from mythril.laser.ethereum.transaction.transaction_models import (
     ContractCreationTransaction,
 )
@@ -7,13 +8,21 @@ import logging
 
 
 def get_model(constraints, minimize=(), maximize=()):
-    s = Optimize()
-    s.set("timeout", 100000)
-
     for constraint in constraints:
         if type(constraint) == bool and not constraint:
             raise UnsatError
 
+    if isinstance(constraints, Constraints):
+        # Reuse the incremental solver of the path, which already holds the shared path prefix
+        result = constraints.solver.check(constraints)
+        if result == unsat:
+            raise UnsatError
+        if result == sat and not minimize and not maximize:
+            return constraints.solver.model()
+
+    s = Optimize()
+    s.set("timeout", 100000)
+
     constraints = [constraint for constraint in constraints if type(constraint) != bool]
 
     for constraint in constraints:
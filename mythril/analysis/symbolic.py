@@ -1,14 +1,25 @@
-from mythril.analysis.security import get_detection_module_hooks
+from mythril.analysis.security import (
+    get_detection_module_hooks,
+    get_detection_modules,
+    fire_lasers,
+    reset_callback_modules,
+)
 from mythril.laser.ethereum import svm
 from mythril.laser.ethereum.state.account import Account
 from mythril.solidity.soliditycontract import SolidityContract, EVMContract
+from mythril.exceptions import CriticalError
 import copy
+import hashlib
+import logging
+import multiprocessing
 from .ops import get_variable, SStore, Call, VarType
 from mythril.laser.ethereum.strategy.basic import (
     DepthFirstSearchStrategy,
     BreadthFirstSearchStrategy,
     ReturnRandomNaivelyStrategy,
     ReturnWeightedRandomStrategy,
+    DependencyPriorityStrategy,
+    CoverageGuidedStrategy,
 )
 
 
@@ -28,8 +39,41 @@ class SymExecWrapper:
         execution_timeout=None,
         create_timeout=None,
         transaction_count=2,
-        priority=None
+        priority=None,
+        prune_infeasible=False,
+        solver_timeout=None,
+        workers=1,
+        modules=(),
+        beam_width=None,
+        coverage_plateau=None,
+        merge_states=False,
+        loop_bound=3,
+        symbolic_memory=False,
     ):
+        """
+        :param workers: Number of worker processes. With more than one worker, the open states after the first
+            message call are split across a process pool. Each worker explores its part of the remaining
+            transactions and runs the detection modules on it. Post analysis modules look at the whole statespace,
+            so runs with any of them stay in one process.
+        :param modules: Detection modules that the workers run, all modules by default
+        :param beam_width: Number of open states the heuristic search extends per transaction, None for no limit
+        :param coverage_plateau: Number of executed states without new instruction coverage after which a message
+            call transaction stops exploring, None to only stop on execution_timeout
+        :param merge_states: Merge states that reach the same jump destination, see mythril.laser.ethereum.merging
+        :param loop_bound: Number of times a path may take the same backward jump in a call frame, None for no
+            limit. With a loop bound, only backward jumps count towards max_depth
+        :param symbolic_memory: Model memory accesses at symbolic offsets with Z3 arrays instead of dropping them
+
+        Runs with a priority use the priority strategy, which is also the default for them. Other strategies do not
+        honour the deferred branches of the heuristic search and raise a CriticalError.
+        """
+
+        if strategy is None:
+            strategy = "priority" if priority is not None else "dfs"
+        elif priority is not None and strategy != "priority":
+            raise CriticalError(
+                "The heuristic search needs the priority strategy, not " + strategy
+            )
 
         if strategy == "dfs":
             s_strategy = DepthFirstSearchStrategy
@@ -39,6 +83,10 @@ class SymExecWrapper:
             s_strategy = ReturnRandomNaivelyStrategy
         elif strategy == "weighted-random":
             s_strategy = ReturnWeightedRandomStrategy
+        elif strategy == "priority":
+            s_strategy = DependencyPriorityStrategy
+        elif strategy == "coverage":
+            s_strategy = CoverageGuidedStrategy
         else:
             raise ValueError("Invalid strategy argument supplied")
 
@@ -51,6 +99,21 @@ class SymExecWrapper:
 
         self.accounts = {address: account}
 
+        # The heuristic search schedules states across transactions, so it is not split across workers. Neither are
+        # runs with post modules, which pair states from different partitions, e.g. a CALL with an earlier SSTORE
+        parallel = (
+            workers > 1
+            and priority is None
+            and transaction_count > 1
+            and not get_detection_modules("post", include_modules=modules)
+        )
+        if workers > 1 and not parallel:
+            logging.info(
+                "Parallel exploration is not available for this run, using one process"
+            )
+
+        self.issues = None
+
         self.laser = svm.LaserEVM(
             self.accounts,
             dynamic_loader=dynloader,
@@ -58,7 +121,14 @@ class SymExecWrapper:
             execution_timeout=execution_timeout,
             strategy=s_strategy,
             create_timeout=create_timeout,
-            transaction_count=transaction_count,
+            transaction_count=1 if parallel else transaction_count,
+            prune_infeasible=prune_infeasible,
+            solver_timeout=solver_timeout,
+            beam_width=beam_width,
+            coverage_plateau=coverage_plateau,
+            merge_states=merge_states,
+            loop_bound=loop_bound,
+            symbolic_memory=symbolic_memory,
         )
         self.laser.register_hooks(
             hook_type="pre", hook_dict=get_detection_module_hooks()
@@ -75,12 +145,17 @@ class SymExecWrapper:
         else:
             self.laser.sym_exec(address, priority=priority)
 
+        if parallel and len(self.laser.open_states) > 0:
+            self._explore_in_workers(workers, transaction_count - 1, modules)
+
         self.nodes = self.laser.nodes
         self.edges = self.laser.edges
 
         print('total states: ' + str(self.laser.total_states))
-        # Generate lists of interesting operations
+        self._find_operations()
 
+    def _find_operations(self):
+        """ Generates lists of interesting operations"""
         self.calls = []
         self.sstors = {}
 
@@ -179,6 +254,47 @@ class SymExecWrapper:
 
                 state_index += 1
 
+    def _explore_in_workers(self, workers, transaction_count, modules):
+        """
+        Executes the remaining transactions in a pool of forked worker processes, each starting from a part of the
+        open states. Nodes and states hold z3 objects that can not be sent between processes, so every worker
+        collects the issues of the callback modules itself. Afterwards self.issues holds the merged issues, and
+        the nodes and edges cover the transactions that were executed before the split.
+        :param workers: Number of worker processes
+        :param transaction_count: Number of transactions that remain to be executed
+        :param modules: Detection modules to run in the workers
+        """
+        global _parallel_wrapper
+        open_states = self.laser.open_states
+        partitions = [open_states[i::workers] for i in range(workers)]
+        partitions = [partition for partition in partitions if partition]
+
+        # Workers inherit the partitions through fork, only their indices are sent to the pool
+        _parallel_wrapper = (self, partitions, transaction_count, modules)
+        try:
+            with multiprocessing.get_context("fork").Pool(len(partitions)) as pool:
+                results = pool.map(_explore_partition, range(len(partitions)))
+        finally:
+            _parallel_wrapper = None
+
+        # Callback issues found before the split are reported by every worker
+        reset_callback_modules()
+        del self.laser.open_states[:]
+
+        self.issues = []
+        seen = set()
+        for issues, coverage, total_states in results:
+            for issue in issues:
+                key = hashlib.md5(
+                    (issue.contract + str(issue.address) + issue.title).encode("utf-8")
+                ).digest()
+                if key not in seen:
+                    seen.add(key)
+                    self.issues.append(issue)
+
+            self.laser.total_states += total_states
+            self.laser.coverage.merge(coverage)
+
     def find_storage_write(self, address, index):
 
         # Find an SSTOR not constrained by caller that writes to storage index "index"
@@ -199,3 +315,26 @@ class SymExecWrapper:
             return None
         except KeyError:
             return None
+
+
+# Wrapper that forked workers explore, set by SymExecWrapper._explore_in_workers for the lifetime of the pool
+_parallel_wrapper = None
+
+
+def _explore_partition(index):
+    """
+    Worker entry point: executes the remaining transactions from a part of the open states and collects the issues
+    :param index: Index of the partition of open states that this worker explores
+    :return: issues, coverage and the number of states executed by this worker
+    """
+    wrapper, partitions, transaction_count, modules = _parallel_wrapper
+    laser = wrapper.laser
+    total_states = laser.total_states
+
+    laser.open_states = partitions[index]
+    laser.execute_message_calls(laser.callee_address, transaction_count)
+
+    # Only callback modules run in workers, their issues were found while executing
+    issues = fire_lasers(wrapper, modules)
+
+    return issues, laser.coverage, laser.total_states - total_states
@@ -1,27 +1,88 @@
-import re
-from collections import Generator
+from array import array
+from collections import Generator, Sequence
 
 from ethereum.opcodes import opcodes
 
-regex_PUSH = re.compile("^PUSH(\d*)$")
-
 # Additional mnemonic to catch failed assertions
 opcodes[254] = ["ASSERT_FAIL", 0, 0, 0]
 
+OPCODE_NAMES = tuple(
+    opcodes[op_code][0] if op_code in opcodes else "INVALID" for op_code in range(256)
+)
+
+PUSH1, PUSH32 = 0x60, 0x7F
+
+
+class InstructionView(dict):
+    """ Read-only dictionary view of a single instruction, as returned by InstructionList"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Instructions are read-only")
 
-class EvmInstruction:
-    """ Model to hold the information of the disassembly """
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
 
-    def __init__(self, address, op_code, argument=None):
-        self.address = address
-        self.op_code = op_code
-        self.argument = argument
 
-    def to_dict(self) -> dict:
-        result = {"address": self.address, "opcode": self.op_code}
-        if self.argument:
-            result["argument"] = self.argument
-        return result
+class InstructionList(Sequence):
+    """
+    Compact instruction list
+
+    The instructions are stored in parallel arrays of opcode bytes, addresses, push arguments and pre-decoded push
+    values. Indexing returns a read-only dict view with the "address", "opcode" and (for pushes) "argument" keys
+    that the rest of mythril uses; views are created on first access and cached.
+    """
+
+    def __init__(self):
+        self.opcodes = bytearray()
+        self.addresses = array("L")
+        self.arguments = []
+        self.push_values = []
+        self._views = []
+
+    def append(self, address: int, op_code: int, argument=None) -> None:
+        """
+        Appends an instruction
+        :param address: Address of the instruction
+        :param op_code: Opcode byte of the instruction
+        :param argument: Argument bytes of a push instruction
+        """
+        self.opcodes.append(op_code)
+        self.addresses.append(address)
+        self.arguments.append(argument)
+        if argument is None:
+            self.push_values.append(None)
+        else:
+            # Arguments truncated by the end of the code are padded with zeros
+            width = op_code - PUSH1 + 1
+            self.push_values.append(
+                int.from_bytes(argument + bytes(width - len(argument)), "big")
+            )
+        self._views.append(None)
+
+    def opcode_name(self, index: int) -> str:
+        return OPCODE_NAMES[self.opcodes[index]]
+
+    def _view(self, index: int) -> InstructionView:
+        view = self._views[index]
+        if view is None:
+            view = InstructionView(
+                address=self.addresses[index], opcode=self.opcode_name(index)
+            )
+            argument = self.arguments[index]
+            if argument is not None:
+                dict.__setitem__(view, "argument", "0x" + argument.hex())
+            self._views[index] = view
+        return view
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self._view(index)
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
 
 
 def instruction_list_to_easm(instruction_list: list) -> str:
@@ -67,16 +128,20 @@ def is_sequence_match(pattern: list, instruction_list: list, index: int) -> bool
     """
     for index, pattern_slot in enumerate(pattern, start=index):
         try:
-            if not instruction_list[index]["opcode"] in pattern_slot:
+            if isinstance(instruction_list, InstructionList):
+                op_code = instruction_list.opcode_name(index)
+            else:
+                op_code = instruction_list[index]["opcode"]
+            if not op_code in pattern_slot:
                 return False
         except IndexError:
             return False
     return True
 
 
-def disassemble(bytecode: str) -> list:
+def disassemble(bytecode: bytes) -> InstructionList:
     """Disassembles evm bytecode and returns a list of instructions"""
-    instruction_list = []
+    instruction_list = InstructionList()
     address = 0
     length = len(bytecode)
     if "bzzr" in str(bytecode[-43:]):
@@ -84,24 +149,14 @@ def disassemble(bytecode: str) -> list:
         length -= 43
 
     while address < length:
-        try:
-            op_code = opcodes[bytecode[address]]
-        except KeyError:
-            instruction_list.append(EvmInstruction(address, "INVALID"))
-            address += 1
-            continue
-
-        op_code_name = op_code[0]
-        current_instruction = EvmInstruction(address, op_code_name)
-
-        match = re.search(regex_PUSH, op_code_name)
-        if match:
-            argument_bytes = bytecode[address + 1 : address + 1 + int(match.group(1))]
-            current_instruction.argument = "0x" + argument_bytes.hex()
-            address += int(match.group(1))
-
-        instruction_list.append(current_instruction)
+        op_code = bytecode[address]
+        if PUSH1 <= op_code <= PUSH32:
+            width = op_code - PUSH1 + 1
+            argument = bytes(bytecode[address + 1 : address + 1 + width])
+            instruction_list.append(address, op_code, argument)
+            address += width
+        else:
+            instruction_list.append(address, op_code)
         address += 1
 
-    # We use a to_dict() here for compatibility reasons
-    return [element.to_dict() for element in instruction_list]
+    return instruction_list
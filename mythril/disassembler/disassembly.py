@@ -1,8 +1,13 @@
 from mythril.ethereum import util
 from mythril.disassembler import asm
 from mythril.support.signatures import SignatureDB
+from typing import Tuple, Union
 import logging
 
+JUMPDEST = 0x5B
+# STOP, JUMP, JUMPI, RETURN, REVERT, INVALID, SUICIDE
+BLOCK_TERMINATORS = frozenset((0x00, 0x56, 0x57, 0xF3, 0xFD, 0xFE, 0xFF))
+
 
 class MappingObj:
     function_name = ''
@@ -30,6 +35,20 @@ class Disassembly(object):
         self.bytecode = code
         self.instruction_list = asm.disassemble(util.safe_decode(code))
 
+        # Lookup tables used to resolve jump targets without scanning the instruction list
+        self.address_to_index = {}
+        self.jumpdest_indices = set()
+        for index, (address, op_code) in enumerate(
+            zip(self.instruction_list.addresses, self.instruction_list.opcodes)
+        ):
+            self.address_to_index[address] = index
+            if op_code == JUMPDEST:
+                self.jumpdest_indices.add(index)
+
+        # Basic block bounds, computed on first use
+        self._block_starts = None
+        self._block_ends = None
+
         self.func_hashes = []
         self.function_name_to_address = {}
         self.address_to_function_name = {}
@@ -41,8 +60,16 @@ class Disassembly(object):
         signatures = SignatureDB(enable_online_lookup=enable_online_lookup)
 
         # Need to take from PUSH1 to PUSH4 because solc seems to remove excess 0s at the beginning for optimizing
-        jump_table_indices = asm.find_op_code_sequence(
-            [("PUSH1", "PUSH2", "PUSH3", "PUSH4"), ("EQ",)], self.instruction_list
+        jump_table_indices = list(
+            asm.find_op_code_sequence(
+                [("PUSH1", "PUSH2", "PUSH3", "PUSH4"), ("EQ",)], self.instruction_list
+            )
+        )
+
+        # Look up all function hashes in one query, get_function_info then finds them in the cache of the database
+        signatures.get_many(
+            get_function_hash(index, self.instruction_list)
+            for index in jump_table_indices
         )
 
         for index in jump_table_indices:
@@ -58,10 +85,61 @@ class Disassembly(object):
                 self.function_name_to_address[function_name] = jump_target
                 self.address_to_function_name[jump_target] = function_name
 
+    def get_instruction_index(self, address: int) -> Union[int, None]:
+        """
+        Gets the index of the instruction at a bytecode address
+        :param address: Address of the instruction
+        :return: Index of the instruction in the instruction list, None if no instruction starts at the address
+        """
+        return self.address_to_index.get(address)
+
+    def is_jumpdest(self, index: int) -> bool:
+        """ Checks whether the instruction at index is a JUMPDEST"""
+        return index in self.jumpdest_indices
+
+    def get_basic_block(self, index: int) -> Tuple[int, int]:
+        """
+        Gets the basic block that contains an instruction
+        :param index: Index of the instruction
+        :return: Index of the first instruction of the block and the index after its last instruction
+        """
+        if self._block_starts is None:
+            self._compute_basic_blocks()
+        start = self._block_starts[index]
+        return start, self._block_ends[start]
+
+    def _compute_basic_blocks(self) -> None:
+        opcodes = self.instruction_list.opcodes
+        self._block_starts = []
+        self._block_ends = {}
+
+        start = 0
+        for index, op_code in enumerate(opcodes):
+            if op_code == JUMPDEST and index != start:
+                self._block_ends[start] = index
+                start = index
+            self._block_starts.append(start)
+            if op_code in BLOCK_TERMINATORS:
+                self._block_ends[start] = index + 1
+                start = index + 1
+        if start < len(opcodes):
+            self._block_ends[start] = len(opcodes)
+
     def get_easm(self):
         return asm.instruction_list_to_easm(self.instruction_list)
 
 
+def get_function_hash(index: int, instruction_list: list) -> str:
+    """
+    Gets the function hash of a call table entry
+    :param index: Start of the entry pattern
+    :param instruction_list: Instruction list for the contract that is being analyzed
+    :return: The hash as 0x-prefixed hexstr of 4 bytes
+    """
+    # Append with missing 0s at the beginning
+    return "0x" + instruction_list[index]["argument"][2:].rjust(8, "0")
+
+
 def get_function_info(
     index: int, instruction_list: list, signature_database: SignatureDB
 ) -> (str, int, str):
@@ -83,8 +161,7 @@ def get_function_info(
     :return: function hash, function entry point, function name
     """
 
-    # Append with missing 0s at the beginning
-    function_hash = "0x" + instruction_list[index]["argument"][2:].rjust(8, "0")
+    function_hash = get_function_hash(index, instruction_list)
 
     function_names = signature_database.get(function_hash)
     if len(function_names) > 1:
@@ -71,6 +71,16 @@ def main():
     commands.add_argument(
         "-d", "--disassemble", action="store_true", help="print disassembly"
     )
+    commands.add_argument(
+        "--batch",
+        help="detect vulnerabilities in all contracts of a directory or manifest file, printing one JSON report per line",
+        metavar="DIRECTORY_OR_MANIFEST",
+    )
+    commands.add_argument(
+        "--daemon",
+        help="serve analysis requests over HTTP on HOST:PORT or a Unix socket path, keeping caches warm between requests",
+        metavar="ADDRESS",
+    )
     commands.add_argument(
         "-j",
         "--statespace-json",
@@ -159,6 +169,11 @@ def main():
         help="returns corresponding address for a contract address hash",
         metavar="SHA3_TO_LOOK_FOR",
     )
+    utilities.add_argument(
+        "--build-signature-pack",
+        help="build the offline signature pack from a signature database or a text file of 'SELECTOR SIGNATURE' lines",
+        metavar="DUMP",
+    )
 
     options = parser.add_argument_group("options")
     options.add_argument(
@@ -171,14 +186,20 @@ def main():
         "--max-depth",
         type=int,
         default=22,
-        help="Maximum recursion depth for symbolic execution",
+        help="Maximum recursion depth for symbolic execution, only backward jumps count with a loop bound",
     )
 
     options.add_argument(
         "--strategy",
-        choices=["dfs", "bfs", "naive-random", "weighted-random"],
-        default="dfs",
-        help="Symbolic execution strategy",
+        choices=[
+            "dfs",
+            "bfs",
+            "naive-random",
+            "weighted-random",
+            "priority",
+            "coverage",
+        ],
+        help="Symbolic execution strategy, dfs by default and priority with --slither",
     )
     options.add_argument(
         "-t",
@@ -199,6 +220,73 @@ def main():
         default=10,
         help="The amount of seconds to spend on " "the initial contract creation",
     )
+    options.add_argument(
+        "--prune-infeasible",
+        action="store_true",
+        help="Drop branches whose path constraints are unsatisfiable at each JUMPI",
+    )
+    options.add_argument(
+        "--solver-timeout",
+        type=int,
+        default=None,
+        help="The amount of milliseconds the solver may spend on a single branch feasibility query",
+    )
+    options.add_argument(
+        "--loop-bound",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Maximum number of iterations of a loop per call frame, 0 for no limit",
+    )
+    options.add_argument(
+        "--symbolic-memory",
+        action="store_true",
+        help="Model memory reads and writes at symbolic offsets instead of dropping them",
+    )
+    options.add_argument(
+        "--merge-states",
+        action="store_true",
+        help="Merge execution paths that reach the same jump destination with compatible states",
+    )
+    options.add_argument(
+        "--coverage-plateau",
+        type=int,
+        default=None,
+        help="Stop exploring a transaction after this many states without new instruction coverage",
+    )
+    options.add_argument(
+        "--beam-width",
+        type=int,
+        default=None,
+        help="The number of open states the --slither search extends per transaction",
+    )
+    options.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Explore the transactions following the first message call in N worker processes, if all "
+        "modules run during execution (ether_thief, external_calls, suicide)",
+    )
+    options.add_argument(
+        "--batch-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="The number of contracts that --batch or --daemon analyzes at the same time",
+    )
+    options.add_argument(
+        "--batch-timeout",
+        type=int,
+        default=None,
+        help="The amount of seconds after which --batch or --daemon kills the analysis of a contract",
+    )
+    options.add_argument(
+        "--batch-memory-limit",
+        type=int,
+        default=None,
+        help="The amount of megabytes of memory that --batch or --daemon grants the analysis of a contract",
+    )
     options.add_argument("--solc-args", help="Extra arguments for solc")
     options.add_argument(
         "--phrack", action="store_true", help="Phrack-style call graph"
@@ -258,6 +346,9 @@ def main():
         or args.contract_hash_to_address
         or args.slither
         or args.sgraph
+        or args.batch
+        or args.daemon
+        or args.build_signature_pack
     ):
         parser.print_help()
         sys.exit()
@@ -280,6 +371,12 @@ def main():
                 "The --query-signature function requires the python package ethereum-input-decoder",
             )
 
+    if (args.slither or args.sgraph) and args.strategy not in (None, "priority"):
+        exit_with_error(
+            args.outform,
+            "The --slither search needs the priority strategy, not " + args.strategy,
+        )
+
     # -- commands --
     if args.hash:
         print(Mythril.hash_for_function_signature(args.hash))
@@ -297,6 +394,12 @@ def main():
             solc_args=args.solc_args,
             enable_online_lookup=args.query_signature,
         )
+
+        if args.build_signature_pack:
+            count = mythril.build_signature_pack(args.build_signature_pack)
+            print("Wrote {} signatures to {}".format(count, mythril.sigs.pack_path))
+            sys.exit()
+
         if (
             args.dynld
             or not args.no_onchain_storage_access
@@ -337,6 +440,49 @@ def main():
                 )
             sys.exit()
 
+        # Options of all analysis commands
+        analysis_options = dict(
+            strategy=args.strategy,
+            max_depth=args.max_depth,
+            execution_timeout=args.execution_timeout,
+            create_timeout=args.create_timeout,
+            prune_infeasible=args.prune_infeasible,
+            solver_timeout=args.solver_timeout,
+            coverage_plateau=args.coverage_plateau,
+            merge_states=args.merge_states,
+            loop_bound=args.loop_bound or None,
+            symbolic_memory=args.symbolic_memory,
+        )
+        modules = (
+            [m.strip() for m in args.modules.strip().split(",")] if args.modules else []
+        )
+
+        if args.batch:
+            for result in mythril.analyze_batch(
+                args.batch,
+                workers=args.batch_workers,
+                timeout=args.batch_timeout,
+                memory_limit=args.batch_memory_limit,
+                bin_runtime=args.bin_runtime,
+                modules=modules,
+                transaction_count=args.transaction_count,
+                **analysis_options,
+            ):
+                print(json.dumps(result, sort_keys=True), flush=True)
+            sys.exit()
+
+        if args.daemon:
+            mythril.serve_daemon(
+                args.daemon,
+                workers=args.batch_workers,
+                timeout=args.batch_timeout,
+                memory_limit=args.batch_memory_limit,
+                modules=modules,
+                transaction_count=args.transaction_count,
+                **analysis_options,
+            )
+            sys.exit()
+
         # Load / compile input contracts
         address = None
 
@@ -383,17 +529,14 @@ def main():
         elif args.slither:
             start = datetime.datetime.now()
             report = mythril.slither_mythril(
-                    strategy=args.strategy,
-                    address=address,
-                    modules=[m.strip() for m in args.modules.strip().split(",")]
-                    if args.modules
-                    else [],
-                    verbose_report=args.verbose_report,
-                    max_depth=args.max_depth,
-                    execution_timeout=args.execution_timeout,
-                    create_timeout=args.create_timeout,
-                    transaction_count=args.transaction_count,
-                    file=args.solidity_file)
+                address=address,
+                modules=modules,
+                verbose_report=args.verbose_report,
+                transaction_count=args.transaction_count,
+                file=args.solidity_file,
+                beam_width=args.beam_width,
+                **analysis_options,
+            )
 
             outputs = {
                 "json": report.as_json(),
@@ -414,15 +557,12 @@ def main():
             if args.graph:
                 start = datetime.datetime.now()
                 html = mythril.graph_html(
-                    strategy=args.strategy,
                     contract=mythril.contracts[0],
                     address=address,
                     enable_physics=args.enable_physics,
                     phrackify=args.phrack,
-                    max_depth=args.max_depth,
-                    execution_timeout=args.execution_timeout,
-                    create_timeout=args.create_timeout,
-                    transaction_count=args.transaction_count
+                    transaction_count=args.transaction_count,
+                    **analysis_options,
                 )
 
                 try:
@@ -437,15 +577,13 @@ def main():
             elif args.sgraph:
                 start = datetime.datetime.now()
                 html = mythril.slither_graph_html(
-                    strategy=args.strategy,
                     contract=mythril.contracts[0],
                     address=address,
                     enable_physics=args.enable_physics,
                     phrackify=args.phrack,
-                    max_depth=args.max_depth,
-                    execution_timeout=args.execution_timeout,
-                    create_timeout=args.create_timeout,
-                    file=args.solidity_file
+                    file=args.solidity_file,
+                    beam_width=args.beam_width,
+                    **analysis_options,
                 )
 
                 try:
@@ -460,16 +598,12 @@ def main():
             else:
                 try:
                     report = mythril.fire_lasers(
-                        strategy=args.strategy,
                         address=address,
-                        modules=[m.strip() for m in args.modules.strip().split(",")]
-                        if args.modules
-                        else [],
+                        modules=modules,
                         verbose_report=args.verbose_report,
-                        max_depth=args.max_depth,
-                        execution_timeout=args.execution_timeout,
-                        create_timeout=args.create_timeout,
-                        transaction_count=args.transaction_count
+                        transaction_count=args.transaction_count,
+                        workers=args.workers,
+                        **analysis_options,
                     )
                     outputs = {
                         "json": report.as_json(),
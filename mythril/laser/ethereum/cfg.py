@@ -1,8 +1,11 @@
+from itertools import count
+
 from flags import Flags
 from enum import Enum
 from typing import Dict
 
-gbl_next_uid = 0  # node counter
+# Ids of nodes that are created outside of an engine, engines number their nodes through their EngineContext
+_standalone_uids = count()
 
 
 class JumpType(Enum):
@@ -19,7 +22,7 @@ class NodeFlags(Flags):
 
 
 class Node:
-    def __init__(self, contract_name: str, start_addr=0, constraints=None):
+    def __init__(self, contract_name: str, start_addr=0, constraints=None, uid=None):
         constraints = constraints if constraints else []
         self.contract_name = contract_name
         self.start_addr = start_addr
@@ -28,11 +31,7 @@ class Node:
         self.function_name = "unknown"
         self.flags = NodeFlags()
 
-        # Self-assign a unique ID
-        global gbl_next_uid
-
-        self.uid = gbl_next_uid
-        gbl_next_uid += 1
+        self.uid = uid if uid is not None else next(_standalone_uids)
 
     def get_cfg_dict(self) -> Dict:
         code = ""
@@ -0,0 +1,44 @@
+from typing import Tuple
+
+from mythril.laser.ethereum.keccak import KeccakFunctionManager
+from mythril.laser.ethereum.simplification import simplification_cache
+
+
+class EngineContext:
+    """
+    Mutable state of one symbolic execution engine.
+
+    Every LaserEVM owns a context, so that analyses that run one after the other or side by side in the same process
+    do not share keccak results, node ids or transaction ids.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """ Restores the state of a new engine"""
+        self.keccak_function_manager = KeccakFunctionManager()
+        # Function selector pushed by the dispatcher, consumed by the next JUMPI of the heuristic search
+        self.heuristic_selector = None
+        # Whether the jump destination of the fallback function still has to be found
+        self.set_fallback_func = True
+        self.fallback_pointer = 0
+        self._next_node_uid = 0
+        self._next_transaction_id = 0
+        # Hits and misses of the process wide simplification cache when the current run started
+        self.simplification_statistics = simplification_cache.statistics()
+
+    def get_next_node_uid(self) -> int:
+        uid = self._next_node_uid
+        self._next_node_uid += 1
+        return uid
+
+    def get_simplification_statistics(self) -> Tuple[int, int]:
+        """ Hits and misses of the simplification cache since the current run started"""
+        hits, misses = simplification_cache.statistics()
+        start_hits, start_misses = self.simplification_statistics
+        return hits - start_hits, misses - start_misses
+
+    def get_next_transaction_id(self) -> int:
+        self._next_transaction_id += 1
+        return self._next_transaction_id
@@ -0,0 +1,183 @@
+from copy import copy
+from typing import Dict, ItemsView, List, Tuple
+
+from mythril.disassembler.disassembly import Disassembly
+
+
+class InstructionCoverage:
+    """
+    Bitset of the executed instructions of one bytecode, one bit per instruction
+    """
+
+    __slots__ = "size", "_bits"
+
+    def __init__(self, size: int, bits: bytearray = None):
+        """
+        Constructor for InstructionCoverage
+        :param size: Number of instructions of the bytecode
+        :param bits: Packed bits, least significant bit first, all instructions uncovered by default
+        """
+        self.size = size
+        self._bits = bits if bits is not None else bytearray((size + 7) // 8)
+
+    def mark(self, index: int) -> bool:
+        """
+        Marks an instruction as covered
+        :param index: Index of the instruction
+        :return: True if the instruction was not covered before
+        """
+        mask = 1 << (index & 7)
+        byte = self._bits[index >> 3]
+        if byte & mask:
+            return False
+        self._bits[index >> 3] = byte | mask
+        return True
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def is_covered(self, start: int, end: int) -> bool:
+        """ Checks whether all instructions in [start, end) are covered"""
+        if end <= start:
+            return True
+        mask = ((1 << (end - start)) - 1) << (start & 7)
+        window = int.from_bytes(self._bits[start >> 3 : ((end - 1) >> 3) + 1], "little")
+        return window & mask == mask
+
+    def count(self) -> int:
+        """ Gets the number of covered instructions"""
+        return bin(int.from_bytes(self._bits, "little")).count("1")
+
+    def percentage(self) -> float:
+        return self.count() / float(self.size) * 100 if self.size else 0.0
+
+    def merge(self, other: "InstructionCoverage") -> None:
+        """ Adds the instructions covered by other to this bitset"""
+        merged = int.from_bytes(self._bits, "little") | int.from_bytes(
+            other._bits, "little"
+        )
+        self._bits = bytearray(merged.to_bytes(len(self._bits), "little"))
+
+    def __copy__(self) -> "InstructionCoverage":
+        return InstructionCoverage(self.size, bytearray(self._bits))
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, InstructionCoverage)
+            and self.size == other.size
+            and self._bits == other._bits
+        )
+
+    def __repr__(self) -> str:
+        return "<InstructionCoverage {}/{}>".format(self.count(), self.size)
+
+
+class Coverage:
+    """
+    Instruction coverage of a symbolic execution run, one bitset per bytecode.
+
+    Bitsets are found through the Disassembly object of the executing state, so the bytecode string is only hashed
+    the first time a Disassembly is seen. Besides the totals, the instructions that were covered for the first time
+    during the current transaction are recorded as a coverage delta.
+    """
+
+    def __init__(self):
+        self._records = {}
+        # Disassembly -> (bytecode, bitset)
+        self._by_code = {}
+        self._delta = {}
+        # Coverage delta of every finished transaction
+        self.transactions = []
+
+    def mark(self, code: Disassembly, index: int) -> bool:
+        """
+        Marks an instruction as covered
+        :param code: Disassembly of the executed code
+        :param index: Index of the instruction
+        :return: True if the instruction was not covered before
+        """
+        try:
+            bytecode, record = self._by_code[code]
+        except KeyError:
+            bytecode = code.bytecode
+            record = self._get_record(bytecode, len(code.instruction_list))
+            self._by_code[code] = bytecode, record
+
+        if not record.mark(index):
+            return False
+
+        try:
+            delta = self._delta[bytecode]
+        except KeyError:
+            delta = self._delta[bytecode] = InstructionCoverage(record.size)
+        delta.mark(index)
+        return True
+
+    def _get_record(self, bytecode: str, size: int) -> InstructionCoverage:
+        try:
+            return self._records[bytecode]
+        except KeyError:
+            record = self._records[bytecode] = InstructionCoverage(size)
+            return record
+
+    def get(self, bytecode: str) -> InstructionCoverage:
+        """ Gets the coverage of a bytecode, None if none of its instructions was executed"""
+        return self._records.get(bytecode)
+
+    def __getitem__(self, bytecode: str) -> InstructionCoverage:
+        return self._records[bytecode]
+
+    def __contains__(self, bytecode: str) -> bool:
+        return bytecode in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def items(self) -> ItemsView:
+        return self._records.items()
+
+    def total(self) -> int:
+        """ Gets the number of covered instructions over all bytecodes"""
+        return sum(record.count() for record in self._records.values())
+
+    def begin_transaction(self) -> None:
+        """ Starts recording the coverage delta of a new transaction"""
+        self._delta = {}
+
+    def end_transaction(self) -> Dict[str, InstructionCoverage]:
+        """
+        Finishes the coverage delta of the current transaction
+        :return: bytecode -> instructions covered for the first time during the transaction
+        """
+        delta = self._delta
+        self.transactions.append(delta)
+        self._delta = {}
+        return delta
+
+    @property
+    def delta(self) -> Dict[str, InstructionCoverage]:
+        """ Instructions covered for the first time during the current transaction, per bytecode"""
+        return self._delta
+
+    def merge(self, other: "Coverage") -> None:
+        """ Adds the coverage of other, for example recorded by a worker process, to this coverage"""
+        for bytecode, record in other.items():
+            if bytecode in self._records:
+                self._records[bytecode].merge(record)
+            else:
+                self._records[bytecode] = copy(record)
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._by_code.clear()
+        self._delta = {}
+        self.transactions = []
+
+    def __getstate__(self) -> Tuple[Dict, List]:
+        # The Disassembly lookup table is only a cache and is rebuilt on demand
+        return self._records, self.transactions
+
+    def __setstate__(self, state: Tuple[Dict, List]) -> None:
+        self._records, self.transactions = state
+        self._by_code = {}
+        self._delta = {}
@@ -0,0 +1,55 @@
+import logging
+
+from z3 import is_false, is_true
+
+from mythril.laser.ethereum.state.constraints import Constraints
+
+
+class FeasibilityCache:
+    """
+    Per-run cache of path feasibility results.
+
+    Results are keyed on the set of constraints of a path, so states that reach the same constraint set through
+    different forks share a single solver query.
+    """
+
+    def __init__(self, timeout=None):
+        """
+        Constructor for FeasibilityCache
+        :param timeout: time budget per solver query in milliseconds, None uses the solver default
+        """
+        self.timeout = timeout
+        self._results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def is_feasible(self, constraints: Constraints) -> bool:
+        """
+        Checks whether the constraints can be satisfied. Queries that time out are considered feasible.
+        :param constraints: path constraints to check
+        :return: False if the constraints are known to be unsatisfiable, True otherwise
+        """
+        relevant = []
+        for constraint in constraints:
+            if type(constraint) == bool:
+                if not constraint:
+                    return False
+                continue
+            if is_false(constraint):
+                return False
+            if not is_true(constraint):
+                relevant.append(constraint)
+
+        key = frozenset(relevant)
+        try:
+            result = self._results[key]
+            self.hits += 1
+            return result
+        except KeyError:
+            self.misses += 1
+
+        result = constraints.check_possibility(timeout=self.timeout)
+        self._results[key] = result
+        if not result:
+            logging.debug("Pruned infeasible path")
+        return result
@@ -1,15 +1,15 @@
 import binascii
 import logging
 
-from copy import copy, deepcopy
-from typing import Callable, List, Union
+from copy import copy
+from typing import Callable, Dict, List, Tuple, Union
 
 from ethereum import utils
 from z3 import (
     Extract,
     UDiv,
-    simplify,
     Concat,
+    ULE,
     ULT,
     UGT,
     BitVecRef,
@@ -26,12 +26,16 @@ from z3 import (
     If,
     BoolRef,
     Or,
+    ZeroExt,
+    sat,
 )
 
 import mythril.laser.ethereum.natives as natives
 import mythril.laser.ethereum.util as helper
 from mythril.laser.ethereum import util
 from mythril.laser.ethereum.call import get_call_parameters
+from mythril.laser.ethereum.priority import PriorityIndex
+from mythril.laser.ethereum.simplification import simplify
 from mythril.laser.ethereum.evm_exceptions import (
     VmException,
     StackUnderflowException,
@@ -39,8 +43,9 @@ from mythril.laser.ethereum.evm_exceptions import (
     InvalidInstruction,
     OutOfGasException,
 )
+from mythril.disassembler.asm import OPCODE_NAMES
 from mythril.laser.ethereum.gas import OPCODE_GAS
-from mythril.laser.ethereum.keccak import KeccakFunctionManager
+from mythril.laser.ethereum.context import EngineContext
 from mythril.laser.ethereum.state.calldata import CalldataType
 from mythril.laser.ethereum.state.global_state import GlobalState
 from mythril.laser.ethereum.transaction import (
@@ -54,14 +59,13 @@ from mythril.analysis.solver import get_model
 TT256 = 2 ** 256
 TT256M1 = 2 ** 256 - 1
 
-keccak_function_manager = KeccakFunctionManager()
-
 
 class StateTransition(object):
     """Decorator that handles global state copy and original return.
 
     This decorator calls the decorated instruction mutator function on a copy of the state that
-    is passed to it. After the call, the resulting new states' program counter is automatically
+    is passed to it. The copy is copy-on-write: memory, constraints and the world state stay shared with
+    the original until the instruction accesses them. After the call, the resulting new states' program counter is automatically
     incremented if `increment_pc=True`.
     """
 
@@ -97,11 +101,10 @@ class StateTransition(object):
         ):
             raise OutOfGasException()
 
-    def accumulate_gas(self, global_state: GlobalState):
+    def accumulate_gas(self, func_obj: "Instruction", global_state: GlobalState):
         if not self.enable_gas:
             return global_state
-        opcode = global_state.instruction["opcode"]
-        min_gas, max_gas = OPCODE_GAS[opcode]
+        min_gas, max_gas = OPCODE_TABLE[func_obj.op_code][2]
         global_state.mstate.min_gas_used += min_gas
         global_state.mstate.max_gas_used += max_gas
         return global_state
@@ -112,18 +115,13 @@ class StateTransition(object):
         ) -> List[GlobalState]:
             new_global_states = self.call_on_state_copy(func, func_obj, global_state)
             new_global_states = [
-                self.accumulate_gas(state) for state in new_global_states
+                self.accumulate_gas(func_obj, state) for state in new_global_states
             ]
             return self.increment_states_pc(new_global_states)
 
         return wrapper
 
 
-heuristic_branching = False
-set_fallback_func = True
-fallback_pointer = 0
-
-
 class Instruction:
     """
     Instruction class is used to mutate a state according to the current instruction
@@ -135,32 +133,26 @@ class Instruction:
         self.priority = priority
         self.title = title
         self.laser_obj = laser_obj
+        self.context = laser_obj.context if laser_obj is not None else EngineContext()
+        self.priority_index = (
+            PriorityIndex(priority)
+            if priority is not None and self.op_code == "JUMPI"
+            else None
+        )
 
 
     def evaluate(self, global_state: GlobalState, post=False) -> List[GlobalState]:
         """ Performs the mutation for this instruction """
-        # Generalize some ops
-        # logging.debug("Evaluating {}".format(self.op_code))
-        op = self.op_code.lower()
-        if self.op_code.startswith("PUSH"):
-            op = "push"
-        elif self.op_code.startswith("DUP"):
-            op = "dup"
-        elif self.op_code.startswith("SWAP"):
-            op = "swap"
-        elif self.op_code.startswith("LOG"):
-            op = "log"
-
-        instruction_mutator = (
-            getattr(self, op + "_", None)
-            if not post
-            else getattr(self, op + "_" + "post", None)
-        )
+        try:
+            mutator, post_mutator, _ = OPCODE_TABLE[self.op_code]
+        except KeyError:
+            raise NotImplementedError
 
+        instruction_mutator = post_mutator if post else mutator
         if instruction_mutator is None:
             raise NotImplementedError
 
-        return instruction_mutator(global_state)
+        return instruction_mutator(self, global_state)
 
     @StateTransition()
     def jumpdest_(self, global_state: GlobalState) -> List[GlobalState]:
@@ -169,26 +161,20 @@ class Instruction:
 
     @StateTransition()
     def push_(self, global_state: GlobalState) -> List[GlobalState]:
-        push_instruction = global_state.get_current_instruction()
-        push_value = push_instruction["argument"][2:]
-
-        try:
-            length_of_value = 2 * int(push_instruction["opcode"][4:])
-        except ValueError:
+        instruction_list = global_state.environment.code.instruction_list
+        push_value = instruction_list.push_values[global_state.mstate.pc]
+        if push_value is None:
             raise VmException("Invalid Push instruction")
 
-        push_value += "0" * max(length_of_value - len(push_value), 0)
-
-        global_state.mstate.stack.append(BitVecVal(int(push_value, 16), 256))
+        global_state.mstate.stack.append(BitVecVal(push_value, 256))
 
         disassembly = global_state.environment.code.func_hashes
-        push_value_str = '0x' + str(push_value)
 
         # starting from second msg.transaction, enable heuristic search
-        if len(global_state.world_state.transaction_sequence) > 2 and self.priority is not None and str(push_instruction['opcode']) == 'PUSH4':
+        if self.priority is not None and instruction_list.opcode_name(global_state.mstate.pc) == 'PUSH4' and len(global_state.world_state.transaction_sequence) > 2:
+            push_value_str = "0x{:08x}".format(push_value)
             if push_value_str in disassembly:
-                global heuristic_branching
-                heuristic_branching = True
+                self.context.heuristic_selector = push_value
                 return [global_state]
         return [global_state]
 
@@ -521,16 +507,19 @@ class Instruction:
             size_sym = True
 
         if size_sym:
-            state.mem_extend(mstart, 1)
-            state.memory[mstart] = global_state.new_bitvec(
-                "calldata_"
-                + str(environment.active_account.contract_name)
-                + "["
-                + str(dstart)
-                + ": + "
-                + str(size)
-                + "]",
-                256,
+            state.mem_extend(mstart, 32)
+            state.writable_memory().write_word_at(
+                mstart,
+                global_state.new_bitvec(
+                    "calldata_"
+                    + str(environment.active_account.contract_name)
+                    + "["
+                    + str(dstart)
+                    + ": + "
+                    + str(size)
+                    + "]",
+                    256,
+                ),
             )
             return [global_state]
 
@@ -544,16 +533,19 @@ class Instruction:
                     + ", size = "
                     + str(size)
                 )
-                state.mem_extend(mstart, 1)
-                state.memory[mstart] = global_state.new_bitvec(
-                    "calldata_"
-                    + str(environment.active_account.contract_name)
-                    + "["
-                    + str(dstart)
-                    + ": + "
-                    + str(size)
-                    + "]",
-                    256,
+                state.mem_extend(mstart, 32)
+                state.writable_memory().write_word_at(
+                    mstart,
+                    global_state.new_bitvec(
+                        "calldata_"
+                        + str(environment.active_account.contract_name)
+                        + "["
+                        + str(dstart)
+                        + ": + "
+                        + str(size)
+                        + "]",
+                        256,
+                    ),
                 )
                 return [global_state]
 
@@ -568,20 +560,24 @@ class Instruction:
                         i_data + 1 if isinstance(i_data, int) else simplify(i_data + 1)
                     )
                 for i in range(len(new_memory)):
-                    state.memory[i + mstart] = new_memory[i]
+                    state.writable_memory()[i + mstart] = new_memory[i]
 
             except IndexError:
                 logging.debug("Exception copying calldata to memory")
 
-                state.memory[mstart] = global_state.new_bitvec(
-                    "calldata_"
-                    + str(environment.active_account.contract_name)
-                    + "["
-                    + str(dstart)
-                    + ": + "
-                    + str(size)
-                    + "]",
-                    256,
+                state.mem_extend(mstart, 32)
+                state.writable_memory().write_word_at(
+                    mstart,
+                    global_state.new_bitvec(
+                        "calldata_"
+                        + str(environment.active_account.contract_name)
+                        + "["
+                        + str(dstart)
+                        + ": + "
+                        + str(size)
+                        + "]",
+                        256,
+                    ),
                 )
         return [global_state]
 
@@ -624,7 +620,7 @@ class Instruction:
 
     @StateTransition(enable_gas=False)
     def sha3_(self, global_state: GlobalState) -> List[GlobalState]:
-        global keccak_function_manager
+        keccak_function_manager = self.context.keccak_function_manager
 
         state = global_state.mstate
         op0, op1 = state.stack.pop(), state.stack.pop()
@@ -655,10 +651,18 @@ class Instruction:
             )
 
         except TypeError:
-            argument = str(state.memory[index]).replace(" ", "_")
-
-            result = BitVec("KECCAC[{}]".format(argument), 256)
-            keccak_function_manager.add_keccak(result, state.memory[index])
+            # Mapping slots hash the key followed by the slot of the mapping, so all words are part of the argument
+            end = index + (length if length % 32 == 0 else 32)
+            words = []
+            for i in range(index, end, 32):
+                word = state.memory.get_word_at(i)
+                words.append(BitVecVal(word, 256) if isinstance(word, int) else word)
+            name = "_".join(str(word) for word in words).replace(" ", "_")
+
+            result = BitVec("KECCAC[{}]".format(name), 256)
+            keccak_function_manager.add_keccak(
+                result, Concat(words) if len(words) > 1 else words[0]
+            )
             state.stack.append(result)
             return [global_state]
 
@@ -693,14 +697,15 @@ class Instruction:
 
         except TypeError:
             # except both attribute error and Exception
-            global_state.mstate.mem_extend(concrete_memory_offset, 1)
-            global_state.mstate.memory[
-                concrete_memory_offset
-            ] = global_state.new_bitvec(
-                "code({})".format(
-                    global_state.environment.active_account.contract_name
+            global_state.mstate.mem_extend(concrete_memory_offset, 32)
+            global_state.mstate.writable_memory().write_word_at(
+                concrete_memory_offset,
+                global_state.new_bitvec(
+                    "code({})".format(
+                        global_state.environment.active_account.contract_name
+                    ),
+                    256,
                 ),
-                256,
             )
             return [global_state]
 
@@ -710,7 +715,7 @@ class Instruction:
             logging.debug("Unsupported symbolic code offset in CODECOPY")
             global_state.mstate.mem_extend(concrete_memory_offset, size)
             for i in range(size):
-                global_state.mstate.memory[
+                global_state.mstate.writable_memory()[
                     concrete_memory_offset + i
                 ] = global_state.new_bitvec(
                     "code({})".format(
@@ -726,20 +731,21 @@ class Instruction:
             global_state.current_transaction, ContractCreationTransaction
         ):
             if concrete_code_offset >= len(bytecode) // 2:
-                global_state.mstate.mem_extend(concrete_memory_offset, 1)
-                global_state.mstate.memory[
-                    concrete_memory_offset
-                ] = global_state.new_bitvec(
-                    "code({})".format(
-                        global_state.environment.active_account.contract_name
+                global_state.mstate.mem_extend(concrete_memory_offset, 32)
+                global_state.mstate.writable_memory().write_word_at(
+                    concrete_memory_offset,
+                    global_state.new_bitvec(
+                        "code({})".format(
+                            global_state.environment.active_account.contract_name
+                        ),
+                        256,
                     ),
-                    256,
                 )
                 return [global_state]
 
         for i in range(size):
             if 2 * (concrete_code_offset + i + 1) <= len(bytecode):
-                global_state.mstate.memory[concrete_memory_offset + i] = int(
+                global_state.mstate.writable_memory()[concrete_memory_offset + i] = int(
                     bytecode[
                         2
                         * (concrete_code_offset + i) : 2
@@ -748,7 +754,7 @@ class Instruction:
                     16,
                 )
             else:
-                global_state.mstate.memory[
+                global_state.mstate.writable_memory()[
                     concrete_memory_offset + i
                 ] = global_state.new_bitvec(
                     "code({})".format(
@@ -843,19 +849,18 @@ class Instruction:
 
         logging.debug("MLOAD[" + str(op0) + "]")
 
-        try:
-            offset = util.get_concrete_int(op0)
-        except TypeError:
+        offset = self._get_memory_offset(global_state, op0)
+        if offset is None:
             logging.debug("Can't MLOAD from symbolic index")
             data = global_state.new_bitvec("mem[" + str(simplify(op0)) + "]", 256)
             state.stack.append(data)
             return [global_state]
-        try:
-            state.mem_extend(offset, 32)
-            data = util.concrete_int_from_bytes(state.memory, offset)
-        except TypeError:  # Symbolic memory
-            # TODO: Handle this properly
-            data = state.memory[offset]
+        if not isinstance(offset, int):
+            self._mem_extend_symbolic(global_state, offset, 32)
+            state.stack.append(state.memory.get_word_at(offset))
+            return [global_state]
+        state.mem_extend(offset, 32)
+        data = state.memory.get_word_at(offset)
 
         logging.debug("Load from memory[" + str(offset) + "]: " + str(data))
 
@@ -867,11 +872,14 @@ class Instruction:
         state = global_state.mstate
         op0, value = state.stack.pop(), state.stack.pop()
 
-        try:
-            mstart = util.get_concrete_int(op0)
-        except TypeError:
+        mstart = self._get_memory_offset(global_state, op0)
+        if mstart is None:
             logging.debug("MSTORE to symbolic index. Not supported")
             return [global_state]
+        if not isinstance(mstart, int):
+            self._mem_extend_symbolic(global_state, mstart, 32)
+            state.writable_memory().write_word_at(mstart, value)
+            return [global_state]
 
         try:
             state.mem_extend(mstart, 32)
@@ -882,16 +890,7 @@ class Instruction:
 
         logging.debug("MSTORE to mem[" + str(mstart) + "]: " + str(value))
 
-        try:
-            # Attempt to concretize value
-            _bytes = util.concrete_int_to_bytes(value)
-            assert len(_bytes) == 32
-            state.memory[mstart : mstart + 32] = _bytes
-        except:
-            try:
-                state.memory[mstart] = value
-            except TypeError:
-                logging.debug("Invalid memory access")
+        state.writable_memory().write_word_at(mstart, value)
 
         return [global_state]
 
@@ -900,20 +899,23 @@ class Instruction:
         state = global_state.mstate
         op0, value = state.stack.pop(), state.stack.pop()
 
-        try:
-            offset = util.get_concrete_int(op0)
-        except TypeError:
+        offset = self._get_memory_offset(global_state, op0)
+        if offset is None:
             logging.debug("MSTORE to symbolic index. Not supported")
             return [global_state]
+        if not isinstance(offset, int):
+            self._mem_extend_symbolic(global_state, offset, 1)
+            state.writable_memory().write_byte_at(offset, value)
+            return [global_state]
 
         state.mem_extend(offset, 1)
 
-        state.memory[offset] = value % 256
+        state.writable_memory()[offset] = value % 256
         return [global_state]
 
     @StateTransition()
     def sload_(self, global_state: GlobalState) -> List[GlobalState]:
-        global keccak_function_manager
+        keccak_function_manager = self.context.keccak_function_manager
 
         state = global_state.mstate
         index = state.stack.pop()
@@ -927,15 +929,14 @@ class Instruction:
             if not keccak_function_manager.is_keccak(index):
                 return self._sload_helper(global_state, str(index))
 
-            storage_keys = global_state.environment.active_account.storage.keys()
-            keccak_keys = list(filter(keccak_function_manager.is_keccak, storage_keys))
+            keccak_keys = self._get_keccak_keys(global_state, index)
 
             results = []
             constraints = []
 
+            index_argument = keccak_function_manager.get_argument(index)
             for keccak_key in keccak_keys:
                 key_argument = keccak_function_manager.get_argument(keccak_key)
-                index_argument = keccak_function_manager.get_argument(index)
                 constraints.append((keccak_key, key_argument == index_argument))
 
             for (keccak_key, constraint) in constraints:
@@ -953,6 +954,9 @@ class Instruction:
             if len(results) > 0:
                 return results
 
+            keccak_function_manager.add_storage_key(
+                global_state.environment.active_account.address, index
+            )
             return self._sload_helper(global_state, str(index))
 
         return global_state_copy
@@ -968,14 +972,28 @@ class Instruction:
             global_state.environment.active_account.storage[index] = data
 
         if constraints is not None:
-            global_state.mstate.constraints += constraints
+            global_state.mstate.writable_constraints().extend(constraints)
 
         global_state.mstate.stack.append(data)
         return [global_state]
 
-    @staticmethod
-    def _get_constraints(keccak_keys, this_key, argument):
-        global keccak_function_manager
+    def _get_keccak_keys(
+        self, global_state: GlobalState, index: ExprRef
+    ) -> List[str]:
+        """
+        Gets the keccak results in the storage of the active account that can hold the same slot as index
+        :param global_state: State that accesses the storage
+        :param index: Keccak result that is used as storage index
+        :return: Storage keys of the compatible results
+        """
+        account = global_state.environment.active_account
+        keys = self.context.keccak_function_manager.get_storage_keys(
+            account.address, index
+        )
+        return [key for key in keys if key in account.storage]
+
+    def _get_constraints(self, keccak_keys, this_key, argument):
+        keccak_function_manager = self.context.keccak_function_manager
         for keccak_key in keccak_keys:
             if keccak_key == this_key:
                 continue
@@ -984,7 +1002,7 @@ class Instruction:
 
     @StateTransition()
     def sstore_(self, global_state: GlobalState) -> List[GlobalState]:
-        global keccak_function_manager
+        keccak_function_manager = self.context.keccak_function_manager
         state = global_state.mstate
         index, value = state.stack.pop(), state.stack.pop()
         logging.debug("Write to storage[" + str(index) + "]")
@@ -997,15 +1015,14 @@ class Instruction:
             if not is_keccak:
                 return self._sstore_helper(global_state, str(index), value)
 
-            storage_keys = global_state.environment.active_account.storage.keys()
-            keccak_keys = filter(keccak_function_manager.is_keccak, storage_keys)
+            keccak_keys = self._get_keccak_keys(global_state, index)
 
             results = []
             new = False
 
+            index_argument = keccak_function_manager.get_argument(index)
             for keccak_key in keccak_keys:
                 key_argument = keccak_function_manager.get_argument(keccak_key)
-                index_argument = keccak_function_manager.get_argument(index)
 
                 if is_true(simplify(key_argument == index_argument)):
                     return self._sstore_helper(
@@ -1028,6 +1045,10 @@ class Instruction:
                 results += self._sstore_helper(
                     self.copy_helper(global_state), str(index), value, new
                 )
+            keccak_function_manager.add_storage_key(
+                global_state.environment.active_account.address, index
+            )
+            if len(results) > 0:
                 return results
 
             return self._sstore_helper(global_state, str(index), value)
@@ -1035,10 +1056,10 @@ class Instruction:
     @staticmethod
     def _sstore_helper(global_state, index, value, constraint=None):
         try:
-            global_state.environment.active_account = deepcopy(
+            global_state.environment.active_account = copy(
                 global_state.environment.active_account
             )
-            global_state.accounts[
+            global_state.writable_world_state().accounts[
                 global_state.environment.active_account.address
             ] = global_state.environment.active_account
 
@@ -1049,7 +1070,7 @@ class Instruction:
             logging.debug("Error writing to storage: Invalid index")
 
         if constraint is not None:
-            global_state.mstate.constraints.append(constraint)
+            global_state.mstate.writable_constraints().append(constraint)
 
         return [global_state]
 
@@ -1064,19 +1085,20 @@ class Instruction:
         except IndexError:
             raise StackUnderflowException()
 
-        index = util.get_instruction_index(disassembly.instruction_list, jump_addr)
+        index = disassembly.get_instruction_index(jump_addr)
         if index is None:
             raise InvalidJumpDestination("JUMP to invalid address")
 
-        op_code = disassembly.instruction_list[index]["opcode"]
-
-        if op_code != "JUMPDEST":
+        if not disassembly.is_jumpdest(index):
             raise InvalidJumpDestination(
                 "Skipping JUMP to invalid destination (not JUMPDEST): " + str(jump_addr)
             )
 
 
         new_state = self.copy_helper(global_state)
+        if self._exceeds_loop_bound(new_state, index):
+            return []
+
         # add JUMP gas cost
         min_gas, max_gas = OPCODE_GAS["JUMP"]
         new_state.mstate.min_gas_used += min_gas
@@ -1084,8 +1106,8 @@ class Instruction:
 
         # manually set PC to destination
 
+        self._increase_depth(new_state, index)
         new_state.mstate.pc = index
-        new_state.mstate.depth += 1
 
         return [new_state]
 
@@ -1093,26 +1115,27 @@ class Instruction:
     def _true_branch(self, condition, global_state, jump_addr, disassembly):
         # Get jump destination
         min_gas, max_gas = OPCODE_GAS["JUMPI"]
-        index = util.get_instruction_index(disassembly.instruction_list, jump_addr)
+        index = disassembly.get_instruction_index(jump_addr)
         if not index:
             logging.debug("Invalid jump destination: " + str(jump_addr))
             return
 
-        instr = disassembly.instruction_list[index]
-
         condi = simplify(condition) if type(condition) == BoolRef else condition != 0
-        if instr["opcode"] == "JUMPDEST":
+        if disassembly.is_jumpdest(index):
             if (type(condi) == bool and condi) or (
                         type(condi) == BoolRef and not is_false(condi)
             ):
                 new_state = self.copy_helper(global_state)
+                if self._exceeds_loop_bound(new_state, index):
+                    return
                 new_state.mstate.min_gas_used += min_gas
                 new_state.mstate.max_gas_used += max_gas
 
+                self._increase_depth(new_state, index)
                 new_state.mstate.pc = index
-                new_state.mstate.depth += 1
-                new_state.mstate.constraints.append(condi)
-                return new_state
+                new_state.mstate.writable_constraints().append(condi)
+                if self._is_feasible(new_state, condi):
+                    return new_state
             else:
                 logging.debug("Pruned unreachable states.")
 
@@ -1130,14 +1153,112 @@ class Instruction:
             new_state.mstate.min_gas_used += min_gas
             new_state.mstate.max_gas_used += max_gas
 
-            new_state.mstate.depth += 1
+            self._increase_depth(new_state, new_state.mstate.pc + 1)
             new_state.mstate.pc += 1
-            new_state.mstate.constraints.append(negated)
-            # states.append(new_state)
-            return new_state
+            new_state.mstate.writable_constraints().append(negated)
+            if self._is_feasible(new_state, negated):
+                return new_state
         else:
             logging.debug("Pruned unreachable states.")
 
+    def _get_memory_offset(
+        self, global_state: GlobalState, offset: Union[int, BitVecRef]
+    ) -> Union[int, BitVecRef, None]:
+        """
+        Gets the offset of a memory access. With symbolic memory, a symbolic offset that the path constraints fix to
+        a single value is concretized, so that the access can use the memory pages.
+        :param global_state: State that accesses the memory
+        :param offset: Offset operand of the instruction
+        :return: The concrete offset, the symbolic offset if symbolic memory is enabled, None otherwise
+        """
+        try:
+            return util.get_concrete_int(offset)
+        except TypeError:
+            pass
+        if self.laser_obj is None or not self.laser_obj.symbolic_memory:
+            return None
+
+        constraints = global_state.mstate.constraints
+        if constraints.solver.check(constraints) != sat:
+            return offset
+        value = constraints.solver.model().eval(offset, model_completion=True)
+        if not constraints.check_possibility([offset != value]):
+            logging.debug("Memory offset %s is fixed to %s", offset, value)
+            return value.as_long()
+        return offset
+
+    @staticmethod
+    def _mem_extend_symbolic(
+        global_state: GlobalState, offset: BitVecRef, size: int
+    ) -> None:
+        """
+        Extends the memory for an access at a symbolic offset. The memory is not extended if the access can lie within
+        the current memory, otherwise memory size and gas follow the offset that the model of the path constraints
+        gives.
+        :param global_state: State that accesses the memory
+        :param offset: Symbolic offset of the access
+        :param size: Number of bytes accessed
+        """
+        mstate = global_state.mstate
+        constraints = mstate.constraints
+        end = ZeroExt(1, offset) + size
+        if constraints.solver.check(constraints, [ULE(end, mstate.memory_size)]) == sat:
+            return
+        if constraints.solver.check(constraints) != sat:
+            return
+        value = constraints.solver.model().eval(offset, model_completion=True)
+        mstate.mem_extend(value.as_long(), size)
+
+    def _exceeds_loop_bound(self, global_state: GlobalState, index: int) -> bool:
+        """
+        Counts the iterations of loops, which are closed by backward jumps
+        :param global_state: State that is about to jump
+        :param index: Instruction index of the jump destination
+        :return: True if the jump exceeds the loop bound, in which case the state should be dropped
+        """
+        loop_bound = None if self.laser_obj is None else self.laser_obj.loop_bound
+        mstate = global_state.mstate
+        if loop_bound is None or index > mstate.pc:
+            return False
+
+        jump = (mstate.pc, index)
+        iterations = mstate.loop_counts.get(jump, 0) + 1
+        if iterations > loop_bound:
+            logging.debug("Loop bound reached at instruction %d", mstate.pc)
+            return True
+
+        loop_counts = dict(mstate.loop_counts)
+        loop_counts[jump] = iterations
+        mstate.loop_counts = loop_counts
+        return False
+
+    def _increase_depth(self, global_state: GlobalState, index: int) -> None:
+        """
+        Counts a jump towards the depth limit. With a loop bound, loops are already limited by their iteration count,
+        so only backward jumps are counted and straight-line code is not cut off by the depth limit
+        :param global_state: State that is about to jump
+        :param index: Instruction index of the jump destination
+        """
+        loop_bound = None if self.laser_obj is None else self.laser_obj.loop_bound
+        if loop_bound is not None and index > global_state.mstate.pc:
+            return
+        global_state.mstate.depth += 1
+
+    def _is_feasible(self, global_state: GlobalState, condition) -> bool:
+        """
+        Checks whether a state forked at a JUMPI can be reached, if feasibility pruning is enabled
+        :param global_state: The forked state, including the branch condition in its constraints
+        :param condition: The branch condition
+        :return: False if the path constraints of the state are unsatisfiable
+        """
+        if self.laser_obj is None or self.laser_obj.feasibility_cache is None:
+            return True
+        if type(condition) == bool or is_true(condition):
+            return True
+        return self.laser_obj.feasibility_cache.is_feasible(
+            global_state.mstate.constraints
+        )
+
     @StateTransition(increment_pc=False,  enable_gas=False)
     def jumpi_(self, global_state: GlobalState) -> List[GlobalState]:
         state = global_state.mstate
@@ -1151,13 +1272,11 @@ class Instruction:
             jump_addr = util.get_concrete_int(op0)
 
             # set fall back pointer to handle fallback function
-            global set_fallback_func
             # if fall back func is not set yet
-            if set_fallback_func:
+            if self.context.set_fallback_func:
                 if 'Not(ULE(4,calldatasize))' in str(condition):
-                    global fallback_pointer
-                    fallback_pointer = jump_addr
-                    set_fallback_func = False
+                    self.context.fallback_pointer = jump_addr
+                    self.context.set_fallback_func = False
 
         except TypeError:
             logging.debug("Skipping JUMPI to invalid destination.")
@@ -1166,71 +1285,46 @@ class Instruction:
             global_state.mstate.max_gas_used += max_gas
             return [global_state]
 
-        global heuristic_branching
-
         # normal case or heuristic branching case
         # if it is the second msg call transcation,
         # heuristic branching enabled by push4,
         # and ranking is not done
         if self.priority is not None and len(
-            global_state.world_state.transaction_sequence) > 2 and heuristic_branching and \
+            global_state.world_state.transaction_sequence) > 2 and self.context.heuristic_selector is not None and \
                 self.title is not None:
-            next_explores = self.priority[self.title]
+            titles = self.priority_index.get_titles(
+                global_state.last_function_called, self.context.heuristic_selector
+            )
 
-            #TODO: Some testing required
-            if next_explores is None:
-                return
+            # if the current function pair is in the current priority level, return both branches
+            if self.title in titles:
+                true_state = self._true_branch(condition, global_state, jump_addr, disassembly)
+                false_state = self._false_branch(condition, global_state)
+                states += [state for state in (false_state, true_state) if state is not None]
 
-            # for all the tuple in the current priority level
-            # check if the current function signature is in the current priority list
-            # if it is return both branches
-            # then remove the tuple from the priority list
-            for obj in next_explores:
-                hash = int(obj.second.function_hash,16)
-                func = obj.first.function_name
-                if func == global_state.last_function_called and str(hash) in str(condition):
-                    true_state = self._true_branch(condition, global_state, jump_addr, disassembly)
-                    false_state = self._false_branch(condition, global_state)
-                    states.append(false_state)
-                    states.append(true_state)
-                    #self.priority[self.title].remove(obj)
-
-                    heuristic_branching = False
-                    del global_state
-                    return states
+                self.context.heuristic_selector = None
+                del global_state
+                return states
 
             false_state = self._false_branch(condition, global_state)
 
-            # check following priority, and append them to lower order work list accordingly
-            # this is because a decision point can be a start point in the lower priority order
-            # in this case, return false branch to current work list. return true branch to lower prepare list
-            glb_func_called = global_state.last_function_called
-            if glb_func_called is not None:
-                for key, value in self.priority.items():
-                    for obj1 in value:
-                        second_func_hash = int(obj1.second.function_hash, 16)
-                        if glb_func_called == obj1.first.function_name and str(second_func_hash) in str(condition):
-                            true_state1 = self._true_branch(condition, global_state, jump_addr, disassembly)
-                            if key == 'RAW':
-                                self.laser_obj.first_work_list.append(true_state1)
-                            elif key == 'WAR':
-                                self.laser_obj.second_work_list.append(true_state1)
-                            elif key == 'WAW':
-                                self.laser_obj.third_work_list.append(true_state1)
-                            elif key == 'RAR':
-                                self.laser_obj.forth_work_list.append(true_state1)
-
-                            # true branch will be removed from the work list.
-                            # TODO: Refactor this part
-                            states.append(false_state)
-                            states.append(true_state1)
-                            heuristic_branching = False
-                            self.laser_obj.bad_bit = True
-                            del global_state
-                            return states
-
-            states.append(false_state)
-            heuristic_branching = False
+            # check following priority, the branch can be a start point in a lower priority order.
+            # in this case, return the false branch as usual and defer the true branch: the search strategy
+            # only executes it after the states of the current priority order
+            if titles:
+                true_state1 = self._true_branch(condition, global_state, jump_addr, disassembly)
+                if true_state1 is not None:
+                    true_state1.dependency_kind = titles[0]
+                    if false_state is not None:
+                        states.append(false_state)
+                    states.append(true_state1)
+                    self.context.heuristic_selector = None
+                    del global_state
+                    return states
+
+            if false_state is not None:
+                states.append(false_state)
+            self.context.heuristic_selector = None
             del global_state
             return states
 
@@ -1238,15 +1332,13 @@ class Instruction:
         else:
             # True case
             # Get jump destination
-            index = util.get_instruction_index(disassembly.instruction_list, jump_addr)
+            index = disassembly.get_instruction_index(jump_addr)
             if not index:
                 logging.debug("Invalid jump destination: " + str(jump_addr))
                 return states
 
-            instr = disassembly.instruction_list[index]
-
             condi = simplify(condition) if type(condition) == BoolRef else condition != 0
-            if instr["opcode"] == "JUMPDEST":
+            if disassembly.is_jumpdest(index):
                 if (type(condi) == bool and condi) or (
                             type(condi) == BoolRef and not is_false(condi)
                 ):
@@ -1257,10 +1349,12 @@ class Instruction:
                     new_state.mstate.min_gas_used += min_gas
                     new_state.mstate.max_gas_used += max_gas
 
-                    new_state.mstate.pc = index
-                    new_state.mstate.depth += 1
-                    new_state.mstate.constraints.append(condi)
-                    states.append(new_state)
+                    if not self._exceeds_loop_bound(new_state, index):
+                        self._increase_depth(new_state, index)
+                        new_state.mstate.pc = index
+                        new_state.mstate.writable_constraints().append(condi)
+                        if self._is_feasible(new_state, condi):
+                            states.append(new_state)
                 else:
                     logging.debug("Pruned unreachable states.")
 
@@ -1280,10 +1374,11 @@ class Instruction:
 
                 # manually set PC to destination
 
-                new_state.mstate.depth += 1
+                self._increase_depth(new_state, new_state.mstate.pc + 1)
                 new_state.mstate.pc += 1
-                new_state.mstate.constraints.append(negated)
-                states.append(new_state)
+                new_state.mstate.writable_constraints().append(negated)
+                if self._is_feasible(new_state, negated):
+                    states.append(new_state)
             else:
                 logging.debug("Pruned unreachable states.")
 
@@ -1349,20 +1444,20 @@ class Instruction:
             target = "0x" + hex(target.as_long())[-40:]
         if isinstance(target, str):
             try:
-                global_state.world_state[
+                global_state.writable_world_state()[
                     target
                 ].balance += global_state.environment.active_account.balance
             except KeyError:
-                global_state.world_state.create_account(
+                global_state.writable_world_state().create_account(
                     address=target,
                     balance=global_state.environment.active_account.balance,
                 )
                 account_created = True
 
-        global_state.environment.active_account = deepcopy(
+        global_state.environment.active_account = copy(
             global_state.environment.active_account
         )
-        global_state.accounts[
+        global_state.writable_world_state().accounts[
             global_state.environment.active_account.address
         ] = global_state.environment.active_account
 
@@ -1449,7 +1544,7 @@ class Instruction:
                 data = natives.native_contracts(call_address_int, call_data)
             except natives.NativeContractException:
                 for i in range(mem_out_sz):
-                    global_state.mstate.memory[
+                    global_state.mstate.writable_memory()[
                         mem_out_start + i
                     ] = global_state.new_bitvec(
                         contract_list[call_address_int - 1]
@@ -1463,13 +1558,14 @@ class Instruction:
             for i in range(
                 min(len(data), mem_out_sz)
             ):  # If more data is used then it's chopped off
-                global_state.mstate.memory[mem_out_start + i] = data[i]
+                global_state.mstate.writable_memory()[mem_out_start + i] = data[i]
 
             # TODO: maybe use BitVec here constrained to 1
             return [global_state]
 
         transaction = MessageCallTransaction(
-            world_state=global_state.world_state,
+            world_state=global_state.writable_world_state(),
+            identifier=self.context.get_next_transaction_id(),
             gas_price=environment.gasprice,
             gas_limit=gas,
             origin=environment.origin,
@@ -1506,7 +1602,7 @@ class Instruction:
                 "retval_" + str(instr["address"]), 256
             )
             global_state.mstate.stack.append(return_value)
-            global_state.mstate.constraints.append(return_value == 0)
+            global_state.mstate.writable_constraints().append(return_value == 0)
 
             return [global_state]
 
@@ -1532,14 +1628,14 @@ class Instruction:
             memory_out_offset, min(memory_out_size, len(global_state.last_return_data))
         )
         for i in range(min(memory_out_size, len(global_state.last_return_data))):
-            global_state.mstate.memory[
+            global_state.mstate.writable_memory()[
                 i + memory_out_offset
             ] = global_state.last_return_data[i]
 
         # Put return value on stack
         return_value = global_state.new_bitvec("retval_" + str(instr["address"]), 256)
         global_state.mstate.stack.append(return_value)
-        global_state.mstate.constraints.append(return_value == 1)
+        global_state.mstate.writable_constraints().append(return_value == 1)
 
         return [global_state]
 
@@ -1564,7 +1660,8 @@ class Instruction:
             return [global_state]
 
         transaction = MessageCallTransaction(
-            world_state=global_state.world_state,
+            world_state=global_state.writable_world_state(),
+            identifier=self.context.get_next_transaction_id(),
             gas_price=environment.gasprice,
             gas_limit=gas,
             origin=environment.origin,
@@ -1602,7 +1699,7 @@ class Instruction:
                 "retval_" + str(instr["address"]), 256
             )
             global_state.mstate.stack.append(return_value)
-            global_state.mstate.constraints.append(return_value == 0)
+            global_state.mstate.writable_constraints().append(return_value == 0)
             return [global_state]
 
         try:
@@ -1627,14 +1724,14 @@ class Instruction:
             memory_out_offset, min(memory_out_size, len(global_state.last_return_data))
         )
         for i in range(min(memory_out_size, len(global_state.last_return_data))):
-            global_state.mstate.memory[
+            global_state.mstate.writable_memory()[
                 i + memory_out_offset
             ] = global_state.last_return_data[i]
 
         # Put return value on stack
         return_value = global_state.new_bitvec("retval_" + str(instr["address"]), 256)
         global_state.mstate.stack.append(return_value)
-        global_state.mstate.constraints.append(return_value == 1)
+        global_state.mstate.writable_constraints().append(return_value == 1)
         return [global_state]
 
     @StateTransition()
@@ -1658,7 +1755,8 @@ class Instruction:
             return [global_state]
 
         transaction = MessageCallTransaction(
-            world_state=global_state.world_state,
+            world_state=global_state.writable_world_state(),
+            identifier=self.context.get_next_transaction_id(),
             gas_price=environment.gasprice,
             gas_limit=gas,
             origin=environment.origin,
@@ -1696,7 +1794,7 @@ class Instruction:
                 "retval_" + str(instr["address"]), 256
             )
             global_state.mstate.stack.append(return_value)
-            global_state.mstate.constraints.append(return_value == 0)
+            global_state.mstate.writable_constraints().append(return_value == 0)
             return [global_state]
 
         try:
@@ -1721,14 +1819,14 @@ class Instruction:
             memory_out_offset, min(memory_out_size, len(global_state.last_return_data))
         )
         for i in range(min(memory_out_size, len(global_state.last_return_data))):
-            global_state.mstate.memory[
+            global_state.mstate.writable_memory()[
                 i + memory_out_offset
             ] = global_state.last_return_data[i]
 
         # Put return value on stack
         return_value = global_state.new_bitvec("retval_" + str(instr["address"]), 256)
         global_state.mstate.stack.append(return_value)
-        global_state.mstate.constraints.append(return_value == 1)
+        global_state.mstate.writable_constraints().append(return_value == 1)
         return [global_state]
 
     @StateTransition()
@@ -1747,3 +1845,26 @@ class Instruction:
 
         return global_state_copy
 
+
+def _build_opcode_table() -> Dict[str, Tuple[Callable, Callable, Tuple[int, int]]]:
+    """
+    Maps every opcode name to its mutator, its post (call return) mutator and its gas bounds
+    Opcode families like PUSH1..PUSH32 share a single generic mutator.
+    """
+    table = {}
+    for op_code in set(OPCODE_NAMES) | set(OPCODE_GAS):
+        op = op_code.lower()
+        for family in ("push", "dup", "swap", "log"):
+            if op.startswith(family):
+                op = family
+                break
+
+        mutator = getattr(Instruction, op + "_", None)
+        post_mutator = getattr(Instruction, op + "_post", None)
+        if mutator is None and post_mutator is None:
+            continue
+        table[op_code] = (mutator, post_mutator, OPCODE_GAS.get(op_code))
+    return table
+
+
+OPCODE_TABLE = _build_opcode_table()
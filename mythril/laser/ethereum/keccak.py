@@ -1,18 +1,98 @@
-from z3 import ExprRef
+from typing import Iterator, Tuple, Union
+
+from z3 import ExprRef, Extract, is_bv_value
+
+from mythril.laser.ethereum.simplification import simplify
 
 
 class KeccakFunctionManager:
+    """
+    Index of the symbolic keccak results of a run.
+
+    Results are found by their z3 AST id, which stays unique because the index keeps every result alive. Storage
+    keys are the names of the results, so these are indexed as well.
+
+    Every result belongs to a bucket of the width of its argument and its base slot, the last word of the argument
+    if that is a concrete slot or another keccak result. For each account the index records the results that were
+    used as storage keys, per bucket, so that a symbolic mapping access only looks at the keys that can alias it.
+    """
+
     def __init__(self):
-        self.keccak_expression_mapping = {}
+        # AST id -> (result, argument, bucket)
+        self._results = {}
+        # Name of the result -> AST id
+        self._names = {}
+        # Address -> bucket -> names of the results that were used as storage keys of the account
+        self._storage_keys = {}
 
-    def is_keccak(self, expression: ExprRef) -> bool:
-        return str(expression) in self.keccak_expression_mapping.keys()
+    def is_keccak(self, expression: Union[ExprRef, str]) -> bool:
+        """
+        Checks whether an expression or storage key is a keccak result
+        :param expression: Expression, or storage key in the form of the name of a result
+        """
+        if isinstance(expression, str):
+            return expression in self._names
+        return isinstance(expression, ExprRef) and expression.get_id() in self._results
 
-    def get_argument(self, expression: str) -> ExprRef:
-        if not self.is_keccak(expression):
-            raise ValueError("Expression is not a recognized keccac result")
-        return self.keccak_expression_mapping[str(expression)][1]
+    def get_argument(self, expression: Union[ExprRef, str]) -> ExprRef:
+        return self._get(expression)[1]
 
     def add_keccak(self, expression: ExprRef, argument: ExprRef) -> None:
-        index = str(expression)
-        self.keccak_expression_mapping[index] = (expression, argument)
+        """
+        Adds a symbolic keccak result
+        :param expression: The result
+        :param argument: The hashed data, a multiple of 32 bytes wide
+        """
+        base_slot = None
+        if argument.size() > 256:
+            last_word = simplify(Extract(255, 0, argument))
+            if is_bv_value(last_word):
+                base_slot = last_word.as_long()
+            elif self.is_keccak(last_word):
+                base_slot = "keccak", last_word.get_id()
+
+        key = expression.get_id()
+        self._results[key] = expression, argument, (argument.size(), base_slot)
+        self._names[str(expression)] = key
+
+    def add_storage_key(self, address: str, expression: Union[ExprRef, str]) -> None:
+        """
+        Records that a keccak result is used as storage key of an account
+        :param address: Address of the account
+        :param expression: The result, or its name
+        """
+        bucket = self._get(expression)[2]
+        name = expression if isinstance(expression, str) else str(expression)
+        buckets = self._storage_keys.setdefault(address, {})
+        buckets.setdefault(bucket, {})[name] = None
+
+    def get_storage_keys(
+        self, address: str, expression: Union[ExprRef, str]
+    ) -> Iterator[str]:
+        """
+        Gets the storage keys of an account that can hold the same slot as a keccak result
+        :param address: Address of the account
+        :param expression: The result
+        :return: Names of the results with the same argument width, whose base slot is equal or unknown
+        """
+        width, base_slot = self._get(expression)[2]
+        for (key_width, key_base_slot), names in self._storage_keys.get(
+            address, {}
+        ).items():
+            if key_width != width:
+                continue
+            if (
+                base_slot is not None
+                and key_base_slot is not None
+                and key_base_slot != base_slot
+            ):
+                continue
+            yield from names
+
+    def _get(self, expression: Union[ExprRef, str]) -> Tuple:
+        try:
+            if isinstance(expression, str):
+                return self._results[self._names[expression]]
+            return self._results[expression.get_id()]
+        except (KeyError, AttributeError):
+            raise ValueError("Expression is not a recognized keccac result")
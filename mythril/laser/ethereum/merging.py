@@ -0,0 +1,245 @@
+"""
+This module implements the merging of global states that meet at a join point of the control flow graph
+"""
+import logging
+from copy import copy
+from typing import Dict, List, Tuple, Union
+
+from z3 import And, BitVecRef, BitVecVal, BoolRef, ExprRef, If, Or, is_bv_value
+
+from mythril.laser.ethereum.state.constraints import Constraints
+from mythril.laser.ethereum.state.global_state import GlobalState
+
+# Merging pays off as long as the merged state only needs a few If terms. States that differ in more values than this
+# are kept apart, because the larger formulas would slow down every later solver query on the merged path.
+MAX_MERGED_VALUES = 16
+
+
+def get_merge_key(global_state: GlobalState) -> Union[Tuple, None]:
+    """
+    Gets the key of the join point that a state is at. States can only be merged if their keys are equal.
+    :param global_state: State that is about to execute a JUMPDEST
+    :return: Key of the join point, None for states inside nested message calls, which are not merged
+    """
+    if len(global_state.transaction_stack) != 1:
+        return None
+
+    environment = global_state.environment
+    return (
+        id(global_state.current_transaction),
+        id(environment.code),
+        global_state.mstate.pc,
+        len(global_state.mstate.stack),
+        global_state.mstate.memory_size,
+        environment.active_account.address,
+        environment.active_function_name,
+    )
+
+
+def merge_states(target: GlobalState, other: GlobalState) -> bool:
+    """
+    Merges other into target, if the merge pays off. target is then updated in place to a state whose values are
+    guarded by the path constraints of the original states and whose path constraint is their disjunction.
+    :param target: State that has not been executed yet and takes in the merged values
+    :param other: State at the same join point as target
+    :return: True if other was merged into target
+    """
+    if not _have_same_context(target, other):
+        return False
+
+    target_constraints = target.mstate.constraints
+    other_constraints = other.mstate.constraints
+    common = 0
+    for target_constraint, other_constraint in zip(
+        target_constraints, other_constraints
+    ):
+        if target_constraint is not other_constraint:
+            break
+        common += 1
+
+    # Without own constraints a path contains the other one, and guarding the values would lose behaviour
+    if common == len(target_constraints) or common == len(other_constraints):
+        return False
+
+    differences = _get_differences(target, other)
+    if differences is None or len(differences) > MAX_MERGED_VALUES:
+        return False
+
+    guard = And(*target_constraints[common:])
+    own_accounts = {}
+    for location, target_value, other_value in differences:
+        value = If(guard, target_value, other_value)
+        if location[0] == "stack":
+            target.mstate.stack[location[1]] = value
+        elif location[0] == "memory":
+            target.mstate.writable_memory()[location[1]] = value
+        elif location[0] == "balance":
+            _get_own_account(target, location[1], own_accounts).balance = value
+        else:
+            _get_own_account(target, location[1], own_accounts).storage[
+                location[2]
+            ] = value
+
+    target.mstate.constraints = Constraints(
+        target_constraints[:common] + [Or(guard, And(*other_constraints[common:]))],
+        solver=target_constraints.solver,
+    )
+    target.node.constraints = copy(target.mstate.constraints)
+
+    target.mstate.min_gas_used = min(
+        target.mstate.min_gas_used, other.mstate.min_gas_used
+    )
+    target.mstate.max_gas_used = max(
+        target.mstate.max_gas_used, other.mstate.max_gas_used
+    )
+    # The merged state continues as long as either of the states would have
+    target.mstate.depth = min(target.mstate.depth, other.mstate.depth)
+    if target.mstate.loop_counts is not other.mstate.loop_counts:
+        loop_counts = dict(target.mstate.loop_counts)
+        for jump, iterations in other.mstate.loop_counts.items():
+            loop_counts[jump] = max(iterations, loop_counts.get(jump, 0))
+        target.mstate.loop_counts = loop_counts
+    return True
+
+
+def _have_same_context(target: GlobalState, other: GlobalState) -> bool:
+    """ Checks the parts of the states that are never merged"""
+    if (
+        get_merge_key(target) != get_merge_key(other)
+        or target.last_return_data is not other.last_return_data
+        or target.last_function_called != other.last_function_called
+        or target.dependency_kind != other.dependency_kind
+        or not _same_objects(target.annotations, other.annotations)
+    ):
+        return False
+
+    target_accounts = target.accounts
+    other_accounts = other.accounts
+    if target_accounts.keys() != other_accounts.keys():
+        return False
+
+    for address, target_account in target_accounts.items():
+        other_account = other_accounts[address]
+        if target_account is other_account:
+            continue
+        if (
+            target_account.code is not other_account.code
+            or target_account.nonce != other_account.nonce
+            or target_account.deleted != other_account.deleted
+            or set(target_account.storage.keys()) != set(other_account.storage.keys())
+        ):
+            return False
+    return True
+
+
+def _get_differences(target: GlobalState, other: GlobalState) -> Union[List, None]:
+    """
+    Collects the values in which the states differ
+    :return: (location, value of target, value of other) for every difference, where location is one of
+        ("stack", index), ("memory", index), ("balance", address) and ("storage", address, key). None if two differing
+        values can not be merged
+    """
+    differences = []
+
+    def add(location, target_value, other_value, size, concrete=True) -> bool:
+        if _same_value(target_value, other_value):
+            return True
+        if not concrete and _is_concrete(target_value) and _is_concrete(other_value):
+            return False
+        target_value = _as_expression(target_value, size)
+        other_value = _as_expression(other_value, size)
+        if (
+            target_value is None
+            or other_value is None
+            or target_value.sort() != other_value.sort()
+        ):
+            return False
+        differences.append((location, target_value, other_value))
+        return True
+
+    # Concrete stack and memory values are jump destinations, offsets and sizes more often than not, which have to
+    # stay concrete for the following instructions
+    for index, values in enumerate(zip(target.mstate.stack, other.mstate.stack)):
+        if not add(("stack", index), *values, 256, concrete=False):
+            return None
+
+    # Memory that was not written since the states forked is still shared
+    target_memory, other_memory = target.mstate.memory, other.mstate.memory
+    if target_memory is not other_memory:
+        for index in target_memory.diff(other_memory):
+            if not add(
+                ("memory", index),
+                target_memory[index],
+                other_memory[index],
+                8,
+                concrete=False,
+            ):
+                return None
+
+    other_accounts = other.accounts
+    for address, target_account in target.accounts.items():
+        other_account = other_accounts[address]
+        if target_account is other_account:
+            continue
+
+        if not add(
+            ("balance", address), target_account.balance, other_account.balance, 256
+        ):
+            return None
+
+        for key in target_account.storage.keys():
+            if not add(
+                ("storage", address, key),
+                target_account.storage[key],
+                other_account.storage[key],
+                256,
+            ):
+                return None
+
+        if len(differences) > MAX_MERGED_VALUES:
+            break
+
+    return differences
+
+
+def _get_own_account(global_state: GlobalState, address: str, own_accounts: Dict):
+    """ Replaces an account of the state by a copy on its first write, as SSTORE does"""
+    try:
+        return own_accounts[address]
+    except KeyError:
+        pass
+
+    accounts = global_state.writable_world_state().accounts
+    account = copy(accounts[address])
+    accounts[address] = account
+    if global_state.environment.active_account.address == address:
+        global_state.environment.active_account = account
+    own_accounts[address] = account
+    return account
+
+
+def _same_objects(first: List, second: List) -> bool:
+    return len(first) == len(second) and all(a is b for a, b in zip(first, second))
+
+
+def _same_value(first, second) -> bool:
+    if first is second:
+        return True
+    if isinstance(first, ExprRef) and isinstance(second, ExprRef):
+        return first.eq(second)
+    if isinstance(first, ExprRef) or isinstance(second, ExprRef):
+        return False
+    return first == second
+
+
+def _is_concrete(value) -> bool:
+    return isinstance(value, int) or is_bv_value(value)
+
+
+def _as_expression(value, size: int) -> Union[ExprRef, None]:
+    if isinstance(value, (BitVecRef, BoolRef)):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return BitVecVal(value, size)
+    logging.debug("Can not merge value of type %s", type(value))
+    return None
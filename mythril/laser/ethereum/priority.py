@@ -0,0 +1,115 @@
+from typing import Dict, List, Tuple
+
+# Dependency kinds, from the most to the least relevant one
+DEPENDENCY_KINDS = ("RAW", "WAR", "WAW", "RAR")
+DEPENDENCY_WEIGHTS = {"RAW": 4, "WAR": 3, "WAW": 2, "RAR": 1}
+
+
+class PriorityIndex:
+    """
+    Hash index over the Slither priority of a contract.
+
+    The priority maps a dependency kind (RAW, WAR, WAW, RAR) to pairs of functions, where the first function has to
+    be called before the second one. The index maps (first function name, selector of the second function) to the
+    dependency kinds that contain the pair, in the order of the priority.
+    """
+
+    def __init__(self, priority: Dict):
+        """
+        Constructor for PriorityIndex
+        :param priority: Priority as computed by Mythril.parse_slither
+        """
+        self._titles = {}
+        for title, pairs in priority.items():
+            for pair in pairs:
+                key = (pair.first.function_name, int(pair.second.function_hash, 16))
+                titles = self._titles.get(key, ())
+                if title not in titles:
+                    self._titles[key] = titles + (title,)
+
+    def get_titles(self, function_name: str, selector: int) -> Tuple[str, ...]:
+        """
+        Gets the dependency kinds of a branch of the function dispatcher
+        :param function_name: Name of the function called by the previous transaction
+        :param selector: Selector that the dispatcher compares against, as pushed by its PUSH4
+        :return: Dependency kinds that contain the pair of function_name and the function of selector
+        """
+        return self._titles.get((function_name, selector), ())
+
+
+class DependencyScheduler:
+    """
+    Orders the open states of a multi transaction analysis along the dependency graph of the contract.
+
+    The functions of the contract are the nodes of the graph, the function pairs of the priority are its edges,
+    weighted by the most relevant dependency kind they occur in. The function sequence that led to an open state
+    is scored with the weight of the edges that it follows. Open states whose last function does not start any
+    dependency are dropped, and only the beam_width best scored sequences are extended by the next transaction.
+    """
+
+    def __init__(self, priority: Dict, beam_width=None):
+        """
+        Constructor for DependencyScheduler
+        :param priority: Priority as computed by Mythril.parse_slither
+        :param beam_width: Maximum number of open states that are extended per transaction, None for no limit
+        """
+        self.beam_width = beam_width
+        self._weights = {}
+        self._kinds = {}
+        for kind in DEPENDENCY_KINDS:
+            for pair in priority.get(kind, []):
+                first = pair.first.function_name
+                edge = (first, pair.second.function_name)
+                self._kinds.setdefault(first, kind)
+                self._weights[edge] = max(
+                    self._weights.get(edge, 0), DEPENDENCY_WEIGHTS[kind]
+                )
+
+        # Last transaction of a scheduled sequence -> (name of its function, score of the sequence)
+        self._sequences = {}
+
+    def schedule(self, open_states: List) -> List[Tuple[str, List]]:
+        """
+        Selects and groups the open states that the next transaction is executed on
+        :param open_states: World states at the end of the previous transaction
+        :return: (dependency kind, open states) for every kind, in the order in which they should be executed
+        """
+        candidates = []
+        for position, open_state in enumerate(open_states):
+            function_name = open_state.node.function_name
+            kind = self._kinds.get(function_name)
+            if kind is None:
+                continue
+            score = self._score(open_state.transaction_sequence, function_name)
+            candidates.append(
+                (-(score + DEPENDENCY_WEIGHTS[kind]), position, kind, open_state)
+            )
+
+        candidates.sort(key=lambda candidate: candidate[:2])
+        if self.beam_width is not None:
+            candidates = candidates[: self.beam_width]
+        candidates.sort(key=lambda candidate: candidate[1])
+
+        groups = [(kind, []) for kind in DEPENDENCY_KINDS]
+        for _, _, kind, open_state in candidates:
+            groups[DEPENDENCY_KINDS.index(kind)][1].append(open_state)
+        return groups
+
+    def _score(self, transaction_sequence: List, function_name: str) -> int:
+        last_transaction = transaction_sequence[-1]
+        try:
+            return self._sequences[last_transaction][1]
+        except KeyError:
+            pass
+
+        score = 0
+        if len(transaction_sequence) > 1:
+            previous = self._sequences.get(transaction_sequence[-2])
+            if previous is not None:
+                previous_function, previous_score = previous
+                score = previous_score + self._weights.get(
+                    (previous_function, function_name), 0
+                )
+
+        self._sequences[last_transaction] = (function_name, score)
+        return score
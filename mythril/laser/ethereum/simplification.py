@@ -0,0 +1,99 @@
+"""
+This module implements a memoizing layer on top of z3's simplify
+"""
+from collections import OrderedDict
+from typing import Tuple
+
+import z3
+from z3 import ExprRef
+
+# Number of simplified expressions that are kept. Every entry keeps its input and result alive in the z3 context.
+DEFAULT_CACHE_SIZE = 2 ** 16
+
+
+class SimplificationCache:
+    """
+    LRU cache of simplified expressions.
+
+    z3 hash-conses its expressions: building the same term twice gives the same AST, with the same AST id, as long
+    as the first one is alive. The cache is keyed on these ids and keeps the input of every entry alive, so an id
+    can not be reused by a different term while its entry exists. Forked states that simplify the same stack
+    values, jump conditions or calldata reads therefore only pay for the first simplification.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Constructor for SimplificationCache
+        :param max_size: Number of entries after which the least recently used entry is evicted
+        """
+        self.max_size = max_size
+        # AST id -> (expression, simplified expression)
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def simplify(self, expression: ExprRef) -> ExprRef:
+        """
+        Simplifies an expression, using the cached result if the expression was simplified before
+        :param expression: z3 expression
+        :return: Simplified expression
+        """
+        key = expression.get_id()
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                # Evicted by another engine in the same process since the lookup, the result is still valid
+                pass
+            return entry[1]
+
+        self.misses += 1
+        result = z3.simplify(expression)
+        self._entries[key] = expression, result
+        if len(self._entries) > self.max_size:
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:
+                pass
+        return result
+
+    @property
+    def hit_rate(self) -> float:
+        """ Share of the lookups that were answered from the cache, between 0 and 1"""
+        lookups = self.hits + self.misses
+        return self.hits / float(lookups) if lookups else 0.0
+
+    def statistics(self) -> Tuple[int, int]:
+        """
+        Reads the statistics of the cache, which are cumulative over all engines of the process
+        :return: Number of hits and misses so far, a run counts the difference to the reading at its start
+        """
+        return self.hits, self.misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """ Drops all entries and resets the statistics"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+simplification_cache = SimplificationCache()
+
+
+def simplify(expression: ExprRef, *arguments, **options) -> ExprRef:
+    """
+    Drop-in replacement for z3.simplify that memoizes calls without simplifier options in simplification_cache
+    :param expression: z3 expression
+    :return: Simplified expression
+    """
+    if arguments or options or not isinstance(expression, ExprRef):
+        return z3.simplify(expression, *arguments, **options)
+    return simplification_cache.simplify(expression)
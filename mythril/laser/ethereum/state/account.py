@@ -1,4 +1,5 @@
-from typing import Dict, Union, Any, KeysView
+from copy import copy
+from typing import Dict, Union, Any, List
 
 from z3 import BitVec, BitVecVal, ExprRef
 
@@ -8,21 +9,49 @@ from mythril.disassembler.disassembly import Disassembly
 class Storage:
     """
     Storage class represents the storage of an Account
+
+    The slots are spread over a fixed number of chunks. Copies of a storage share all chunks, and a write only copies
+    the chunk it lands in, so forking a storage costs O(STORAGE_CHUNKS) instead of O(size of the storage).
+
+    The keys are also kept in insertion order in a list that copies share. Keys are only ever appended, so a storage
+    owns the first _key_count entries, and takes its own list only when a copy has appended to the shared one.
     """
 
+    STORAGE_CHUNKS = 32
+
     def __init__(self, concrete=False, address=None, dynamic_loader=None):
         """
         Constructor for Storage
         :param concrete: bool indicating whether to interpret uninitialized storage as concrete versus symbolic
         """
-        self._storage = {}
+        self._chunks = [{} for _ in range(self.STORAGE_CHUNKS)]
+        self._owned = [True] * self.STORAGE_CHUNKS
+        self._keys = []
+        self._key_count = 0
         self.concrete = concrete
         self.dynld = dynamic_loader
         self.address = address
 
+    @property
+    def _storage(self) -> Dict:
+        """ The slots of this storage as a plain dictionary, in insertion order"""
+        return {key: self._get(key) for key in self.keys()}
+
+    @_storage.setter
+    def _storage(self, storage: Dict) -> None:
+        self._chunks = [{} for _ in range(self.STORAGE_CHUNKS)]
+        self._owned = [True] * self.STORAGE_CHUNKS
+        self._keys = []
+        self._key_count = 0
+        for key, value in storage.items():
+            self[key] = value
+
+    def _get(self, item):
+        return self._chunks[hash(item) % self.STORAGE_CHUNKS][item]
+
     def __getitem__(self, item: Union[int, slice]) -> Any:
         try:
-            return self._storage[item]
+            return self._get(item)
         except KeyError:
             if (
                 self.address
@@ -30,25 +59,51 @@ class Storage:
                 and (self.dynld and self.dynld.storage_loading)
             ):
                 try:
-                    self._storage[item] = int(
+                    self[item] = int(
                         self.dynld.read_storage(
                             contract_address=self.address, index=int(item)
                         ),
                         16,
                     )
-                    return self._storage[item]
+                    return self._get(item)
                 except ValueError:
                     pass
         if self.concrete:
             return 0
-        self._storage[item] = BitVecVal(0, 256)
-        return self._storage[item]
+        self[item] = BitVecVal(0, 256)
+        return self._get(item)
 
     def __setitem__(self, key: str, value: ExprRef) -> None:
-        self._storage[key] = value
-
-    def keys(self) -> KeysView:
-        return self._storage.keys()
+        index = hash(key) % self.STORAGE_CHUNKS
+        if not self._owned[index]:
+            self._chunks[index] = dict(self._chunks[index])
+            self._owned[index] = True
+
+        chunk = self._chunks[index]
+        if key not in chunk:
+            if len(self._keys) != self._key_count:
+                self._keys = self._keys[: self._key_count]
+            self._keys.append(key)
+            self._key_count += 1
+        chunk[key] = value
+
+    def __contains__(self, key) -> bool:
+        return key in self._chunks[hash(key) % self.STORAGE_CHUNKS]
+
+    def __copy__(self) -> "Storage":
+        new_storage = Storage(self.concrete, self.address, self.dynld)
+        new_storage._chunks = self._chunks[:]
+        new_storage._keys = self._keys
+        new_storage._key_count = self._key_count
+        self._owned = [False] * self.STORAGE_CHUNKS
+        new_storage._owned = [False] * self.STORAGE_CHUNKS
+        return new_storage
+
+    def keys(self) -> List:
+        """ Gets the keys in insertion order, the list must not be modified"""
+        if len(self._keys) != self._key_count:
+            self._keys = self._keys[: self._key_count]
+        return self._keys
 
 
 class Account:
@@ -89,6 +144,19 @@ class Account:
     def __str__(self) -> str:
         return str(self.as_dict)
 
+    def __copy__(self) -> "Account":
+        """ Creates a copy that shares code and storage chunks with this account"""
+        # Bypasses __init__, which would create a balance variable and a storage only to replace them
+        new_account = Account.__new__(Account)
+        new_account.nonce = self.nonce
+        new_account.code = self.code
+        new_account.balance = self.balance
+        new_account.storage = copy(self.storage)
+        new_account.address = self.address
+        new_account.contract_name = self.contract_name
+        new_account.deleted = self.deleted
+        return new_account
+
     def set_balance(self, balance: ExprRef) -> None:
         self.balance = balance
 
@@ -1,8 +1,9 @@
 from enum import Enum
 from typing import Union, Any
-from z3 import BitVecVal, BitVecRef, BitVec, simplify, Concat, If, ExprRef
+from z3 import BitVecVal, BitVecRef, BitVec, Concat, If, ExprRef
 from z3.z3types import Z3Exception, Model
 
+from mythril.laser.ethereum.simplification import simplify
 from mythril.laser.ethereum.util import get_concrete_int
 
 
@@ -1,17 +1,87 @@
+from z3 import Solver, unsat
+
+
+class PathSolver:
+    """
+    Incremental z3 solver context shared by all Constraints objects that were forked from the same path.
+
+    Every asserted constraint lives in its own push level. Before a query the solver pops back to the longest
+    prefix it shares with the queried constraint list and only pushes the constraints that follow it, so
+    sibling states created at JUMPI / SSTORE forks reuse the work done for their common path prefix.
+    """
+
+    def __init__(self, timeout=100000):
+        self.timeout = timeout
+        self._solver = None
+        self._asserted = []
+
+    @property
+    def solver(self) -> Solver:
+        if self._solver is None:
+            self._solver = Solver()
+            self._solver.set("timeout", self.timeout)
+        return self._solver
+
+    def _sync(self, constraints) -> None:
+        """
+        Brings the assertion stack of the solver in line with constraints
+        :param constraints: list of constraints that should be asserted
+        """
+        common = 0
+        for asserted, constraint in zip(self._asserted, constraints):
+            if asserted is not constraint:
+                break
+            common += 1
+
+        stale = len(self._asserted) - common
+        if stale:
+            self.solver.pop(stale)
+            del self._asserted[common:]
+
+        for constraint in constraints[common:]:
+            self.solver.push()
+            self.solver.add(constraint)
+            self._asserted.append(constraint)
+
+    def check(self, constraints, assumptions=(), timeout=None):
+        """
+        Checks the satisfiability of constraints under the given assumptions
+        :param constraints: list of path constraints
+        :param assumptions: additional constraints that are only assumed for this query
+        :param timeout: time budget for this query in milliseconds, defaults to the solver timeout
+        :return: z3 check result
+        """
+        self._sync(constraints)
+        self.solver.set("timeout", timeout or self.timeout)
+        return self.solver.check(*assumptions)
+
+    def model(self):
+        return self.solver.model()
+
+    def reset(self) -> None:
+        self._solver = None
+        self._asserted = []
+
+
 class Constraints(list):
     """
-    This class should maintain a solver and it's constraints, This class tries to make the Constraints() object
-    as a simple list of constraints with some background processing.
-    TODO: add the solver to this class after callback refactor
+    This class maintains a list of constraints together with the incremental solver of the path they belong to.
+    Copies of a Constraints object share the solver, which is kept in sync using push / pop.
     """
 
     def __init__(self, constraint_list=None, solver=None, possibility=None):
         super(Constraints, self).__init__(constraint_list or [])
-        self.solver = solver
+        self.solver = solver or PathSolver()
         self.__possibility = possibility
 
-    def check_possibility(self):
-        return True
+    def check_possibility(self, assumptions=(), timeout=None) -> bool:
+        """
+        Checks whether the constraints (and the optional assumptions) can be satisfied
+        :param assumptions: additional constraints that are only assumed for this query
+        :param timeout: time budget for this query in milliseconds
+        :return: False if the constraints are unsatisfiable, True otherwise (also on timeouts)
+        """
+        return self.solver.check(self, assumptions, timeout) != unsat
 
     def append(self, constraint):
         super(Constraints, self).append(constraint)
@@ -19,16 +89,19 @@ class Constraints(list):
     def pop(self, index=-1):
         raise NotImplementedError
 
+    def copy(self):
+        return self.__copy__()
+
     def __copy__(self):
         constraint_list = super(Constraints, self).copy()
-        return Constraints(constraint_list)
+        return Constraints(constraint_list, solver=self.solver)
 
     def __deepcopy__(self, memodict=None):
         return self.__copy__()
 
     def __add__(self, constraints):
         constraints_list = super(Constraints, self).__add__(constraints)
-        return Constraints(constraint_list=constraints_list)
+        return Constraints(constraint_list=constraints_list, solver=self.solver)
 
     def __iadd__(self, constraints):
         super(Constraints, self).__iadd__(constraints)
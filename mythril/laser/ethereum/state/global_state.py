@@ -1,6 +1,6 @@
 from typing import Dict, Union
 
-from copy import copy, deepcopy
+from copy import copy
 from z3 import BitVec
 
 from mythril.laser.ethereum.cfg import Node
@@ -11,6 +11,9 @@ from mythril.laser.ethereum.state.machine_state import MachineState
 class GlobalState:
     """
     GlobalState represents the current globalstate
+
+    Copies share the world state with the original until either of them writes to it (copy-on-write). The
+    world_state and accounts properties never copy and must only be read, writes go through writable_world_state().
     """
 
     def __init__(
@@ -26,7 +29,8 @@ class GlobalState:
     ):
         """ Constructor for GlobalState"""
         self.node = node
-        self.world_state = world_state
+        self._world_state = world_state
+        self._world_state_shared = False
         self.environment = environment
         self.mstate = (
             machine_state if machine_state else MachineState(gas_limit=1000000000)
@@ -36,14 +40,15 @@ class GlobalState:
         self.last_return_data = last_return_data
         self.annotations = annotations or []
         self.last_function_called = last_function_called
+        # Slither dependency kind of a branch that the heuristic search deferred, None for regular states
+        self.dependency_kind = None
 
     def __copy__(self) -> "GlobalState":
-        world_state = copy(self.world_state)
         environment = copy(self.environment)
-        mstate = deepcopy(self.mstate)
+        mstate = copy(self.mstate)
         transaction_stack = copy(self.transaction_stack)
-        return GlobalState(
-            world_state,
+        new_global_state = GlobalState(
+            self._world_state,
             environment,
             self.node,
             mstate,
@@ -51,10 +56,31 @@ class GlobalState:
             last_return_data=self.last_return_data,
             annotations=self.annotations,
         )
+        new_global_state.dependency_kind = self.dependency_kind
+        self._world_state_shared = new_global_state._world_state_shared = True
+        return new_global_state
+
+    @property
+    def world_state(self) -> "WorldState":
+        """ Gets the world state for reading, it may be shared with copies of this state"""
+        return self._world_state
+
+    @world_state.setter
+    def world_state(self, world_state: "WorldState") -> None:
+        self._world_state = world_state
+        self._world_state_shared = False
+
+    def writable_world_state(self) -> "WorldState":
+        """ Gets the world state for writing, taking a private copy if it is shared with copies of this state"""
+        if self._world_state_shared:
+            self._world_state = copy(self._world_state)
+            self._world_state_shared = False
+        return self._world_state
 
     @property
     def accounts(self) -> Dict:
-        return self.world_state.accounts
+        """ Gets the accounts for reading, use writable_world_state().accounts to add or replace accounts"""
+        return self._world_state.accounts
 
     # TODO: remove this, as two instructions are confusing
     def get_current_instruction(self) -> Dict:
@@ -10,6 +10,7 @@ from mythril.laser.ethereum.evm_exceptions import (
     OutOfGasException,
 )
 from mythril.laser.ethereum.state.constraints import Constraints
+from mythril.laser.ethereum.state.memory import Memory
 
 
 class MachineStack(list):
@@ -72,6 +73,14 @@ class MachineStack(list):
 class MachineState:
     """
     MachineState represents current machine state also referenced to as \mu
+
+    Copies of a machine state share memory and constraints until either side writes to them, at which point the
+    writing side takes a private copy (copy-on-write). The memory and constraints properties never copy and must
+    only be read, writes go through writable_memory() and writable_constraints(). The stack is small and touched
+    by almost every instruction, so it is always copied eagerly.
+
+    loop_counts maps the backward jumps of the current call frame, as (pc of the jump, destination), to the number
+    of times they were taken. It is shared between copies and replaced, never updated in place.
     """
 
     def __init__(
@@ -84,16 +93,54 @@ class MachineState:
         depth=0,
         max_gas_used=0,
         min_gas_used=0,
+        loop_counts=None,
     ):
         """ Constructor for machineState """
         self.pc = pc
         self.stack = MachineStack(stack)
-        self.memory = memory or []
+        self._memory = memory if memory is not None else Memory()
+        self._memory_shared = False
         self.gas_limit = gas_limit
         self.min_gas_used = min_gas_used  # lower gas usage bound
         self.max_gas_used = max_gas_used  # upper gas usage bound
-        self.constraints = constraints or Constraints()
+        self._constraints = constraints if constraints is not None else Constraints()
+        self._constraints_shared = False
         self.depth = depth
+        self.loop_counts = loop_counts if loop_counts is not None else {}
+
+    @property
+    def memory(self) -> Memory:
+        """ Gets the memory for reading, it may be shared with copies of this state"""
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory: Union[Memory, List]) -> None:
+        self._memory = memory if isinstance(memory, Memory) else Memory(memory)
+        self._memory_shared = False
+
+    def writable_memory(self) -> Memory:
+        """ Gets the memory for writing, taking a private copy if it is shared with copies of this state"""
+        if self._memory_shared:
+            self._memory = copy(self._memory)
+            self._memory_shared = False
+        return self._memory
+
+    @property
+    def constraints(self) -> Constraints:
+        """ Gets the constraints for reading, they may be shared with copies of this state"""
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: Constraints) -> None:
+        self._constraints = constraints
+        self._constraints_shared = False
+
+    def writable_constraints(self) -> Constraints:
+        """ Gets the constraints for writing, taking a private copy if they are shared with copies of this state"""
+        if self._constraints_shared:
+            self._constraints = copy(self._constraints)
+            self._constraints_shared = False
+        return self._constraints
 
     def calculate_extension_size(self, start: int, size: int) -> int:
         if self.memory_size > start + size:
@@ -128,12 +175,12 @@ class MachineState:
             self.min_gas_used += extend_gas
             self.max_gas_used += extend_gas
             self.check_gas()
-            self.memory.extend(bytearray(m_extend))
+            self.writable_memory().extend(m_extend)
 
     def memory_write(self, offset: int, data: List[int]) -> None:
         """ Writes data to memory starting at offset """
         self.mem_extend(offset, len(data))
-        self.memory[offset : offset + len(data)] = data
+        self.writable_memory()[offset : offset + len(data)] = data
 
     def pop(self, amount=1) -> Union[BitVec, List[BitVec]]:
         """ Pops amount elements from the stack"""
@@ -144,6 +191,23 @@ class MachineState:
 
         return values[0] if amount == 1 else values
 
+    def __copy__(self) -> "MachineState":
+        """ Creates a copy that shares memory and constraints with this state until either of them writes to them"""
+        new_mstate = MachineState(
+            gas_limit=self.gas_limit,
+            max_gas_used=self.max_gas_used,
+            min_gas_used=self.min_gas_used,
+            pc=self.pc,
+            stack=self.stack,
+            memory=self._memory,
+            constraints=self._constraints,
+            depth=self.depth,
+            loop_counts=self.loop_counts,
+        )
+        self._memory_shared = new_mstate._memory_shared = True
+        self._constraints_shared = new_mstate._constraints_shared = True
+        return new_mstate
+
     def __deepcopy__(self, memodict=None):
         memodict = {} if memodict is None else memodict
         return MachineState(
@@ -152,9 +216,10 @@ class MachineState:
             min_gas_used=self.min_gas_used,
             pc=self.pc,
             stack=copy(self.stack),
-            memory=copy(self.memory),
-            constraints=copy(self.constraints),
+            memory=copy(self._memory),
+            constraints=copy(self._constraints),
             depth=self.depth,
+            loop_counts=self.loop_counts,
         )
 
     def __str__(self):
@@ -162,14 +227,14 @@ class MachineState:
 
     @property
     def memory_size(self) -> int:
-        return len(self.memory)
+        return len(self._memory)
 
     @property
     def as_dict(self) -> Dict:
         return dict(
             pc=self.pc,
             stack=self.stack,
-            memory=self.memory,
+            memory=self._memory,
             memsize=self.memory_size,
             gas=self.gas_limit,
             max_gas_used=self.max_gas_used,
@@ -0,0 +1,385 @@
+from copy import copy
+from typing import Iterator, List, Union
+
+from z3 import (
+    ArrayRef,
+    BitVecRef,
+    BitVecSort,
+    BitVecVal,
+    BoolRef,
+    Concat,
+    ExprRef,
+    Extract,
+    If,
+    K,
+    Select,
+    Store,
+    Z3_OP_EXTRACT,
+    ZeroExt,
+    is_app_of,
+    is_bv_value,
+)
+
+from mythril.laser.ethereum.simplification import simplify
+
+WORD_SIZE = 32
+# Bytes per page, a multiple of the word size so that aligned words never cross a page
+PAGE_SIZE = 32 * WORD_SIZE
+
+
+class Memory:
+    """
+    Sparse, byte addressed memory of a machine state.
+
+    Memory is split into pages of PAGE_SIZE bytes. The concrete bytes of a page are kept in a bytearray, the symbolic
+    bytes of a page in a dictionary that overlays the bytearray. Pages that were never written are not stored and
+    read as zero. Copies of a memory share all pages, a write only copies the page it changes (copy-on-write).
+
+    Every entry is one byte: an int or an 8 bit expression. Symbolic words are stored as the 32 byte extracts of the
+    word, and get_word_at returns the original word when it reads them back in one piece.
+
+    Pages can only be addressed by concrete offsets. Writes to symbolic offsets are kept in an overlay, in the order
+    they happened, and every byte written at a concrete offset records how many overlay writes precede it. A read at
+    a concrete offset only has to consider the overlay writes that came after the byte, so memory without symbolic
+    writes keeps the plain page lookups. Reads at symbolic offsets go through a Z3 array of all bytes, which is built
+    on demand and cached until the next write.
+    """
+
+    def __init__(self, data: List = None):
+        """
+        Constructor for Memory
+        :param data: Initial bytes, empty memory by default
+        """
+        self._size = 0
+        # page number -> concrete bytes
+        self._pages = {}
+        # page number -> {offset in the page: symbolic byte}
+        self._symbolic = {}
+        # page number -> {offset in the page: number of overlay writes before the byte was written}
+        self._stamps = {}
+        # Numbers of the pages that are not shared with a copy
+        self._owned = set()
+        # (offset, byte) of the writes to symbolic offsets, oldest first
+        self._overlay = ()
+        # All bytes as Z3 array, None if it has to be rebuilt
+        self._array = None
+
+        if data:
+            self.extend(len(data))
+            self[0 : len(data)] = data
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, size: int) -> None:
+        """ Appends size zero bytes"""
+        self._size += size
+
+    @property
+    def is_symbolic(self) -> bool:
+        """ Whether a symbolic offset was written, so that reads have to consider the overlay"""
+        return bool(self._overlay)
+
+    def get_word_at(self, index: Union[int, BitVecRef]) -> Union[int, ExprRef]:
+        """
+        Reads the 32 byte word at index
+        :param index: Memory offset of the word, concrete or symbolic
+        :return: The word as int if all of its bytes are concrete, as 256 bit expression otherwise
+        """
+        if not isinstance(index, int):
+            array = self._as_array()
+            word = simplify(
+                Concat([Select(array, index + i) for i in range(WORD_SIZE)])
+            )
+            return word.as_long() if is_bv_value(word) else word
+
+        number, offset = divmod(index, PAGE_SIZE)
+        if (
+            not self._overlay
+            and offset + WORD_SIZE <= PAGE_SIZE
+            and not self._has_symbolic(number, offset, offset + WORD_SIZE)
+        ):
+            page = self._pages.get(number)
+            if page is None:
+                return 0
+            return int.from_bytes(page[offset : offset + WORD_SIZE], byteorder="big")
+
+        values = [self._read(i) for i in range(index, index + WORD_SIZE)]
+        if all(isinstance(value, int) for value in values):
+            return int.from_bytes(bytes(values), byteorder="big")
+
+        word = _get_extracted_word(values)
+        if word is not None:
+            return word
+        return simplify(
+            Concat(
+                [
+                    BitVecVal(value, 8) if isinstance(value, int) else value
+                    for value in values
+                ]
+            )
+        )
+
+    def write_word_at(
+        self, index: Union[int, BitVecRef], value: Union[int, ExprRef]
+    ) -> None:
+        """
+        Writes a 32 byte word at index, big endian
+        :param index: Memory offset of the word, concrete or symbolic
+        :param value: The word
+        """
+        if is_bv_value(value):
+            value = value.as_long()
+
+        if isinstance(value, int):
+            data = (value % 2 ** 256).to_bytes(WORD_SIZE, byteorder="big")
+            number, offset = (
+                divmod(index, PAGE_SIZE) if isinstance(index, int) else (0, PAGE_SIZE)
+            )
+            if offset + WORD_SIZE <= PAGE_SIZE:
+                page = self._own_page(number)
+                page[offset : offset + WORD_SIZE] = data
+                symbolic = self._symbolic.get(number)
+                if symbolic:
+                    for position in range(offset, offset + WORD_SIZE):
+                        symbolic.pop(position, None)
+                self._stamp(number, offset, offset + WORD_SIZE)
+                self._array = None
+            else:
+                for i, byte in enumerate(data):
+                    self._write(index + i, byte)
+            return
+
+        if isinstance(value, BoolRef):
+            value = If(value, BitVecVal(1, 256), BitVecVal(0, 256))
+        elif value.size() < 256:
+            value = ZeroExt(256 - value.size(), value)
+        elif value.size() > 256:
+            value = Extract(255, 0, value)
+
+        for i in range(WORD_SIZE):
+            self._write(index + i, Extract(255 - 8 * i, 248 - 8 * i, value))
+
+    def write_byte_at(self, index: Union[int, BitVecRef], value) -> None:
+        """
+        Writes a single byte, without checking index against the size of the memory
+        :param index: Memory offset, concrete or symbolic
+        :param value: The byte, expressions that are wider than a byte keep their lowest byte
+        """
+        self._write(index, value)
+
+    def diff(self, other: "Memory") -> List[int]:
+        """
+        Gets the indices at which the bytes of two memories of the same size differ, skipping the pages they share
+        :param other: Memory, usually copied from the same memory as this one
+        :return: Indices of the differing bytes. If the memories went through different symbolic writes, all bytes
+            count as differing
+        """
+        if (self._overlay or other._overlay) and self._overlay is not other._overlay:
+            return list(range(self._size))
+
+        indices = []
+        for number in sorted(set(self._pages) | set(other._pages)):
+            if (
+                self._pages.get(number) is other._pages.get(number)
+                and self._symbolic.get(number) is other._symbolic.get(number)
+                and self._stamps.get(number) is other._stamps.get(number)
+            ):
+                continue
+            start = number * PAGE_SIZE
+            for index in range(start, min(start + PAGE_SIZE, self._size)):
+                first, second = self._read(index), other._read(index)
+                if first is second:
+                    continue
+                if isinstance(first, ExprRef) and isinstance(second, ExprRef):
+                    if first.eq(second):
+                        continue
+                elif first == second:
+                    continue
+                indices.append(index)
+        return indices
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[int, ExprRef, List]:
+        if isinstance(item, slice):
+            return [self._read(index) for index in range(*item.indices(self._size))]
+        return self._read(self._check_index(item))
+
+    def __setitem__(self, key: Union[int, slice], value) -> None:
+        """
+        Writes bytes. Integers are stored as they are, expressions that are wider than a byte keep their lowest
+        byte, as MSTORE8 does.
+        """
+        if isinstance(key, slice):
+            for index, byte in zip(range(*key.indices(self._size)), value):
+                self._write(index, byte)
+        else:
+            self._write(self._check_index(key), value)
+
+    def __iter__(self) -> Iterator:
+        for index in range(self._size):
+            yield self._read(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Memory):
+            return len(self) == len(other) and not self.diff(other)
+        if isinstance(other, list):
+            return self[:] == other
+        return NotImplemented
+
+    def __copy__(self) -> "Memory":
+        new_memory = Memory()
+        new_memory._size = self._size
+        new_memory._pages = copy(self._pages)
+        new_memory._symbolic = copy(self._symbolic)
+        new_memory._stamps = copy(self._stamps)
+        new_memory._overlay = self._overlay
+        new_memory._array = self._array
+        self._owned = set()
+        return new_memory
+
+    def __repr__(self) -> str:
+        return "<Memory {} bytes>".format(self._size)
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Memory index out of range")
+        return index
+
+    def _has_symbolic(self, number: int, start: int, end: int) -> bool:
+        symbolic = self._symbolic.get(number)
+        return bool(symbolic) and any(
+            offset in symbolic for offset in range(start, end)
+        )
+
+    def _own_page(self, number: int) -> bytearray:
+        """ Gets a page for writing, after copying it if it is shared"""
+        if number not in self._owned:
+            page = self._pages.get(number)
+            self._pages[number] = (
+                bytearray(page) if page is not None else bytearray(PAGE_SIZE)
+            )
+            for entries in (self._symbolic, self._stamps):
+                page_entries = entries.get(number)
+                if page_entries is not None:
+                    entries[number] = dict(page_entries)
+            self._owned.add(number)
+        return self._pages[number]
+
+    def _stamp(self, number: int, start: int, end: int) -> None:
+        """ Records that the bytes from start to end of an owned page were written after the current overlay"""
+        if self._overlay:
+            stamps = self._stamps.setdefault(number, {})
+            for offset in range(start, end):
+                stamps[offset] = len(self._overlay)
+
+    def _as_array(self) -> ArrayRef:
+        """ Gets the bytes of the memory as Z3 array"""
+        if self._array is not None:
+            return self._array
+
+        # Concrete offset -> byte, grouped by the number of overlay writes that precede the byte
+        generations = [{} for _ in range(len(self._overlay) + 1)]
+        for number in sorted(self._pages):
+            symbolic = self._symbolic.get(number) or {}
+            stamps = self._stamps.get(number) or {}
+            for offset, byte in enumerate(self._pages[number]):
+                value = symbolic.get(offset, byte)
+                stamp = stamps.get(offset, 0)
+                # Zero bytes only have to be stored if they overwrite symbolic writes
+                if stamp or not isinstance(value, int) or value:
+                    generations[stamp][number * PAGE_SIZE + offset] = value
+
+        array = K(BitVecSort(256), BitVecVal(0, 8))
+        for generation, writes in enumerate(generations):
+            if generation:
+                array = Store(array, *self._overlay[generation - 1])
+            for index, value in writes.items():
+                if isinstance(value, int):
+                    value = BitVecVal(value, 8)
+                array = Store(array, index, value)
+        self._array = array
+        return array
+
+    def _read(self, index: Union[int, BitVecRef]) -> Union[int, ExprRef]:
+        if not isinstance(index, int):
+            value = simplify(Select(self._as_array(), index))
+            return value.as_long() if is_bv_value(value) else value
+
+        number, offset = divmod(index, PAGE_SIZE)
+        value = None
+        symbolic = self._symbolic.get(number)
+        if symbolic:
+            value = symbolic.get(offset)
+        if value is None:
+            page = self._pages.get(number)
+            value = page[offset] if page is not None else 0
+        if not self._overlay:
+            return value
+
+        stamps = self._stamps.get(number)
+        writes = self._overlay[stamps.get(offset, 0) if stamps else 0 :]
+        if not writes:
+            return value
+        if isinstance(value, int):
+            value = BitVecVal(value, 8)
+        for write_index, byte in writes:
+            value = If(write_index == index, byte, value)
+        value = simplify(value)
+        return value.as_long() if is_bv_value(value) else value
+
+    def _write(self, index: Union[int, BitVecRef], value: Union[int, ExprRef]) -> None:
+        if is_bv_value(value):
+            value = value.as_long() % 256
+
+        if not isinstance(index, int):
+            if isinstance(value, int):
+                value = BitVecVal(value, 8)
+            elif isinstance(value, BoolRef):
+                value = If(value, BitVecVal(1, 8), BitVecVal(0, 8))
+            elif value.size() != 8:
+                value = Extract(7, 0, value)
+            self._overlay += ((index, value),)
+            if self._array is not None:
+                # The newest write, so it can be stored on top of the cached array
+                self._array = Store(self._array, index, value)
+            return
+
+        number, offset = divmod(index, PAGE_SIZE)
+        page = self._own_page(number)
+        self._stamp(number, offset, offset + 1)
+        self._array = None
+        if isinstance(value, int):
+            page[offset] = value
+            symbolic = self._symbolic.get(number)
+            if symbolic:
+                symbolic.pop(offset, None)
+            return
+
+        if isinstance(value, BitVecRef) and value.size() != 8:
+            value = Extract(7, 0, value)
+        page[offset] = 0
+        self._symbolic.setdefault(number, {})[offset] = value
+
+
+def _get_extracted_word(values: List) -> Union[ExprRef, None]:
+    """
+    Checks whether bytes are the extracts of a single word, in order
+    :param values: 32 bytes
+    :return: The word, None if the bytes do not form a stored word
+    """
+    word = None
+    for i, value in enumerate(values):
+        if not is_app_of(value, Z3_OP_EXTRACT) or value.params() != [
+            255 - 8 * i,
+            248 - 8 * i,
+        ]:
+            return None
+        if word is None:
+            word = value.arg(0)
+            if word.size() != 256:
+                return None
+        elif not value.arg(0).eq(word):
+            return None
+    return word
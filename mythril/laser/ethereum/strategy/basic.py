@@ -1,8 +1,13 @@
 """
 This module implements basic symbolic execution search strategies
 """
+from mythril.laser.ethereum.coverage import Coverage
+from mythril.laser.ethereum.priority import DEPENDENCY_KINDS
 from mythril.laser.ethereum.state.global_state import GlobalState
 from typing import List
+from collections import defaultdict
+from heapq import heappop, heappush
+from itertools import count
 from random import randrange
 from . import BasicSearchStrategy
 
@@ -75,3 +80,123 @@ class ReturnWeightedRandomStrategy(BasicSearchStrategy):
         return self.work_list.pop(
             choices(range(len(self.work_list)), probability_distribution)[0]
         )
+
+
+class DependencyPriorityStrategy(BasicSearchStrategy):
+    """
+    Executes the state with the best score first, using a binary heap.
+    States are ranked by the Slither dependency kind of the branch they were deferred on (regular states first, then
+    RAW, WAR, WAW and RAR), then by whether they are about to execute an instruction that was not executed yet,
+    then by depth (deepest first) and last by recency.
+    """
+
+    def __init__(self, work_list, max_depth):
+        super().__init__(work_list, max_depth)
+        self._heap = []
+        self._counter = count()
+        self._visited = set()
+
+    def _get_location(self, global_state: GlobalState) -> tuple:
+        return global_state.environment.code.bytecode, global_state.mstate.pc
+
+    def _score(self, global_state: GlobalState, order: int) -> tuple:
+        if global_state.dependency_kind is None:
+            rank = 0
+        else:
+            rank = 1 + DEPENDENCY_KINDS.index(global_state.dependency_kind)
+        return (
+            rank,
+            self._get_location(global_state) in self._visited,
+            -global_state.mstate.depth,
+            order,
+        )
+
+    def get_strategic_global_state(self) -> GlobalState:
+        # New states are appended to the shared work list, they are moved to the heap before each pop
+        for global_state in self.work_list:
+            heappush(
+                self._heap,
+                (self._score(global_state, -next(self._counter)), global_state),
+            )
+        del self.work_list[:]
+
+        while True:
+            score, global_state = heappop(self._heap)
+            # Queued states lose the unexecuted instruction flag once another state executes their instruction
+            current_score = self._score(global_state, score[-1])
+            if current_score == score:
+                break
+            heappush(self._heap, (current_score, global_state))
+
+        self._visited.add(self._get_location(global_state))
+        return global_state
+
+
+class CoverageGuidedStrategy(BasicSearchStrategy):
+    """
+    Executes states whose basic block still has uncovered instructions first, using a binary heap.
+    States in saturated blocks follow, the ones in blocks that were entered less often first, so states that keep
+    looping through covered code wait for the rest. Ties are broken by depth (deepest first) and recency.
+    """
+
+    def __init__(self, work_list, max_depth, coverage: Coverage = None):
+        """
+        :param coverage: Instruction coverage of the LaserEVM
+        """
+        super().__init__(work_list, max_depth)
+        self.coverage = coverage if coverage is not None else Coverage()
+        self._heap = []
+        self._counter = count()
+        self._saturated = set()
+        self._visits = defaultdict(int)
+
+    def _get_block(self, global_state: GlobalState) -> tuple:
+        code = global_state.environment.code
+        try:
+            start, end = code.get_basic_block(global_state.mstate.pc)
+        except IndexError:
+            # The state ends its transaction
+            start = end = global_state.mstate.pc
+        return code.bytecode, start, end
+
+    def _is_saturated(self, block: tuple) -> bool:
+        if block in self._saturated:
+            return True
+        code, start, end = block
+        covered = self.coverage.get(code)
+        if covered is None:
+            return False
+        if covered.is_covered(start, end):
+            self._saturated.add(block)
+            return True
+        return False
+
+    def _score(self, global_state: GlobalState, order: int) -> tuple:
+        block = self._get_block(global_state)
+        # Visits count in powers of two, which bounds how often a queued state is re-scored
+        return (
+            self._is_saturated(block),
+            self._visits[block].bit_length(),
+            -global_state.mstate.depth,
+            order,
+        )
+
+    def get_strategic_global_state(self) -> GlobalState:
+        # New states are appended to the shared work list, they are moved to the heap before each pop
+        for global_state in self.work_list:
+            heappush(
+                self._heap,
+                (self._score(global_state, -next(self._counter)), global_state),
+            )
+        del self.work_list[:]
+
+        while True:
+            score, global_state = heappop(self._heap)
+            # Scores only get worse as coverage grows, stale entries are re-queued with their current score
+            current_score = self._score(global_state, score[-1])
+            if current_score == score:
+                break
+            heappush(self._heap, (current_score, global_state))
+
+        self._visits[self._get_block(global_state)] += 1
+        return global_state
@@ -1,6 +1,6 @@
 import logging
 from collections import defaultdict
-from typing import List, Tuple, Union, Callable, Dict
+from typing import List, Tuple, Union, Callable, Dict, Iterator
 from mythril.laser.ethereum.state.account import Account
 from mythril.laser.ethereum.state.world_state import WorldState
 from mythril.laser.ethereum.state.global_state import GlobalState
@@ -12,7 +12,16 @@ from mythril.laser.ethereum.transaction import (
 from mythril.laser.ethereum.evm_exceptions import StackUnderflowException
 from mythril.laser.ethereum.instructions import Instruction
 from mythril.laser.ethereum.cfg import NodeFlags, Node, Edge, JumpType
-from mythril.laser.ethereum.strategy.basic import DepthFirstSearchStrategy
+from mythril.laser.ethereum.context import EngineContext
+from mythril.laser.ethereum.coverage import Coverage
+from mythril.laser.ethereum.feasibility import FeasibilityCache
+from mythril.laser.ethereum.merging import get_merge_key, merge_states
+from mythril.laser.ethereum.priority import DependencyScheduler
+from mythril.laser.ethereum.simplification import simplification_cache
+from mythril.laser.ethereum.strategy.basic import (
+    CoverageGuidedStrategy,
+    DepthFirstSearchStrategy,
+)
 from datetime import datetime, timedelta
 from copy import copy
 from mythril.laser.ethereum.transaction import (
@@ -20,9 +29,7 @@ from mythril.laser.ethereum.transaction import (
     execute_message_call,
     heuristic_message_call
 )
-from functools import reduce
 from mythril.laser.ethereum.evm_exceptions import VmException
-from mythril.laser.ethereum.instructions import fallback_pointer
 
 
 class SVMError(Exception):
@@ -48,6 +55,13 @@ class LaserEVM:
         create_timeout=10,
         strategy=DepthFirstSearchStrategy,
         transaction_count=2,
+        prune_infeasible=False,
+        solver_timeout=None,
+        beam_width=None,
+        coverage_plateau=None,
+        merge_states=False,
+        loop_bound=None,
+        symbolic_memory=False,
     ):
         world_state = WorldState()
         world_state.accounts = accounts
@@ -55,40 +69,55 @@ class LaserEVM:
         self.world_state = world_state
         self.open_states = [world_state]
 
-        self.heuristic_branching = False
+        # Keccak results, node and transaction ids and the state of the heuristic search of this engine
+        self.context = EngineContext()
 
         self.nodes = {}
         self.edges = []
-        self.coverage = {}
+        self.coverage = Coverage()
 
         self.total_states = 0
         self.dynamic_loader = dynamic_loader
 
         self.work_list = []
         self.strategy = strategy(self.work_list, max_depth)
+        if isinstance(self.strategy, CoverageGuidedStrategy):
+            self.strategy.coverage = self.coverage
         self.max_depth = max_depth
+        # Number of times a state may take the same backward jump in a call frame, None for no limit
+        self.loop_bound = loop_bound
+        # Model MLOAD / MSTORE at symbolic offsets with Z3 arrays, see mythril.laser.ethereum.state.memory
+        self.symbolic_memory = symbolic_memory
         self.transaction_count = transaction_count
 
         self.execution_timeout = execution_timeout
+        # Number of executed states without new coverage after which a message call stops exploring
+        self.coverage_plateau = coverage_plateau
+        self._states_without_new_coverage = 0
+        self.callee_address = None
         self.create_timeout = create_timeout
 
+        # Solver backed pruning of unreachable JUMPI branches, cached per run
+        self.feasibility_cache = (
+            FeasibilityCache(timeout=solver_timeout) if prune_infeasible else None
+        )
+
         self.time = None
 
+        # Instruction objects are stateless between evaluations, so one is kept per opcode and context
+        self._instructions = {}
+
         self.pre_hooks = defaultdict(list)
         self.post_hooks = defaultdict(list)
 
-        self.first_order_work_list = ['RAW']
-        self.second_order_work_list = ['WAR']
-        self.third_order_work_list = ['WAW']
-        self.forth_order_work_list = ['RAR']
-        self.ranking = []
-
-        self.bad_bit = False
+        # Number of open states the heuristic search extends per transaction
+        self.beam_width = beam_width
 
-        self.first_work_list = []
-        self.second_work_list = []
-        self.third_work_list = []
-        self.forth_work_list = []
+        # States that jumped to a JUMPDEST wait there, by join point, until the strategy runs out of other states.
+        # States that reach the same join point in the meantime are merged into them.
+        self.merge_states = merge_states
+        self._merge_candidates = {}
+        self.merged_states = 0
 
         logging.info(
             "LASER EVM initialized with dynamic loader: " + str(dynamic_loader)
@@ -120,9 +149,11 @@ class LaserEVM:
     ) -> None:
         logging.debug("Starting LASER execution")
         self.time = datetime.now()
+        self.context.simplification_statistics = simplification_cache.statistics()
 
         if main_address:
             logging.info("Starting message call transaction to {}".format(main_address))
+            self.callee_address = main_address
             self._execute_transactions(main_address, priority)
 
         elif creation_code:
@@ -141,6 +172,7 @@ class LaserEVM:
                     "Increase the resources for creation execution (--max-depth or --create-timeout)"
                 )
 
+            self.callee_address = created_account.address
             self._execute_transactions(created_account.address, priority)
 
         logging.info("Finished symbolic execution")
@@ -151,12 +183,26 @@ class LaserEVM:
             self.total_states,
         )
         for code, coverage in self.coverage.items():
-            cov = (
-                reduce(lambda sum_, val: sum_ + 1 if val else sum_, coverage[1])
-                / float(coverage[0])
-                * 100
+            logging.info(
+                "Achieved {:.2f}% coverage for code: {}".format(
+                    coverage.percentage(), code
+                )
+            )
+        if self.feasibility_cache is not None:
+            logging.info(
+                "Feasibility checks: %d cache hits, %d solver queries",
+                self.feasibility_cache.hits,
+                self.feasibility_cache.misses,
             )
-            logging.info("Achieved {:.2f}% coverage for code: {}".format(cov, code))
+        hits, misses = self.context.get_simplification_statistics()
+        logging.info(
+            "Simplification cache: %d hits, %d misses, %.1f%% hit rate",
+            hits,
+            misses,
+            hits * 100.0 / (hits + misses) if hits + misses else 0.0,
+        )
+        if self.merge_states:
+            logging.info("Merged %d states", self.merged_states)
 
     def _execute_transactions(self, address, priority=None):
         """
@@ -164,9 +210,24 @@ class LaserEVM:
         :param address: Address of the contract
         :return:
         """
-        self.coverage = {}
-        for i in range(self.transaction_count):
-            initial_coverage = self._get_covered_instructions()
+        self.coverage.clear()
+        self.execute_message_calls(address, self.transaction_count, priority)
+
+    def execute_message_calls(self, address, transaction_count, priority=None):
+        """
+        Executes message call transactions on the current open states
+        :param address: Address of the contract
+        :param transaction_count: Number of transactions to execute
+        :param priority: Slither priority used by the heuristic search
+        """
+        scheduler = (
+            DependencyScheduler(priority, self.beam_width)
+            if priority is not None
+            else None
+        )
+
+        for i in range(transaction_count):
+            self.coverage.begin_transaction()
 
             self.time = datetime.now()
             logging.info("Starting message call transaction, iteration: {}".format(i))
@@ -174,27 +235,24 @@ class LaserEVM:
             if priority is None:
                 execute_message_call(self, address, priority)
             else:
-                heuristic_message_call(self, address, priority)
+                heuristic_message_call(self, address, priority, scheduler)
 
-            end_coverage = self._get_covered_instructions()
+            coverage_delta = self.coverage.end_transaction()
 
             logging.info(
                 "Number of new instructions covered in tx %d: %d"
-                % (i, end_coverage - initial_coverage)
+                % (i, sum(delta.count() for delta in coverage_delta.values()))
             )
 
     def _get_covered_instructions(self) -> int:
         """ Gets the total number of covered instructions for all accounts in the svm"""
-        total_covered_instructions = 0
-        for _, cv in self.coverage.items():
-            total_covered_instructions += reduce(
-                lambda sum_, val: sum_ + 1 if val else sum_, cv[1]
-            )
-        return total_covered_instructions
+        return self.coverage.total()
 
-    def exec(self, create=False, priority=None, title=None, laser_obj=None, track_gas=False) ->  Union[List[GlobalState], None]:
+    def exec(self, create=False, priority=None, title=None, track_gas=False) ->  Union[List[GlobalState], None]:
         final_states = []
-        for global_state in self.strategy:
+        self._states_without_new_coverage = 0
+        self._merge_candidates.clear()
+        for global_state in self._iterate_states():
             if self.execution_timeout and not create:
                 if self.time + timedelta(seconds=self.execution_timeout) <= datetime.now():
                     print('############################execution_timeout timeout#######################')
@@ -205,17 +263,27 @@ class LaserEVM:
                     print('############################creation timeout#######################')
                     return final_states + [global_state] if track_gas else None
 
+            if self.coverage_plateau and not create:
+                if self._states_without_new_coverage >= self.coverage_plateau:
+                    logging.info(
+                        "Coverage plateaued, no new instructions covered in %d states",
+                        self._states_without_new_coverage,
+                    )
+                    return final_states + [global_state] if track_gas else None
+                self._states_without_new_coverage += 1
+
             try:
-                new_states, op_code = self.execute_state(global_state, priority, title, laser_obj=laser_obj)
+                new_states, op_code = self.execute_state(global_state, priority, title)
             except NotImplementedError:
                 logging.debug("Encountered unimplemented instruction")
                 continue
-            self.manage_cfg(op_code, new_states)
 
-            # when end of transac is raised, new states are added to self.open_states, but not in the work_list
-            if self.bad_bit:
-                new_states.pop()
-                self.bad_bit = False
+            if self.merge_states and op_code in ("JUMP", "JUMPI"):
+                new_states = self._merge_new_states(op_code, new_states)
+                self.manage_cfg(op_code, new_states)
+                new_states = self._add_merge_candidates(new_states)
+            else:
+                self.manage_cfg(op_code, new_states)
 
             if new_states:
                 self.work_list += new_states
@@ -226,21 +294,21 @@ class LaserEVM:
         return final_states if track_gas else None
 
     def execute_state(
-        self, global_state: GlobalState, priority=None, title=None, laser_obj=None
+        self, global_state: GlobalState, priority=None, title=None
     ) -> Tuple[List[GlobalState], Union[str, None]]:
         instructions = global_state.environment.code.instruction_list
         try:
             op_code = instructions[global_state.mstate.pc]["opcode"]
         except IndexError:
-            self.open_states.append(global_state.world_state)
+            self.open_states.append(global_state.writable_world_state())
             return [], None
 
         self._execute_pre_hook(op_code, global_state)
         try:
             self._measure_coverage(global_state)
-            new_global_states = Instruction(op_code, self.dynamic_loader, priority, title, laser_obj).evaluate(
-                global_state
-            )
+            new_global_states = self._get_instruction(
+                op_code, priority, title
+            ).evaluate(global_state)
 
         except VmException as e:
             transaction, return_global_state = global_state.transaction_stack.pop()
@@ -271,7 +339,9 @@ class LaserEVM:
                 global_state.transaction_stack
             ) + [(start_signal.transaction, global_state)]
             new_global_state.node = global_state.node
-            new_global_state.mstate.constraints = global_state.mstate.constraints
+            new_global_state.mstate.constraints = (
+                global_state.mstate.writable_constraints()
+            )
 
             return [new_global_state], op_code
 
@@ -286,8 +356,9 @@ class LaserEVM:
                     not isinstance(transaction, ContractCreationTransaction)
                     or transaction.return_data
                 ) and not end_signal.revert:
-                    end_signal.global_state.world_state.node = global_state.node
-                    self.open_states.append(end_signal.global_state.world_state)
+                    world_state = end_signal.global_state.writable_world_state()
+                    world_state.node = global_state.node
+                    self.open_states.append(world_state)
                 new_global_states = []
             else:
                 # First execute the post hook for the transaction ending instruction
@@ -304,6 +375,24 @@ class LaserEVM:
 
         return new_global_states, op_code
 
+    def _get_instruction(self, op_code: str, priority=None, title=None) -> Instruction:
+        """
+        Gets the Instruction that executes op_code, creating it on first use
+        :param op_code: Name of the opcode
+        :param priority: Slither priority of the current run
+        :param title: Title of the contract that is being analyzed
+        :return: Instruction for op_code in this context
+        """
+        key = (op_code, id(priority), title)
+        try:
+            return self._instructions[key]
+        except KeyError:
+            instruction = Instruction(
+                op_code, self.dynamic_loader, priority, title, self
+            )
+            self._instructions[key] = instruction
+            return instruction
+
     def _end_message_call(
         self,
         return_global_state: GlobalState,
@@ -325,7 +414,7 @@ class LaserEVM:
             ]
 
         # Execute the post instruction handler
-        new_global_states = Instruction(op_code, self.dynamic_loader).evaluate(
+        new_global_states = self._get_instruction(op_code).evaluate(
             return_global_state, True
         )
 
@@ -335,18 +424,69 @@ class LaserEVM:
 
         return new_global_states
 
-    def _measure_coverage(self, global_state: GlobalState) -> None:
-        code = global_state.environment.code.bytecode
-        number_of_instructions = len(global_state.environment.code.instruction_list)
-        instruction_index = global_state.mstate.pc
-
-        if code not in self.coverage.keys():
-            self.coverage[code] = [
-                number_of_instructions,
-                [False] * number_of_instructions,
-            ]
+    def _merge_new_states(
+        self, op_code: str, new_states: List[GlobalState]
+    ) -> List[GlobalState]:
+        """
+        Merges the states that a jump led to into pending states at the same join point
+        :param op_code: JUMP or JUMPI
+        :param new_states: States after the jump
+        :return: The states that could not be merged
+        """
+        remaining_states = []
+        for state in new_states:
+            target = self._merge_candidates.get(get_merge_key(state))
+            if target is None or not merge_states(target, state):
+                remaining_states.append(state)
+                continue
 
-        self.coverage[code][1][instruction_index] = True
+            if op_code == "JUMPI":
+                edge_type = JumpType.CONDITIONAL
+                condition = state.mstate.constraints[-1]
+            else:
+                edge_type, condition = JumpType.UNCONDITIONAL, None
+            self.edges.append(
+                Edge(
+                    state.node.uid,
+                    target.node.uid,
+                    edge_type=edge_type,
+                    condition=condition,
+                )
+            )
+            self.merged_states += 1
+        return remaining_states
+
+    def _add_merge_candidates(self, new_states: List[GlobalState]) -> List[GlobalState]:
+        """
+        Holds back the states that reached a join point, so that other paths can be merged into them
+        :param new_states: States after the jump that were not merged
+        :return: The states that continue right away
+        """
+        remaining_states = []
+        for state in new_states:
+            key = get_merge_key(state)
+            if (
+                key is None
+                or key in self._merge_candidates
+                or state.mstate.depth >= self.max_depth
+            ):
+                remaining_states.append(state)
+            else:
+                self._merge_candidates[key] = state
+        return remaining_states
+
+    def _iterate_states(self) -> Iterator[GlobalState]:
+        """ Iterates over the states of the strategy, resuming the held back states whenever it runs out of states"""
+        while True:
+            yield from self.strategy
+            if not self._merge_candidates:
+                return
+            self.work_list += self._merge_candidates.values()
+            self._merge_candidates.clear()
+
+    def _measure_coverage(self, global_state: GlobalState) -> None:
+        if self.coverage.mark(global_state.environment.code, global_state.mstate.pc):
+            self._states_without_new_coverage = 0
 
     def manage_cfg(self, opcode: str, new_states: List[GlobalState]) -> None:
         if opcode == "JUMP":
@@ -386,10 +526,13 @@ class LaserEVM:
     def _new_node_state(
         self, state: GlobalState, edge_type=JumpType.UNCONDITIONAL, condition=None
     ) -> None:
-        new_node = Node(state.environment.active_account.contract_name)
+        new_node = Node(
+            state.environment.active_account.contract_name,
+            uid=self.context.get_next_node_uid(),
+        )
         old_node = state.node
         state.node = new_node
-        new_node.constraints = state.mstate.constraints
+        new_node.constraints = copy(state.mstate.constraints)
         self.nodes[new_node.uid] = new_node
         self.edges.append(
             Edge(old_node.uid, new_node.uid, edge_type=edge_type, condition=condition)
@@ -423,7 +566,7 @@ class LaserEVM:
                 + ":"
                 + new_node.function_name
             )
-        elif address == 0 or address == fallback_pointer:
+        elif address == 0 or address == self.context.fallback_pointer:
             environment.active_function_name = "fallback"
 
         new_node.function_name = environment.active_function_name
@@ -2,7 +2,6 @@ from typing import List, Union
 from mythril.laser.ethereum.transaction.transaction_models import (
     MessageCallTransaction,
     ContractCreationTransaction,
-    get_next_transaction_id,
 )
 from z3 import BitVec
 from mythril.laser.ethereum.state.environment import Environment
@@ -32,7 +31,7 @@ def execute_message_call(
     del laser_evm.open_states[:]
 
     for open_world_state in open_states:
-        next_transaction_id = get_next_transaction_id()
+        next_transaction_id = laser_evm.context.get_next_transaction_id()
         transaction = MessageCallTransaction(
             world_state=open_world_state,
             identifier=next_transaction_id,
@@ -58,7 +57,10 @@ def _setup_global_state_for_execution(laser_evm, transaction) -> None:
     global_state = transaction.initial_global_state()
     global_state.transaction_stack.append((transaction, None))
 
-    new_node = Node(global_state.environment.active_account.contract_name)
+    new_node = Node(
+        global_state.environment.active_account.contract_name,
+        uid=laser_evm.context.get_next_node_uid(),
+    )
 
     laser_evm.nodes[new_node.uid] = new_node
     if transaction.world_state.node:
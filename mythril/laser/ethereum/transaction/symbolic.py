@@ -5,6 +5,7 @@ from copy import copy, deepcopy
 
 from mythril.disassembler.disassembly import Disassembly
 from mythril.laser.ethereum.cfg import Node, Edge, JumpType
+from mythril.laser.ethereum.priority import DependencyScheduler
 from mythril.laser.ethereum.state.calldata import (
     CalldataType,
     BaseCalldata,
@@ -14,89 +15,42 @@ from mythril.laser.ethereum.state.account import Account
 from mythril.laser.ethereum.transaction.transaction_models import (
     MessageCallTransaction,
     ContractCreationTransaction,
-    get_next_transaction_id,
 )
 
 CREATOR_ADDRESS = 0xAFFEAFFEAFFEAFFEAFFEAFFEAFFEAFFEAFFEAFFE
 ATTACKER_ADDRESS = 0xDEADBEEFDEADBEEFDEADBEEFDEADBEEFDEADBEEF
 
 
-def heuristic_message_call(laser_evm, callee_address: str, priority=None):
-    if len(laser_evm.open_states) > 0 and len(laser_evm.open_states[0].transaction_sequence) == 2:
-        heuristic_message_call_helper(laser_evm, callee_address, priority)
+def heuristic_message_call(
+    laser_evm, callee_address: str, priority=None, scheduler=None
+):
+    if len(laser_evm.open_states) > 0 and len(laser_evm.open_states[0].transaction_sequence) >= 2:
+        heuristic_message_call_helper(
+            laser_evm,
+            callee_address,
+            priority,
+            scheduler or DependencyScheduler(priority),
+        )
     else:
         execute_message_call(laser_evm, callee_address, priority)
 
 
-def heuristic_message_call_helper(laser_evm, callee_address: str, priority=None):
-    jump = False
-
-    open_states_copy = copy(laser_evm.open_states)
-
-    for open_state in open_states_copy:
-        name = open_state.node.function_name
-
-        for priority_list in priority['RAW']:
-            if name == priority_list.first.function_name:
-                laser_evm.first_order_work_list.append(open_state)
-                laser_evm.open_states.remove(open_state)
-                jump = True
-                break
-
-        if jump:
-            jump = False
-            continue
-
-        for priority_list in priority['WAR']:
-            if name == priority_list.first.function_name:
-                laser_evm.second_order_work_list.append(open_state)
-                laser_evm.open_states.remove(open_state)
-                jump = True
-                break
-
-        if jump:
-            jump = False
-            continue
-
-        for priority_list in priority['WAW']:
-            if name == priority_list.first.function_name:
-                laser_evm.third_order_work_list.append(open_state)
-                laser_evm.open_states.remove(open_state)
-                jump = True
-                break
-
-        if jump:
-            jump = False
-            continue
-
-        for priority_list in priority['RAR']:
-            if name == priority_list.first.function_name:
-                laser_evm.forth_order_work_list.append(open_state)
-                laser_evm.open_states.remove(open_state)
-                jump = True
-                break
-        if jump:
-            jump = False
-            continue
-
-    laser_evm.ranking.append(laser_evm.first_order_work_list)
-    laser_evm.ranking.append(laser_evm.second_order_work_list)
-    laser_evm.ranking.append(laser_evm.third_order_work_list)
-    laser_evm.ranking.append(laser_evm.forth_order_work_list)
+def heuristic_message_call_helper(
+    laser_evm, callee_address: str, priority, scheduler
+):
+    schedule = scheduler.schedule(laser_evm.open_states)
 
     del laser_evm.open_states[:]
 
-    for items in laser_evm.ranking:
-        title = items[0]
-        list1 = items[1:]
+    for title, open_states in schedule:
 
-        for open_world_state in list1:
+        for open_world_state in open_states:
             if open_world_state[callee_address].deleted:
                 debug("Can not execute dead contract, skipping.")
                 continue
 
             last_func_called = open_world_state.node.function_name
-            next_transaction_id = get_next_transaction_id()
+            next_transaction_id = laser_evm.context.get_next_transaction_id()
             transaction = MessageCallTransaction(
                 world_state=open_world_state,
                 callee_account=open_world_state[callee_address],
@@ -112,22 +66,7 @@ def heuristic_message_call_helper(laser_evm, callee_address: str, priority=None)
 
             # the open states from last iterations are appended to work list here
             _setup_global_state_for_execution(laser_evm, transaction, last_func_called)
-        laser_evm.exec(priority=priority, title=title, laser_obj=laser_evm)
-
-        # Execute the new open states added to the work list in Instruction.jumpi_ function
-
-        if title == 'RAW':
-            for gs in laser_evm.second_work_list:
-                laser_evm.work_list.append(gs)
-            laser_evm.exec(priority=priority, title=title, laser_obj=laser_evm)
-        elif title == 'WAR':
-            for gs in laser_evm.third_work_list:
-                laser_evm.work_list.append(gs)
-            laser_evm.exec(priority=priority, title=title, laser_obj=laser_evm)
-        elif title == 'WAW':
-            for gs in laser_evm.forth_work_list:
-                laser_evm.work_list.append(gs)
-            laser_evm.exec(priority=priority, title=title, laser_obj=laser_evm)
+        laser_evm.exec(priority=priority, title=title)
 
 
 def execute_message_call(laser_evm, callee_address: str, priority=None) -> None:
@@ -146,7 +85,7 @@ def execute_message_call(laser_evm, callee_address: str, priority=None) -> None:
             debug("Can not execute dead contract, skipping.")
             continue
 
-        next_transaction_id = get_next_transaction_id()
+        next_transaction_id = laser_evm.context.get_next_transaction_id()
         transaction = MessageCallTransaction(
             world_state=open_world_state,
             identifier=next_transaction_id,
@@ -181,7 +120,7 @@ def execute_contract_creation(
         new_account.contract_name = contract_name
 
     for open_world_state in open_states:
-        next_transaction_id = get_next_transaction_id()
+        next_transaction_id = laser_evm.context.get_next_transaction_id()
         transaction = ContractCreationTransaction(
             world_state=open_world_state,
             identifier=next_transaction_id,
@@ -207,7 +146,10 @@ def _setup_global_state_for_execution(laser_evm, transaction, last_func_called=N
     global_state = transaction.initial_global_state(last_func_called=last_func_called)
     global_state.transaction_stack.append((transaction, None))
 
-    new_node = Node(global_state.environment.active_account.contract_name)
+    new_node = Node(
+        global_state.environment.active_account.contract_name,
+        uid=laser_evm.context.get_next_node_uid(),
+    )
 
     laser_evm.nodes[new_node.uid] = new_node
     if transaction.world_state.node:
@@ -220,10 +162,12 @@ def _setup_global_state_for_execution(laser_evm, transaction, last_func_called=N
             )
         )
 
-        global_state.mstate.constraints += transaction.world_state.node.constraints
-        new_node.constraints = global_state.mstate.constraints
+        global_state.mstate.writable_constraints().extend(
+            transaction.world_state.node.constraints
+        )
+        new_node.constraints = copy(global_state.mstate.constraints)
 
-    global_state.world_state.transaction_sequence.append(transaction)
+    global_state.writable_world_state().transaction_sequence.append(transaction)
     global_state.node = new_node
     new_node.states.append(global_state)
     laser_evm.work_list.append(global_state)
@@ -11,15 +11,16 @@ from mythril.laser.ethereum.state.account import Account
 from mythril.laser.ethereum.state.world_state import WorldState
 from mythril.laser.ethereum.state.global_state import GlobalState
 from z3 import BitVec, ExprRef
+from itertools import count
 import array
 
-_next_transaction_id = 0
+# Ids of transactions that are created outside of an engine, engines number their transactions through their
+# EngineContext
+_standalone_transaction_ids = count(1)
 
 
 def get_next_transaction_id() -> int:
-    global _next_transaction_id
-    _next_transaction_id += 1
-    return _next_transaction_id
+    return next(_standalone_transaction_ids)
 
 
 class TransactionEndSignal(Exception):
@@ -168,6 +169,6 @@ class ContractCreationTransaction(BaseTransaction):
 
         global_state.environment.active_account.code = Disassembly(contract_code)
         self.return_data = global_state.environment.active_account.address
-        assert global_state.environment.active_account.code.instruction_list != []
+        assert len(global_state.environment.active_account.code.instruction_list) > 0
 
         raise TransactionEndSignal(global_state, revert=revert)
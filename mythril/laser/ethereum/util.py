@@ -5,6 +5,8 @@ from typing import Union, List, Dict
 
 import sha3 as _sha3
 
+from mythril.laser.ethereum.simplification import simplify
+
 
 TT256 = 2 ** 256
 TT256M1 = 2 ** 256 - 1
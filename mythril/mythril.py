@@ -7,6 +7,7 @@
 
 import sys
 import os
+import sqlite3
 
 from mythril.disassembler.disassembly import MappingObj
 
@@ -17,7 +18,6 @@ from mythril.disassembler.disassembly import MappingObj
 #sys.path.insert(0, path2)
 #print(sys.path)
 
-from slither import slither
 
 import logging
 import re
@@ -35,7 +35,11 @@ from mythril.solidity.soliditycontract import SolidityContract, get_contracts_fr
 from mythril.ethereum.interface.rpc.client import EthJsonRpc
 from mythril.ethereum.interface.rpc.exceptions import ConnectionError
 from mythril.support import signatures
+from mythril.support.signature_pack import build_signature_pack, read_signature_dump
 from mythril.support.truffle import analyze_truffle_project
+from mythril.support.batch import analyze_batch, get_batch_targets
+from mythril.support.daemon import AnalysisDaemon, serve
+from mythril.support.slither_cache import SlitherCache
 from mythril.support.loader import DynLoader
 from mythril.exceptions import CompilerError, NoContractFoundError, CriticalError
 from mythril.analysis.symbolic import SymExecWrapper
@@ -129,6 +133,9 @@ class Mythril(object):
         )
 
         self.solc_binary = self._init_solc_binary(solv)
+        self.slither_cache = SlitherCache(
+            os.path.join(self.mythril_dir, "slither_cache"), self.solc_binary
+        )
         self.config_path = os.path.join(self.mythril_dir, "config.ini")
         self.leveldb_dir = self._init_config()
 
@@ -230,6 +237,36 @@ class Mythril(object):
             self.sigs, *args, **kwargs
         )  # just passthru by passing signatures for now
 
+    def analyze_batch(self, path, **kwargs):
+        """
+        Analyzes all contracts of a directory or manifest file in worker processes
+        :param path: Directory or manifest file, see get_batch_targets
+        :param kwargs: Options of analyze_batch and Mythril.fire_lasers
+        :return: Iterator over the result of each contract, in the order in which they finish
+        """
+        return analyze_batch(self, get_batch_targets(path), **kwargs)
+
+    def serve_daemon(self, address, **kwargs):
+        """
+        Serves analysis requests until the process is interrupted
+        :param address: HOST:PORT or path of a Unix socket, see mythril.support.daemon.create_server
+        :param kwargs: Options of AnalysisDaemon and Mythril.fire_lasers
+        """
+        serve(AnalysisDaemon(self, **kwargs), address)
+
+    def build_signature_pack(self, dump):
+        """
+        Builds the signature pack that is consulted before the signature database
+        :param dump: Signature database or text file with a selector and text signature per line
+        :return: Number of signatures in the pack
+        """
+        try:
+            count = build_signature_pack(read_signature_dump(dump), self.sigs.pack_path)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            raise CriticalError("Could not build signature pack: {}".format(e))
+        logging.info("Wrote %d signatures to %s", count, self.sigs.pack_path)
+        return count
+
     @staticmethod
     def _init_solc_binary(version):
         # Figure out solc binary and version
@@ -468,7 +505,13 @@ class Mythril(object):
         execution_timeout=None,
         create_timeout=None,
         transaction_count=2,
-        enable_iprof=False
+        enable_iprof=False,
+        prune_infeasible=False,
+        solver_timeout=None,
+        coverage_plateau=None,
+        merge_states=False,
+        loop_bound=3,
+        symbolic_memory=False,
     ):
         """
         :param strategy:
@@ -493,7 +536,13 @@ class Mythril(object):
             max_depth=max_depth,
             execution_timeout=execution_timeout,
             create_timeout=create_timeout,
-            transaction_count=transaction_count
+            transaction_count=transaction_count,
+            prune_infeasible=prune_infeasible,
+            solver_timeout=solver_timeout,
+            coverage_plateau=coverage_plateau,
+            merge_states=merge_states,
+            loop_bound=loop_bound,
+            symbolic_memory=symbolic_memory,
         )
         return generate_graph(sym, physics=enable_physics, phrackify=phrackify)
 
@@ -507,7 +556,14 @@ class Mythril(object):
         phrackify=False,
         execution_timeout=None,
         create_timeout=None,
-        file=None
+        file=None,
+        prune_infeasible=False,
+        solver_timeout=None,
+        coverage_plateau=None,
+        merge_states=False,
+        loop_bound=3,
+        symbolic_memory=False,
+        beam_width=None,
     ):
         priority = self.parse_slither(contract=contract, file=file[0])
 
@@ -523,7 +579,14 @@ class Mythril(object):
             max_depth=max_depth,
             execution_timeout=execution_timeout,
             create_timeout=create_timeout,
-            priority=priority
+            priority=priority,
+            prune_infeasible=prune_infeasible,
+            solver_timeout=solver_timeout,
+            coverage_plateau=coverage_plateau,
+            merge_states=merge_states,
+            loop_bound=loop_bound,
+            symbolic_memory=symbolic_memory,
+            beam_width=beam_width,
         )
         return generate_graph(sym, physics=enable_physics, phrackify=phrackify)
 
@@ -538,7 +601,15 @@ class Mythril(object):
         transaction_count=None,
         modules=None,
         verbose_report=False,
-        file=None):
+        file=None,
+        prune_infeasible=False,
+        solver_timeout=None,
+        coverage_plateau=None,
+        merge_states=False,
+        loop_bound=3,
+        symbolic_memory=False,
+        beam_width=None,
+    ):
 
         all_issues = []
         for contract in contracts or self.contracts:
@@ -556,7 +627,14 @@ class Mythril(object):
                 execution_timeout=execution_timeout,
                 create_timeout=create_timeout,
                 priority=priority,
-                transaction_count=transaction_count
+                transaction_count=transaction_count,
+                prune_infeasible=prune_infeasible,
+                solver_timeout=solver_timeout,
+                coverage_plateau=coverage_plateau,
+                merge_states=merge_states,
+                loop_bound=loop_bound,
+                symbolic_memory=symbolic_memory,
+                beam_width=beam_width,
             )
 
             issues = fire_lasers(sym, modules)
@@ -576,8 +654,7 @@ class Mythril(object):
 
         return report
 
-    @staticmethod
-    def parse_slither(contract=None, file=None):
+    def parse_slither(self, contract=None, file=None):
         if file is None:
             print('file is not specified for slither')
             return None
@@ -586,33 +663,23 @@ class Mythril(object):
             print('contract cannot be none for slither')
             return None
 
-        slither_contract = []
-
         try:
-            slither_obj = slither.Slither(file)
-            slither_contract = slither_obj.get_contract_from_name(contract.name)
+            dependencies = self.slither_cache.get_dependencies(file, contract.name)
         except:
             print("Slither error, cannot analyze dependency")
             return None
 
+        if dependencies is None:
+            print("Slither error, cannot analyze dependency")
+            return None
 
         functions_writing_a = {}
         functions_reading_a = {}
 
-        # Slither objects
-        variables = slither_contract.get_all_state_variables()
-        for variable in variables:
-            if variable not in functions_writing_a:
-                functions_writing_a[variable] = set()
-            for func in slither_contract.get_functions_writing_to_variable_including_internal_call(variable):
-                if func not in functions_writing_a[variable]:
-                    functions_writing_a[variable].add(func)
-
-            if variable not in functions_reading_a:
-                functions_reading_a[variable] = set()
-            for func in slither_contract.get_functions_reading_from_variable_including_internal_call(variable):
-                if func not in functions_reading_a[variable]:
-                    functions_reading_a[variable].add(func)
+        # Dependencies computed by Slither, keyed on the position of the state variable
+        for variable, (_, writers, readers) in enumerate(dependencies):
+            functions_writing_a[variable] = writers
+            functions_reading_a[variable] = readers
 
         writing_obj_list = {}
         reading_obj_list = {}
@@ -621,11 +688,11 @@ class Mythril(object):
         for wt_key, wt_value in functions_writing_a.items():
             if wt_key not in writing_obj_list:
                 writing_obj_list[wt_key] = set()
-            for item in wt_value:
-                if item.full_name in contract.disassembly.slither_mappings_dict:
-                    writing_obj_list[wt_key].add(contract.disassembly.slither_mappings_dict[item.full_name])
+            for full_name in wt_value:
+                if full_name in contract.disassembly.slither_mappings_dict:
+                    writing_obj_list[wt_key].add(contract.disassembly.slither_mappings_dict[full_name])
 
-                if item.full_name == "fallback()":
+                if full_name == "fallback()":
                     temp = MappingObj('fallback', '0x0000000', 0)
                     writing_obj_list[wt_key].add(temp)
 
@@ -633,11 +700,11 @@ class Mythril(object):
         for rd_key, rd_value in functions_reading_a.items():
             if rd_key not in reading_obj_list:
                 reading_obj_list[rd_key] = set()
-            for item in rd_value:
-                if item.full_name in contract.disassembly.slither_mappings_dict:
-                    reading_obj_list[rd_key].add(contract.disassembly.slither_mappings_dict[item.full_name])
+            for full_name in rd_value:
+                if full_name in contract.disassembly.slither_mappings_dict:
+                    reading_obj_list[rd_key].add(contract.disassembly.slither_mappings_dict[full_name])
 
-                if item.full_name == "fallback()":
+                if full_name == "fallback()":
                     temp = MappingObj('fallback', '0x0000000', 0)
                     reading_obj_list[rd_key].add(temp)
 
@@ -705,6 +772,13 @@ class Mythril(object):
         execution_timeout=None,
         create_timeout=None,
         transaction_count=None,
+        prune_infeasible=False,
+        solver_timeout=None,
+        coverage_plateau=None,
+        merge_states=False,
+        loop_bound=3,
+        symbolic_memory=False,
+        workers=1,
     ):
 
         all_issues = []
@@ -722,6 +796,14 @@ class Mythril(object):
                 execution_timeout=execution_timeout,
                 create_timeout=create_timeout,
                 transaction_count=transaction_count,
+                prune_infeasible=prune_infeasible,
+                solver_timeout=solver_timeout,
+                coverage_plateau=coverage_plateau,
+                merge_states=merge_states,
+                loop_bound=loop_bound,
+                symbolic_memory=symbolic_memory,
+                workers=workers,
+                modules=modules or (),
             )
 
             issues = fire_lasers(sym, modules)
@@ -1,4 +1,3 @@
-import mythril.laser.ethereum.util as helper
 from mythril.ethereum.evmcontract import EVMContract
 from mythril.ethereum.util import get_solc_json
 from mythril.exceptions import NoContractFoundError
@@ -103,7 +102,7 @@ class SolidityContract(EVMContract):
     def get_source_info(self, address, constructor=False):
         disassembly = self.creation_disassembly if constructor else self.disassembly
         mappings = self.constructor_mappings if constructor else self.mappings
-        index = helper.get_instruction_index(disassembly.instruction_list, address)
+        index = disassembly.get_instruction_index(address)
         solidity_file = self.solidity_files[mappings[index].solidity_file_idx]
 
         filename = solidity_file.filename
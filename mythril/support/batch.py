@@ -0,0 +1,171 @@
+import os
+import sys
+import time
+import logging
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Dict, Iterator, List
+
+from mythril.exceptions import CriticalError
+
+SOURCE_EXTENSIONS = (".sol",)
+BYTECODE_EXTENSIONS = (".o", ".bin", ".hex")
+
+
+def get_batch_targets(path: str) -> List[str]:
+    """
+    Collects the contracts of a batch
+    :param path: A directory that is searched for Solidity and bytecode files, or a manifest file that lists one
+        contract file per line (relative paths are resolved against the manifest, lines starting with # are ignored)
+    :return: Paths of the contract files
+    """
+    path = os.path.expanduser(path)
+    if os.path.isdir(path):
+        targets = []
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.endswith(SOURCE_EXTENSIONS + BYTECODE_EXTENSIONS):
+                    targets.append(os.path.join(root, filename))
+        return targets
+
+    try:
+        with open(path) as manifest:
+            lines = [line.strip() for line in manifest]
+    except FileNotFoundError:
+        raise CriticalError("Batch input not found: " + path)
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    return [
+        os.path.join(base_dir, os.path.expanduser(line))
+        for line in lines
+        if line and not line.startswith("#")
+    ]
+
+
+def analyze_batch(
+    mythril,
+    targets,
+    workers=1,
+    timeout=None,
+    memory_limit=None,
+    bin_runtime=False,
+    **analysis_options
+) -> Iterator[Dict]:
+    """
+    Analyzes many contracts in a pool of worker processes, one process per contract, so that a crashing or
+    runaway analysis only loses its own result.
+    :param mythril: Configured Mythril instance, inherited by the forked workers
+    :param targets: Paths of the contract files
+    :param workers: Number of contracts analyzed at the same time
+    :param timeout: Wall clock seconds after which the analysis of a contract is killed
+    :param memory_limit: Address space limit per worker in megabytes
+    :param bin_runtime: Consider bytecode files as runtime code instead of creation code
+    :param analysis_options: Keyword arguments passed to Mythril.fire_lasers
+    :return: Iterator over one result per contract, in the order in which they finish. A result holds the file,
+        success, error and issues fields of the JSON report
+    """
+    context = multiprocessing.get_context("fork")
+    pending = deque(targets)
+    running = {}
+
+    while pending or running:
+        while pending and len(running) < workers:
+            target = pending.popleft()
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_analyze_target,
+                args=(
+                    mythril,
+                    target,
+                    sender,
+                    memory_limit,
+                    bin_runtime,
+                    analysis_options,
+                ),
+            )
+            process.start()
+            sender.close()
+            running[receiver] = (process, target, time.time())
+
+        ready = wait(list(running), timeout=1)
+
+        for receiver in list(running):
+            process, target, start = running[receiver]
+            if receiver in ready:
+                try:
+                    result = receiver.recv()
+                except EOFError:
+                    process.join()
+                    result = _error_result(
+                        target, "Worker exited with code {}".format(process.exitcode)
+                    )
+            elif timeout is not None and time.time() - start > timeout:
+                process.terminate()
+                result = _error_result(
+                    target, "Analysis timed out after {} seconds".format(timeout)
+                )
+            else:
+                continue
+
+            process.join()
+            receiver.close()
+            del running[receiver]
+            yield result
+
+
+def limit_memory(memory_limit: int) -> None:
+    """
+    Limits the address space of the current process
+    :param memory_limit: Limit in megabytes, None for no limit
+    """
+    if memory_limit is not None:
+        import resource
+
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _error_result(target: str, error: str) -> Dict:
+    logging.error("Batch analysis of %s failed: %s", target, error)
+    return {"file": target, "success": False, "error": error, "issues": []}
+
+
+def _analyze_target(
+    mythril, target, connection, memory_limit, bin_runtime, analysis_options
+) -> None:
+    """ Worker entry point: analyzes a single contract file and sends the result through connection"""
+    # Keep the JSON lines stream of the parent clean
+    sys.stdout = open(os.devnull, "w")
+
+    limit_memory(memory_limit)
+
+    try:
+        mythril.contracts = []
+        if target.endswith(SOURCE_EXTENSIONS):
+            address, contracts = mythril.load_from_solidity([target])
+        else:
+            with open(target) as code_file:
+                code = "".join(line.strip() for line in code_file)
+            code = code[2:] if code.startswith("0x") else code
+            address, contract = mythril.load_from_bytecode(code, bin_runtime)
+            contracts = [contract]
+
+        if not contracts:
+            raise CriticalError("input file does not contain any valid contracts")
+
+        report = mythril.fire_lasers(
+            contracts=contracts, address=address, **analysis_options
+        )
+        result = {
+            "file": target,
+            "success": True,
+            "error": None,
+            "issues": report.sorted_issues(),
+        }
+    except Exception as e:
+        result = {"file": target, "success": False, "error": str(e), "issues": []}
+
+    connection.send(result)
+    connection.close()
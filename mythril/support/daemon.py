@@ -0,0 +1,362 @@
+import os
+import sys
+import json
+import shutil
+import signal
+import hashlib
+import logging
+import tempfile
+import threading
+import multiprocessing
+import socketserver
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List, Tuple
+
+from mythril.analysis.security import get_detection_modules
+from mythril.exceptions import CriticalError
+from mythril.support.batch import limit_memory
+
+# Keyword arguments of Mythril.fire_lasers that a request may override
+ANALYSIS_OPTIONS = (
+    "strategy",
+    "modules",
+    "max_depth",
+    "execution_timeout",
+    "create_timeout",
+    "transaction_count",
+    "prune_infeasible",
+    "solver_timeout",
+    "coverage_plateau",
+    "merge_states",
+    "loop_bound",
+    "symbolic_memory",
+)
+# Number of loaded inputs whose contracts are kept
+CONTRACT_CACHE_SIZE = 256
+
+
+class AnalysisDaemon:
+    """
+    Analysis service that keeps a configured Mythril instance warm between requests.
+
+    Inputs are compiled and disassembled in the daemon process, so that the compiled contracts, the signature
+    database and the Slither dependencies stay cached for later requests of the same input. Every analysis runs in
+    a process forked from the daemon, which inherits the loaded modules and caches without copying them, and at
+    most `workers` analyses run at the same time.
+    """
+
+    def __init__(
+        self, mythril, workers=1, timeout=None, memory_limit=None, **analysis_options
+    ):
+        """
+        Constructor for AnalysisDaemon
+        :param mythril: Configured Mythril instance
+        :param workers: Number of analyses that run at the same time
+        :param timeout: Wall clock seconds after which an analysis is killed
+        :param memory_limit: Address space limit per analysis in megabytes
+        :param analysis_options: Default keyword arguments of Mythril.fire_lasers
+        """
+        self.mythril = mythril
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.analysis_options = analysis_options
+
+        self._slots = threading.BoundedSemaphore(workers)
+        # Mythril instances are not thread safe, loading inputs is serialized
+        self._lock = threading.Lock()
+        # Input key -> (address, contracts, source file)
+        self._contracts = OrderedDict()
+        self._source_dir = tempfile.mkdtemp(prefix="mythril-daemon-")
+
+        self.analyses = 0
+        self.running = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Import the detection modules once, the analysis processes inherit them
+        for entrypoint in ("callback", "post"):
+            get_detection_modules(entrypoint)
+
+    def analyze(self, request: Dict) -> Dict:
+        """
+        Analyzes the input of a request
+        :param request: Either "code", hex-encoded creation code or runtime code if "bin_runtime" is set, or
+            "source", Solidity source code of which "contract" is analyzed, all contracts if it is not given.
+            "options" override the analysis options of the daemon, and "slither" prioritizes the search with the
+            dependencies that Slither finds in the source
+        :return: Result with the success, error and issues fields of the JSON report
+        """
+        options = dict(self.analysis_options)
+        request_options = request.get("options") or {}
+        unknown = set(request_options) - set(ANALYSIS_OPTIONS)
+        if unknown:
+            raise ValueError("Unknown options: " + ", ".join(sorted(unknown)))
+        options.update(request_options)
+
+        try:
+            address, contracts, source_file = self._load(request)
+        except CriticalError as e:
+            return _error_result(str(e))
+
+        slither = bool(request.get("slither"))
+        if slither:
+            if source_file is None:
+                raise ValueError("Slither needs a Solidity source")
+            self._warm_slither_cache(source_file, contracts)
+
+        with self._slots:
+            with self._lock:
+                self.running += 1
+            try:
+                return self._run(address, contracts, source_file, slither, options)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.analyses += 1
+
+    def close(self) -> None:
+        """ Removes the source files of the loaded inputs"""
+        with self._lock:
+            self._contracts.clear()
+            shutil.rmtree(self._source_dir, ignore_errors=True)
+
+    def status(self) -> Dict:
+        """ Gets the counters of the daemon"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self.running,
+                "analyses": self.analyses,
+                "cached_inputs": len(self._contracts),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+            }
+
+    def _load(self, request: Dict) -> Tuple[str, List, str]:
+        """ Loads the contracts of a request, using the contracts of an earlier request of the same input"""
+        if "code" in request:
+            code = str(request["code"]).strip()
+            code = code[2:] if code.startswith("0x") else code
+            bytes.fromhex(code)
+            bin_runtime = bool(request.get("bin_runtime"))
+            key = "code", code, bin_runtime
+        elif "source" in request:
+            source = str(request["source"])
+            contract_name = request.get("contract")
+            digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+            key = "source", digest, contract_name
+        else:
+            raise ValueError("Requests need either code or source")
+
+        with self._lock:
+            try:
+                entry = self._contracts[key]
+            except KeyError:
+                self.cache_misses += 1
+            else:
+                self.cache_hits += 1
+                self._contracts.move_to_end(key)
+                return entry
+
+            self.mythril.contracts = []
+            try:
+                if key[0] == "code":
+                    address, contract = self.mythril.load_from_bytecode(
+                        code, bin_runtime
+                    )
+                    entry = address, [contract], None
+                else:
+                    source_file = os.path.join(self._source_dir, digest + ".sol")
+                    with open(source_file, "w") as file:
+                        file.write(source)
+                    target = source_file
+                    if contract_name is not None:
+                        target += ":" + contract_name
+                    address, contracts = self.mythril.load_from_solidity([target])
+                    if not contracts:
+                        raise CriticalError(
+                            "input file does not contain any valid contracts"
+                        )
+                    entry = address, contracts, source_file
+            finally:
+                self.mythril.contracts = []
+
+            self._contracts[key] = entry
+            if len(self._contracts) > CONTRACT_CACHE_SIZE:
+                self._contracts.popitem(last=False)
+            return entry
+
+    def _warm_slither_cache(self, source_file: str, contracts: List) -> None:
+        """ Computes the Slither dependencies in the daemon, so that later analyses of the source reuse them"""
+        with self._lock:
+            for contract in contracts:
+                try:
+                    self.mythril.slither_cache.get_dependencies(
+                        source_file, contract.name
+                    )
+                except Exception as e:
+                    logging.warning("Slither failed on %s: %s", source_file, e)
+
+    def _run(
+        self,
+        address: str,
+        contracts: List,
+        source_file: str,
+        slither: bool,
+        options: Dict,
+    ) -> Dict:
+        """ Runs an analysis in a forked process and waits for its result"""
+        context = multiprocessing.get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_analyze,
+            args=(
+                self.mythril,
+                address,
+                contracts,
+                source_file if slither else None,
+                options,
+                sender,
+                self.memory_limit,
+            ),
+        )
+        process.start()
+        sender.close()
+
+        try:
+            if not receiver.poll(self.timeout):
+                process.terminate()
+                return _error_result(
+                    "Analysis timed out after {} seconds".format(self.timeout)
+                )
+            try:
+                return receiver.recv()
+            except EOFError:
+                process.join()
+                return _error_result(
+                    "Worker exited with code {}".format(process.exitcode)
+                )
+        finally:
+            process.join()
+            receiver.close()
+
+
+def _error_result(error: str) -> Dict:
+    logging.error("Daemon analysis failed: %s", error)
+    return {"success": False, "error": error, "issues": []}
+
+
+def _analyze(
+    mythril, address, contracts, source_file, options, connection, memory_limit
+) -> None:
+    """ Worker entry point: analyzes loaded contracts and sends the result through connection"""
+    limit_memory(memory_limit)
+
+    try:
+        if source_file is not None:
+            report = mythril.slither_mythril(
+                contracts=contracts, address=address, file=[source_file], **options
+            )
+        else:
+            report = mythril.fire_lasers(
+                contracts=contracts, address=address, **options
+            )
+        result = {"success": True, "error": None, "issues": report.sorted_issues()}
+    except Exception as e:
+        result = {"success": False, "error": str(e), "issues": []}
+
+    connection.send(result)
+    connection.close()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API of the daemon:
+
+    POST /analyze with a request object as body, see AnalysisDaemon.analyze
+    GET /status
+    """
+
+    def do_GET(self) -> None:
+        if self.path != "/status":
+            self._send(404, {"error": "Not found"})
+            return
+        self._send(200, self.server.analysis_daemon.status())
+
+    def do_POST(self) -> None:
+        if self.path != "/analyze":
+            self._send(404, {"error": "Not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length).decode("utf-8"))
+            if not isinstance(request, dict):
+                raise ValueError("Requests must be JSON objects")
+            result = self.server.analysis_daemon.analyze(request)
+        except ValueError as e:
+            self._send(400, {"success": False, "error": str(e), "issues": []})
+            return
+        self._send(200, result)
+
+    def _send(self, status: int, body: Dict) -> None:
+        data = json.dumps(body, sort_keys=True).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args) -> None:
+        # Unix socket clients have no address
+        logging.debug("Daemon: " + format, *args)
+
+
+class _TCPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(analysis_daemon: AnalysisDaemon, address: str):
+    """
+    Creates the HTTP server of a daemon
+    :param analysis_daemon: The daemon that handles the requests
+    :param address: HOST:PORT to listen on TCP, the host defaults to localhost, or the path of a Unix socket
+    :return: socketserver.BaseServer
+    """
+    if os.sep in address:
+        server = _UnixServer(address, _RequestHandler)
+    else:
+        host, _, port = address.rpartition(":")
+        try:
+            server = _TCPServer((host or "127.0.0.1", int(port)), _RequestHandler)
+        except ValueError:
+            raise CriticalError("Invalid daemon address: " + address)
+    server.analysis_daemon = analysis_daemon
+    return server
+
+
+def serve(analysis_daemon: AnalysisDaemon, address: str) -> None:
+    """
+    Serves the requests of a daemon until the process is interrupted
+    :param analysis_daemon: The daemon that handles the requests
+    :param address: See create_server
+    """
+    server = create_server(analysis_daemon, address)
+    # Shut down cleanly on kill as well
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit())
+    logging.info("Mythril daemon listening on %s", address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        analysis_daemon.close()
+        if isinstance(server, _UnixServer):
+            os.remove(address)
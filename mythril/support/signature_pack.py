@@ -0,0 +1,164 @@
+"""
+This module implements signature packs: read-only, memory-mapped files that map function selectors to signatures
+"""
+import mmap
+import os
+import re
+import sqlite3
+import struct
+from typing import Iterable, Iterator, List, Tuple, Union
+
+# Layout of a pack, all integers are unsigned 32 bit big endian:
+#   header: MAGIC, VERSION, number of entries n
+#   keys: n 4-byte selectors in ascending order, a selector has one entry per text signature
+#   offsets: n + 1 offsets of the text signatures in the string table, the last one is its size
+#   string table: UTF-8 text signatures, in the order of the keys
+MAGIC = b"MYTHSIGP"
+VERSION = 1
+_HEADER = struct.Struct(">8sII")
+_OFFSET = struct.Struct(">I")
+KEY_SIZE = 4
+
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+# Selector and text signature, separated by whitespace, ':' or ',' as in solc --hashes output and CSV dumps
+_DUMP_LINE = re.compile(r"^(?:0x)?([0-9a-fA-F]{8})\s*[\s:,]\s*(\S.*?)\s*$")
+
+
+class SignaturePack:
+    """
+    Read-only view of a signature pack.
+
+    Opening a pack only checks its header, lookups binary search the memory-mapped keys and decode just the
+    signatures they return.
+    """
+
+    def __init__(self, path: str):
+        """
+        Constructor for SignaturePack
+        :param path: Path of the pack
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError("{} is not a signature pack".format(path))
+            magic, version, self._count = _HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(
+                    "{} is not a signature pack of version {}".format(path, VERSION)
+                )
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._offsets = _HEADER.size + KEY_SIZE * self._count
+        self._strings = self._offsets + _OFFSET.size * (self._count + 1)
+        if len(self._data) < self._strings:
+            raise ValueError("Signature pack {} is truncated".format(path))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, byte_sig: Union[str, bytes]) -> List[str]:
+        """
+        Gets the text signatures of a selector
+        :param byte_sig: 4-byte signature as hexstr or bytes
+        :return: The text signatures in lexicographic order, an empty list if the selector is not in the pack
+        """
+        key = _to_key(byte_sig)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        text_sigs = []
+        while low < self._count and self._key(low) == key:
+            text_sigs.append(self._text(low))
+            low += 1
+        return text_sigs
+
+    def close(self) -> None:
+        self._data.close()
+
+    def _key(self, index: int) -> bytes:
+        start = _HEADER.size + KEY_SIZE * index
+        return self._data[start : start + KEY_SIZE]
+
+    def _text(self, index: int) -> str:
+        start = self._offsets + _OFFSET.size * index
+        begin = self._strings + _OFFSET.unpack_from(self._data, start)[0]
+        end = self._strings + _OFFSET.unpack_from(self._data, start + _OFFSET.size)[0]
+        return self._data[begin:end].decode("utf-8")
+
+    def __repr__(self) -> str:
+        return "<SignaturePack path='{}' entries={}>".format(self.path, self._count)
+
+
+def _to_key(byte_sig: Union[str, bytes]) -> bytes:
+    if isinstance(byte_sig, str):
+        if byte_sig.startswith("0x"):
+            byte_sig = byte_sig[2:]
+        byte_sig = bytes.fromhex(byte_sig)
+    if len(byte_sig) != KEY_SIZE:
+        raise ValueError("Invalid byte signature {}".format(byte_sig))
+    return byte_sig
+
+
+def build_signature_pack(signatures: Iterable[Tuple[str, str]], path: str) -> int:
+    """
+    Writes a signature pack. The file is replaced atomically, packs that are open keep their old contents.
+    :param signatures: Pairs of 4-byte signature strings and text signatures, duplicates are dropped
+    :param path: Path of the pack
+    :return: Number of entries in the pack
+    """
+    entries = sorted(
+        {
+            (_to_key(byte_sig), text_sig.encode("utf-8"))
+            for byte_sig, text_sig in signatures
+        }
+    )
+
+    offsets = [0]
+    for _, text_sig in entries:
+        offsets.append(offsets[-1] + len(text_sig))
+
+    temporary_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(temporary_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, len(entries)))
+        file.write(b"".join(key for key, _ in entries))
+        file.write(struct.pack(">{}I".format(len(offsets)), *offsets))
+        file.write(b"".join(text_sig for _, text_sig in entries))
+    os.replace(temporary_path, path)
+    return len(entries)
+
+
+def read_signature_dump(path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Reads the signatures of a dump
+    :param path: A Mythril signature database, or a text file with one selector and text signature per line.
+        Empty lines and lines that start with '#' are skipped
+    :return: Pairs of 4-byte signature strings and text signatures
+    """
+    with open(path, "rb") as file:
+        is_sqlite = file.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+
+    if is_sqlite:
+        connection = sqlite3.connect(path)
+        try:
+            yield from connection.execute("SELECT byte_sig, text_sig FROM signatures")
+        finally:
+            connection.close()
+        return
+
+    with open(path, encoding="utf-8") as file:
+        for number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            match = _DUMP_LINE.match(line)
+            if match is None:
+                raise ValueError(
+                    "Invalid signature in line {} of {}: {}".format(number, path, line)
+                )
+            yield "0x" + match.group(1).lower(), match.group(2)
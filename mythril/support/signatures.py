@@ -6,10 +6,13 @@ import os
 import time
 import logging
 import sqlite3
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
 
 from subprocess import Popen, PIPE
 from mythril.exceptions import CompilerError
+from mythril.support.signature_pack import SignaturePack
 
 
 try:
@@ -21,51 +24,208 @@ except ImportError:
     ethereum_input_decoder = None
     FourByteDirectoryOnlineLookupError = Exception
 
+# Number of byte signatures whose text signatures are kept in memory, per database file
+SIGNATURE_CACHE_SIZE = 2 ** 14
+# Byte signatures per SELECT, below the default SQLite limit of 999 host parameters
+MAX_LOOKUP_BATCH = 500
 
-class SQLiteDB(object):
+
+class _PooledConnection(object):
     """
-    Simple CM for sqlite3 databases. Commits everything at exit.
+    Connection to a signature database that all SignatureDB instances of a process share, with an LRU cache of
+    lookups in front of it.
+
+    The cache also holds misses. It is dropped when the database file is replaced or written by another
+    connection, which is checked whenever a SignatureDB is created.
     """
 
-    def __init__(self, path):
+    def __init__(self, path: str) -> None:
         self.path = path
-        self.conn = None
-        self.cursor = None
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        # Byte signature -> tuple of text signatures
+        self.cache = OrderedDict()
+        # NOTE: Creates a new DB file if it doesn't exist already
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            (
+                "CREATE TABLE IF NOT EXISTS signatures"
+                "(byte_sig VARCHAR(10), text_sig VARCHAR(255),"
+                "PRIMARY KEY (byte_sig, text_sig))"
+            )
+        )
+        self.conn.commit()
+        self.identity = self._identity()
+        self.data_version = self._data_version()
 
-    def __enter__(self):
-        self.conn = sqlite3.connect(self.path)
-        self.cursor = self.conn.cursor()
-        return self.cursor
+    def _identity(self) -> Tuple:
+        # The connection keeps the file open, so a replacing file never gets the same inode
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return ()
+        return stat.st_dev, stat.st_ino
 
-    def __exit__(self, exc_class, exc, traceback):
-        self.conn.commit()
-        self.conn.close()
+    def _data_version(self) -> int:
+        # Changes when another connection commits to the file, but not on commits of this one
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def is_current(self) -> bool:
+        """ Checks whether the connection is usable in this process and the file was not changed by others"""
+        if self.pid != os.getpid() or self.identity != self._identity():
+            return False
+        with self.lock:
+            return self.data_version == self._data_version()
+
+    def lookup(self, byte_sigs: List[str]) -> Dict[str, Tuple[str, ...]]:
+        """
+        Gets the text signatures of byte signatures, from the cache or with one query per batch
+        :param byte_sigs: Normalized byte signatures
+        :return: Mapping of every byte signature to its text signatures
+        """
+        results = {}
+        with self.lock:
+            missing = []
+            for byte_sig in byte_sigs:
+                try:
+                    results[byte_sig] = self.cache[byte_sig]
+                except KeyError:
+                    missing.append(byte_sig)
+                else:
+                    self.cache.move_to_end(byte_sig)
+            missing = list(OrderedDict.fromkeys(missing))
+
+            for start in range(0, len(missing), MAX_LOOKUP_BATCH):
+                batch = missing[start : start + MAX_LOOKUP_BATCH]
+                found = {byte_sig: [] for byte_sig in batch}
+                placeholders = ",".join("?" * len(batch))
+                rows = self.conn.execute(
+                    "SELECT byte_sig, text_sig FROM signatures WHERE byte_sig IN ({})".format(
+                        placeholders
+                    ),
+                    batch,
+                )
+                for byte_sig, text_sig in rows:
+                    found[byte_sig].append(text_sig)
+                for byte_sig, text_sigs in found.items():
+                    results[byte_sig] = self._cache(byte_sig, tuple(text_sigs))
+        return results
+
+    def insert(self, signatures: List[Tuple[str, str]]) -> None:
+        """
+        Inserts byte - text signature pairs in one transaction
+        :param signatures: Pairs of normalized byte signatures and text signatures
+        """
+        with self.lock:
+            # ignore new rows that are already in the DB (and would cause a unique constraint error)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO signatures (byte_sig, text_sig) VALUES (?,?)",
+                signatures,
+            )
+            self.conn.commit()
+            for byte_sig, _ in signatures:
+                self.cache.pop(byte_sig, None)
+
+    def _cache(self, byte_sig: str, text_sigs: Tuple[str, ...]) -> Tuple[str, ...]:
+        self.cache[byte_sig] = text_sigs
+        if len(self.cache) > SIGNATURE_CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return text_sigs
+
+
+# Database path -> connection of this process
+_connections = {}
+_connections_lock = threading.Lock()
+
+
+def _get_connection(path: str) -> _PooledConnection:
+    """ Gets the pooled connection to a database, reconnecting after a fork or if the file changed"""
+    with _connections_lock:
+        connection = _connections.get(path)
+        if connection is None or not connection.is_current():
+            if connection is not None and connection.pid == os.getpid():
+                connection.conn.close()
+            connection = _connections[path] = _PooledConnection(path)
+        return connection
+
+
+def _reset_locks_after_fork() -> None:
+    """
+    Replaces the locks of the pool in a forked child. Other threads of the parent, e.g. daemon request threads, may
+    have held them while the process forked, and the child would wait for them forever.
+    """
+    global _connections_lock
+    _connections_lock = threading.Lock()
+    for connection in _connections.values():
+        connection.lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
 
-    def __repr__(self):
-        return "<SQLiteDB path={}>".format(self.path)
+
+# Pack path -> (stat of the file, pack or None if there is no valid pack)
+_packs = {}
+
+
+def _get_pack(path: str) -> SignaturePack:
+    """ Gets the signature pack at a path, reopening it if the file changed"""
+    try:
+        stat = os.stat(path)
+        stamp = stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+    except OSError:
+        stamp = ()
+
+    with _connections_lock:
+        entry = _packs.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        pack = None
+        if stamp:
+            try:
+                pack = SignaturePack(path)
+            except (OSError, ValueError) as e:
+                logging.warning("Ignoring signature pack %s: %s", path, e)
+        _packs[path] = stamp, pack
+        return pack
 
 
 class SignatureDB(object):
-    def __init__(self, enable_online_lookup: bool = False, path: str = None) -> None:
+    """
+    Function signature database.
+
+    All instances for the same file share one connection per process, and lookups are answered from an LRU cache
+    in front of it when possible, so creating a SignatureDB per contract is cheap.
+
+    If there is a signature pack next to the database, see mythril.support.signature_pack, it is consulted first and
+    the signatures it has are not looked up anywhere else.
+    """
+
+    def __init__(
+        self,
+        enable_online_lookup: bool = False,
+        path: str = None,
+        pack_path: str = None,
+    ) -> None:
+        """
+        Constructor for SignatureDB
+        :param enable_online_lookup: Whether to look up unknown signatures on 4byte.directory
+        :param path: Directory of signatures.db, the Mythril directory by default
+        :param pack_path: Path of the signature pack, signatures.pack in the directory of the database by default
+        """
         self.enable_online_lookup = enable_online_lookup
         self.online_lookup_miss = set()
         self.online_lookup_timeout = 0
         if path is None:
-            self.path = os.environ.get("MYTHRIL_DIR") or os.path.join(
+            path = os.environ.get("MYTHRIL_DIR") or os.path.join(
                 os.path.expanduser("~"), ".mythril"
             )
-        self.path = os.path.join(self.path, "signatures.db")
+        self.path = os.path.join(path, "signatures.db")
+        self.pack_path = pack_path or os.path.join(path, "signatures.pack")
 
         logging.info("Using signature database at %s", self.path)
-        # NOTE: Creates a new DB file if it doesn't exist already
-        with SQLiteDB(self.path) as cur:
-            cur.execute(
-                (
-                    "CREATE TABLE IF NOT EXISTS signatures"
-                    "(byte_sig VARCHAR(10), text_sig VARCHAR(255),"
-                    "PRIMARY KEY (byte_sig, text_sig))"
-                )
-            )
+        _get_connection(self.path)
 
     def __getitem__(self, item: str) -> List[str]:
         """
@@ -97,33 +257,68 @@ class SignatureDB(object):
         :param text_sig: resolved text signature
         :return:
         """
-        byte_sig = self._normalize_byte_sig(byte_sig)
-        with SQLiteDB(self.path) as cur:
-            # ignore new row if it's already in the DB (and would cause a unique constraint error)
-            cur.execute(
-                "INSERT OR IGNORE INTO signatures (byte_sig, text_sig) VALUES (?,?)",
-                (byte_sig, text_sig),
-            )
+        self.add_many([(byte_sig, text_sig)])
+
+    def add_many(self, signatures: Iterable[Tuple[str, str]]) -> None:
+        """
+        Adds byte - text signature pairs to the database in a single transaction, e.g. to import a 4byte dump
+        :param signatures: Pairs of 4-byte signature strings and resolved text signatures
+        """
+        signatures = [
+            (self._normalize_byte_sig(byte_sig), text_sig)
+            for byte_sig, text_sig in signatures
+        ]
+        if signatures:
+            _get_connection(self.path).insert(signatures)
 
     def get(self, byte_sig: str, online_timeout: int = 2) -> List[str]:
         """
         Get a function text signature for a byte signature
-        1) try local cache
-        2) try online lookup (if enabled; if not flagged as unavailable)
+        1) try signature pack
+        2) try local cache
+        3) try online lookup (if enabled; if not flagged as unavailable)
         :param byte_sig: function signature hash as hexstr
         :param online_timeout: online lookup timeout
         :return: list of matching function text signatures
         """
+        return self.get_many([byte_sig], online_timeout=online_timeout)[
+            self._normalize_byte_sig(byte_sig)
+        ]
 
-        byte_sig = self._normalize_byte_sig(byte_sig)
-        # try lookup in the local DB
-        with SQLiteDB(self.path) as cur:
-            cur.execute("SELECT text_sig FROM signatures WHERE byte_sig=?", (byte_sig,))
-            text_sigs = cur.fetchall()
+    def get_many(
+        self, byte_sigs: Iterable[str], online_timeout: int = 2
+    ) -> Dict[str, List[str]]:
+        """
+        Get the function text signatures of several byte signatures, with one query for all local lookups
+        :param byte_sigs: function signature hashes as hexstr
+        :param online_timeout: online lookup timeout
+        :return: mapping of the normalized byte signatures to their lists of matching function text signatures
+        """
+        byte_sigs = [self._normalize_byte_sig(byte_sig) for byte_sig in byte_sigs]
+        results = {}
 
-        if text_sigs:
-            return [t[0] for t in text_sigs]
+        # try lookup in the offline signature pack
+        pack = _get_pack(self.pack_path)
+        if pack is not None:
+            for byte_sig in byte_sigs:
+                text_sigs = pack.get(byte_sig)
+                if text_sigs:
+                    results[byte_sig] = text_sigs
 
+        # try lookup in the local DB
+        local = _get_connection(self.path).lookup(
+            [byte_sig for byte_sig in byte_sigs if byte_sig not in results]
+        )
+        for byte_sig, text_sigs in local.items():
+            results[byte_sig] = (
+                list(text_sigs)
+                if text_sigs
+                else self._lookup_missing(byte_sig, online_timeout)
+            )
+        return results
+
+    def _lookup_missing(self, byte_sig: str, online_timeout: int) -> List[str]:
+        """ Tries the online lookup for a byte signature that is not in the local DB"""
         # abort if we're not allowed to check 4byte or we already missed
         # the signature, or we're on a timeout
         if (
@@ -139,8 +334,7 @@ class SignatureDB(object):
                 self.online_lookup_miss.add(byte_sig)
                 return []
             else:
-                for resolved in text_sigs:
-                    self.add(byte_sig, resolved)
+                self.add_many((byte_sig, resolved) for resolved in text_sigs)
                 return text_sigs
         except FourByteDirectoryOnlineLookupError as fbdole:
             # wait at least 2 mins to try again
@@ -189,9 +383,11 @@ class SignatureDB(object):
         logging.debug("Signatures: found %d signatures after parsing" % len(sigs))
 
         # update DB with what we've found
-        for byte_sig, text_sigs in sigs.items():
-            for text_sig in text_sigs:
-                self.add(byte_sig, text_sig)
+        self.add_many(
+            (byte_sig, text_sig)
+            for byte_sig, text_sigs in sigs.items()
+            for text_sig in text_sigs
+        )
 
     @staticmethod
     def lookup_online(byte_sig: str, timeout: int, proxies=None) -> List[str]:
@@ -0,0 +1,182 @@
+import os
+import re
+import json
+import hashlib
+import logging
+import subprocess
+from typing import Dict, List, Union
+
+from slither import slither
+
+from mythril.exceptions import CompilerError
+
+# Bump when the layout of the cached entries changes
+CACHE_FORMAT = 1
+
+_compiler_versions = {}
+
+# import "file"; import "file" as name; import * as name from "file"; import {symbol} from "file";
+_IMPORT_PATTERN = re.compile(
+    r"^\s*import\s+(?:[^\"';]*\s+from\s+)?[\"']([^\"']+)[\"']", re.MULTILINE
+)
+
+
+def get_compiler_version(solc_binary: str) -> str:
+    """
+    Gets the version string of a solc binary, memoized per binary
+    :param solc_binary: Path or name of the solc binary
+    :return: Last line of the output of solc --version
+    """
+    try:
+        return _compiler_versions[solc_binary]
+    except KeyError:
+        pass
+
+    try:
+        output = subprocess.check_output([solc_binary, "--version"])
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise CompilerError("Could not run {}: {}".format(solc_binary, e))
+
+    version = output.decode("UTF-8").strip().splitlines()[-1]
+    _compiler_versions[solc_binary] = version
+    return version
+
+
+class SlitherCache:
+    """
+    Cache of the state variable dependencies that Slither computes for the contracts of a source file.
+
+    Entries are keyed on the hash of the source and of every file it imports, directly or through other imports, the
+    compiler version and the contract name. A source file is parsed by Slither at most once: the dependencies of all
+    of its contracts are computed together, kept in memory for the current run and written to cache_dir for later
+    runs.
+    """
+
+    def __init__(self, cache_dir: str, solc_binary: str = "solc"):
+        """
+        Constructor for SlitherCache
+        :param cache_dir: Directory of the on-disk cache, created on first write
+        :param solc_binary: solc binary used by Slither
+        """
+        self.cache_dir = cache_dir
+        self.solc_binary = solc_binary
+        self._entries = {}
+
+    def get_dependencies(
+        self, file: str, contract_name: str
+    ) -> Union[List[List], None]:
+        """
+        Gets the dependencies of the state variables of a contract
+        :param file: Solidity source file that defines the contract
+        :param contract_name: Name of the contract
+        :return: List of [variable name, writing functions, reading functions] entries, where functions are given
+            by their full name, None if the file does not define the contract
+        """
+        key = self._key(file)
+
+        try:
+            contracts = self._entries[key]
+        except KeyError:
+            contracts = self._load(key)
+            if contracts is None:
+                contracts = self._run_slither(file)
+                self._store(key, contracts)
+            self._entries[key] = contracts
+
+        return contracts.get(contract_name)
+
+    def _key(self, file: str) -> str:
+        digest = hashlib.sha256()
+        for import_path, source in _read_sources(file):
+            # Imports that can not be resolved only contribute their path
+            digest.update(import_path.encode("UTF-8"))
+            digest.update(b"%d:" % len(source) if source is not None else b"-:")
+            digest.update(source or b"")
+        digest.update(get_compiler_version(self.solc_binary).encode("UTF-8"))
+        digest.update(str(CACHE_FORMAT).encode("UTF-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _load(self, key: str) -> Union[Dict, None]:
+        try:
+            with open(self._path(key)) as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logging.warning("Ignoring corrupt slither cache entry %s", key)
+            return None
+
+    def _store(self, key: str, contracts: Dict) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so that concurrent runs never read a partial entry
+            temp_path = "{}.{}.tmp".format(self._path(key), os.getpid())
+            with open(temp_path, "w") as cache_file:
+                json.dump(contracts, cache_file)
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            logging.warning("Could not write slither cache entry %s: %s", key, e)
+
+    def _run_slither(self, file: str) -> Dict:
+        """ Parses the file with Slither and collects the dependencies of all its contracts """
+        slither_obj = slither.Slither(file, solc=self.solc_binary)
+
+        contracts = {}
+        for slither_contract in slither_obj.contracts:
+            dependencies = []
+            for variable in slither_contract.get_all_state_variables():
+                writers = slither_contract.get_functions_writing_to_variable_including_internal_call(
+                    variable
+                )
+                readers = slither_contract.get_functions_reading_from_variable_including_internal_call(
+                    variable
+                )
+                dependencies.append(
+                    [
+                        variable.name,
+                        sorted({func.full_name for func in writers}),
+                        sorted({func.full_name for func in readers}),
+                    ]
+                )
+            contracts[slither_contract.name] = dependencies
+
+        return contracts
+
+
+def _read_sources(file: str) -> List:
+    """
+    Reads a source file and, transitively, the files it imports. Imports are resolved relative to the directory of
+    the importing file, as solc does for relative imports.
+    :param file: Solidity source file
+    :return: (import path as written, content or None if the file could not be read) for the source file and every
+        import, in the order they are first imported. The source file itself has an empty import path.
+    """
+    sources = []
+    visited = set()
+    pending = [("", os.path.abspath(file))]
+    while pending:
+        import_path, path = pending.pop()
+        if path in visited:
+            continue
+        visited.add(path)
+
+        try:
+            with open(path, "rb") as source_file:
+                source = source_file.read()
+        except OSError:
+            if not import_path:
+                raise
+            sources.append((import_path, None))
+            continue
+        sources.append((import_path, source))
+
+        directory = os.path.dirname(path)
+        imports = _IMPORT_PATTERN.findall(source.decode("UTF-8", errors="replace"))
+        for imported in reversed(imports):
+            pending.append(
+                (imported, os.path.normpath(os.path.join(directory, imported)))
+            )
+    return sources
@@ -12,7 +12,6 @@ from mythril.analysis.symbolic import SymExecWrapper
 from mythril.analysis.report import Report
 
 from mythril.ethereum import util
-from mythril.laser.ethereum.util import get_instruction_index
 
 
 def analyze_truffle_project(sigs, args):
@@ -90,9 +89,7 @@ def analyze_truffle_project(sigs, args):
                         mappings = deployed_mappings
                         disassembly = deployed_disassembly
 
-                    index = get_instruction_index(
-                        disassembly.instruction_list, issue.address
-                    )
+                    index = disassembly.get_instruction_index(issue.address)
 
                     if index:
                         try:
@@ -132,13 +129,15 @@ def analyze_truffle_project(sigs, args):
 
 def get_sigs_from_truffle(sigs, contract_data):
     abis = contract_data["abi"]
+    signatures = []
     for abi in abis:
         if abi["type"] != "function":
             continue
         function_name = abi["name"]
         list_of_args = ",".join([input["type"] for input in abi["inputs"]])
         signature = function_name + "(" + list_of_args + ")"
-        sigs.add("0x" + sha3(signature)[:4].hex(), signature)
+        signatures.append(("0x" + sha3(signature)[:4].hex(), signature))
+    sigs.add_many(signatures)
 
 
 def get_mappings(source, deployed_source_map):
@@ -1,6 +1 @@
-yourfilenames=`ls ./solidity_examples/*.sol`
-for eachfile in $yourfilenames
-do
-   echo $eachfile
-   myth -x $eachfile
-done
+myth --batch ./solidity_examples --batch-workers 4 > results.jsonl
@@ -15,6 +15,12 @@ TESTDATA_OUTPUTS_EXPECTED_LASER_RESULT = TESTDATA / "outputs_expected_laser_resu
 MYTHRIL_DIR = TESTS_DIR / "mythril_dir"
 
 
+def creation_code(code: str) -> str:
+    """ Wraps hex runtime code in a constructor that returns it: CODECOPY(0, 13, len) RETURN(0, len)"""
+    size = "{:04x}".format(len(code) // 2)
+    return "61" + size + "80" + "61000d" + "6000" + "39" + "6000" + "f3" + code
+
+
 class BaseTestCase(TestCase):
     def setUp(self):
         self.changed_files = []
@@ -0,0 +1,56 @@
+from mythril.ethereum import util
+from mythril.mythril import Mythril
+from mythril.support.batch import analyze_batch, get_batch_targets
+from tests import TESTDATA_INPUTS, creation_code
+
+
+def _write_creation_code(path):
+    code = util.safe_decode(
+        (TESTDATA_INPUTS / "returnvalue.sol.o").read_text().strip()
+    ).hex()
+    path.write_text(creation_code(code))
+
+
+def test_get_batch_targets_from_manifest(tmp_path):
+    # Arrange
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("# contracts\nfirst.sol\n\nsub/second.bin\n")
+
+    # Act
+    targets = get_batch_targets(str(manifest))
+
+    # Assert
+    assert targets == [
+        str(tmp_path / "first.sol"),
+        str(tmp_path / "sub" / "second.bin"),
+    ]
+
+
+def test_analyze_batch_survives_failing_contract(tmp_path):
+    # Arrange
+    _write_creation_code(tmp_path / "returnvalue.bin")
+    targets = [str(tmp_path / "missing.sol"), str(tmp_path / "returnvalue.bin")]
+
+    # Act
+    results = list(
+        analyze_batch(
+            Mythril(),
+            targets,
+            workers=2,
+            timeout=120,
+            strategy="dfs",
+            modules=[],
+            max_depth=22,
+            execution_timeout=60,
+            transaction_count=2,
+        )
+    )
+
+    # Assert
+    results = {result["file"]: result for result in results}
+    assert not results[targets[0]]["success"]
+    assert results[targets[1]]["success"]
+    assert {issue["title"] for issue in results[targets[1]]["issues"]} == {
+        "External call",
+        "Unchecked CALL return value",
+    }
@@ -0,0 +1,102 @@
+import os
+import json
+import threading
+from http.client import HTTPConnection
+
+from mythril.ethereum import util
+from mythril.mythril import Mythril
+from mythril.support.daemon import AnalysisDaemon, create_server
+from tests import TESTDATA_INPUTS, creation_code
+
+
+def _creation_code():
+    code = util.safe_decode(
+        (TESTDATA_INPUTS / "returnvalue.sol.o").read_text().strip()
+    ).hex()
+    return creation_code(code)
+
+
+def _daemon():
+    return AnalysisDaemon(
+        Mythril(),
+        workers=1,
+        timeout=120,
+        strategy="dfs",
+        modules=[],
+        max_depth=22,
+        execution_timeout=60,
+        transaction_count=2,
+    )
+
+
+def _request(server, method, path, body=None):
+    connection = HTTPConnection(*server.server_address)
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read().decode("utf-8"))
+    connection.close()
+    return result
+
+
+def test_repeated_input_is_loaded_once():
+    # Arrange
+    daemon = _daemon()
+    request = {"code": _creation_code(), "options": {"transaction_count": 1}}
+
+    # Act
+    results = [daemon.analyze(request), daemon.analyze(request)]
+
+    # Assert
+    for result in results:
+        assert result["success"]
+        assert {issue["title"] for issue in result["issues"]} == {
+            "External call",
+            "Unchecked CALL return value",
+        }
+    status = daemon.status()
+    assert (status["cache_hits"], status["cache_misses"]) == (1, 1)
+    assert status["analyses"] == 2
+
+
+def test_http_api():
+    # Arrange
+    server = create_server(_daemon(), "127.0.0.1:0")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # Act
+    bad_request = _request(
+        server, "POST", "/analyze", json.dumps({"options": {"unknown": 1}})
+    )
+    no_input = _request(server, "POST", "/analyze", json.dumps({}))
+    status = _request(server, "GET", "/status")
+    server.shutdown()
+    server.server_close()
+
+    # Assert
+    assert bad_request[0] == 400
+    assert "unknown" in bad_request[1]["error"]
+    assert no_input[0] == 400
+    assert status == (
+        200,
+        {
+            "analyses": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "cached_inputs": 0,
+            "running": 0,
+            "workers": 1,
+        },
+    )
+
+
+def test_close_removes_source_files():
+    # Arrange
+    daemon = _daemon()
+    source_dir = daemon._source_dir
+
+    # Act
+    daemon.close()
+
+    # Assert
+    assert not os.path.exists(source_dir)
@@ -122,3 +122,15 @@ def test_disassemble():
     assert instruction_list[0]["opcode"] == "STOP"
     assert instruction_list[1]["opcode"] == "AND"
     assert instruction_list[2]["opcode"] == "MOD"
+
+
+def test_disassemble_push_values():
+    # Act
+    instruction_list = disassemble(b"\x60\x10\x61\x01")
+
+    # Assert
+    assert instruction_list.push_values == [0x10, 0x0100]
+    assert instruction_list[0] == {"address": 0, "opcode": "PUSH1", "argument": "0x10"}
+    assert instruction_list[1]["argument"] == "0x01"
+    with pytest.raises(TypeError):
+        instruction_list[0]["opcode"] = "STOP"
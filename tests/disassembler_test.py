@@ -28,3 +28,19 @@ class DisassemblerTestCase(BaseTestCase):
                 self.found_changed_files(input_file, output_expected, output_current)
 
         self.assert_and_show_changed_files()
+
+    def test_instruction_index_lookup(self):
+        # PUSH1 0x04 JUMP JUMPDEST STOP
+        disassembly = Disassembly("0x6004565b00")
+        self.assertEqual(disassembly.get_instruction_index(3), 2)
+        self.assertIsNone(disassembly.get_instruction_index(1))
+        self.assertTrue(disassembly.is_jumpdest(2))
+        self.assertFalse(disassembly.is_jumpdest(3))
+
+    def test_basic_blocks(self):
+        # PUSH1 0x01 PUSH1 0x01 JUMPI STOP JUMPDEST PUSH1 0x01 JUMPDEST STOP
+        disassembly = Disassembly("0x6001600157005b60015b00")
+        self.assertEqual(disassembly.get_basic_block(1), (0, 3))
+        self.assertEqual(disassembly.get_basic_block(3), (3, 4))
+        self.assertEqual(disassembly.get_basic_block(5), (4, 6))
+        self.assertEqual(disassembly.get_basic_block(7), (6, 8))
@@ -0,0 +1,29 @@
+from z3 import BitVecVal
+
+from mythril.disassembler.disassembly import Disassembly
+from mythril.laser.ethereum.state.environment import Environment
+from mythril.laser.ethereum.state.account import Account
+from mythril.laser.ethereum.state.machine_state import MachineState
+from mythril.laser.ethereum.state.global_state import GlobalState
+from mythril.laser.ethereum.state.world_state import WorldState
+from mythril.laser.ethereum.instructions import Instruction
+from mythril.laser.ethereum.transaction.transaction_models import MessageCallTransaction
+
+
+def test_push_truncated_argument():
+    # Arrange
+    active_account = Account("0x0", code=Disassembly("61ff"))
+    environment = Environment(active_account, None, None, None, None, None)
+    og_state = GlobalState(None, environment, None, MachineState(gas_limit=8000000))
+    og_state.transaction_stack.append(
+        (MessageCallTransaction(world_state=WorldState(), gas_limit=8000000), None)
+    )
+    instruction = Instruction("push2", dynamic_loader=None)
+
+    # Act
+    new_state = instruction.evaluate(og_state)[0]
+
+    # Assert
+    assert new_state.mstate.stack[-1] == BitVecVal(0xFF00, 256)
+    assert new_state.mstate.pc == 1
+    assert new_state.mstate.min_gas_used == 3
@@ -0,0 +1,103 @@
+import pytest
+
+import mythril.laser.ethereum.svm as svm
+from mythril.disassembler.disassembly import Disassembly
+from mythril.laser.ethereum.instructions import Instruction
+from mythril.laser.ethereum.simplification import simplification_cache
+from mythril.laser.ethereum.state.environment import Environment
+from mythril.laser.ethereum.state.global_state import GlobalState
+from mythril.laser.ethereum.state.machine_state import MachineState
+from mythril.laser.ethereum.state.world_state import WorldState
+from mythril.laser.ethereum.transaction.transaction_models import (
+    MessageCallTransaction,
+    TransactionStartSignal,
+)
+from tests import creation_code
+
+# PUSH1 0x00 CALLDATALOAD PUSH1 0x00 MSTORE PUSH1 0x20 PUSH1 0x00 SHA3 SLOAD STOP: reads a mapping entry
+MAPPING_CODE = "600035600052602060002054" "00"
+
+
+def _run():
+    laser_evm = svm.LaserEVM({}, execution_timeout=None, transaction_count=1)
+    laser_evm.sym_exec(creation_code=creation_code(MAPPING_CODE))
+    return laser_evm
+
+
+def test_engines_do_not_share_state():
+    # Act
+    first = _run()
+    second = _run()
+
+    # Assert
+    assert first.context is not second.context
+    assert sorted(first.nodes) == sorted(second.nodes)
+    assert min(second.nodes) == 0
+    assert (
+        first.context.keccak_function_manager
+        is not second.context.keccak_function_manager
+    )
+    assert first.context.get_next_transaction_id() == (
+        second.context.get_next_transaction_id()
+    )
+
+
+def test_reset_restores_new_engine_state():
+    # Arrange
+    laser_evm = _run()
+    keccak_function_manager = laser_evm.context.keccak_function_manager
+
+    # Act
+    laser_evm.context.reset()
+
+    # Assert
+    assert laser_evm.context.get_next_node_uid() == 0
+    assert laser_evm.context.get_next_transaction_id() == 1
+    assert laser_evm.context.keccak_function_manager is not keccak_function_manager
+
+
+def test_internal_calls_take_ids_from_context():
+    # Arrange
+    laser_evm = svm.LaserEVM({}, execution_timeout=None, transaction_count=1)
+    world_state = WorldState()
+    caller = world_state.create_account(address="0x0", balance=0)
+    caller.code = Disassembly("f100")
+    world_state.create_account(address="0x10", balance=0)
+    environment = Environment(caller, None, None, None, None, None)
+    global_state = GlobalState(
+        world_state, environment, None, MachineState(gas_limit=8000000)
+    )
+    global_state.transaction_stack.append(
+        (
+            MessageCallTransaction(
+                world_state=world_state,
+                identifier=laser_evm.context.get_next_transaction_id(),
+                gas_limit=8000000,
+            ),
+            None,
+        )
+    )
+    # out size, out offset, in size, in offset, value, to, gas
+    global_state.mstate.stack = [0, 0, 0, 0, 0, 0x10, 10000]
+    instruction = Instruction("call", dynamic_loader=None, laser_obj=laser_evm)
+
+    # Act
+    with pytest.raises(TransactionStartSignal) as start_signal:
+        instruction.evaluate(global_state)
+
+    # Assert
+    assert start_signal.value.transaction.id == 2
+    assert laser_evm.context.get_next_transaction_id() == 3
+
+
+def test_simplification_statistics_cover_the_current_run():
+    # Arrange
+    _run()
+
+    # Act
+    laser_evm = _run()
+
+    # Assert
+    hits, misses = laser_evm.context.get_simplification_statistics()
+    assert hits > 0
+    assert hits + misses < sum(simplification_cache.statistics())
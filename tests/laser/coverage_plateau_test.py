@@ -0,0 +1,20 @@
+import mythril.laser.ethereum.svm as svm
+from tests import creation_code
+
+# JUMPDEST PUSH1 0x00 JUMP: loops forever
+LOOP_CODE = "5b600056"
+
+
+def test_message_call_stops_when_coverage_plateaus():
+    # Arrange
+    laser_evm = svm.LaserEVM(
+        {}, execution_timeout=None, transaction_count=1, coverage_plateau=50
+    )
+
+    # Act
+    laser_evm.sym_exec(creation_code=creation_code(LOOP_CODE))
+
+    # Assert
+    runtime_coverage = laser_evm.coverage[LOOP_CODE]
+    assert runtime_coverage.count() == runtime_coverage.size == 3
+    assert laser_evm.total_states < 100
@@ -0,0 +1,71 @@
+import pickle
+
+from mythril.disassembler.disassembly import Disassembly
+from mythril.laser.ethereum.coverage import Coverage, InstructionCoverage
+
+
+def test_mark_and_count():
+    # Arrange
+    coverage = InstructionCoverage(20)
+
+    # Act
+    first = coverage.mark(3)
+    second = coverage.mark(3)
+    coverage.mark(17)
+
+    # Assert
+    assert first and not second
+    assert coverage[3] and coverage[17] and not coverage[4]
+    assert coverage.count() == 2
+
+
+def test_range_coverage():
+    # Arrange
+    coverage = InstructionCoverage(20)
+    for index in range(6, 12):
+        coverage.mark(index)
+
+    # Act + Assert
+    assert coverage.is_covered(6, 12)
+    assert coverage.is_covered(7, 9)
+    assert not coverage.is_covered(5, 12)
+    assert not coverage.is_covered(6, 13)
+
+
+def test_transaction_delta():
+    # Arrange
+    # PUSH1 0x01 PUSH1 0x02 STOP
+    code = Disassembly("6001600200")
+    coverage = Coverage()
+    coverage.begin_transaction()
+    coverage.mark(code, 0)
+    coverage.mark(code, 1)
+    coverage.end_transaction()
+
+    # Act
+    coverage.begin_transaction()
+    coverage.mark(code, 1)
+    coverage.mark(code, 2)
+    delta = coverage.end_transaction()
+
+    # Assert
+    assert delta[code.bytecode].count() == 1
+    assert delta[code.bytecode][2]
+    assert coverage.total() == 3
+    assert [d[code.bytecode].count() for d in coverage.transactions] == [2, 1]
+
+
+def test_merge_pickled_coverage():
+    # Arrange
+    code = Disassembly("6001600200")
+    coverage = Coverage()
+    coverage.mark(code, 0)
+    worker_coverage = pickle.loads(pickle.dumps(coverage))
+    worker_coverage.mark(code, 2)
+
+    # Act
+    coverage.merge(worker_coverage)
+
+    # Assert
+    assert coverage[code.bytecode].count() == 2
+    assert not coverage.mark(code, 2)
@@ -0,0 +1,37 @@
+from z3 import BitVec, ULT, UGT
+
+from mythril.laser.ethereum.feasibility import FeasibilityCache
+from mythril.laser.ethereum.state.constraints import Constraints
+
+
+def test_infeasible_constraints():
+    # Arrange
+    x = BitVec("x", 256)
+    cache = FeasibilityCache()
+
+    # Act + Assert
+    assert not cache.is_feasible(Constraints([UGT(x, 10), ULT(x, 5)]))
+    assert not cache.is_feasible(Constraints([False]))
+
+
+def test_feasible_constraints():
+    # Arrange
+    x = BitVec("x", 256)
+    cache = FeasibilityCache()
+
+    # Act + Assert
+    assert cache.is_feasible(Constraints([UGT(x, 10), ULT(x, 20), True]))
+
+
+def test_cache_hit_for_same_constraint_set():
+    # Arrange
+    x = BitVec("x", 256)
+    cache = FeasibilityCache()
+
+    # Act
+    cache.is_feasible(Constraints([UGT(x, 10), ULT(x, 20)]))
+    cache.is_feasible(Constraints([ULT(x, 20), UGT(x, 10)]))
+
+    # Assert
+    assert cache.misses == 1
+    assert cache.hits == 1
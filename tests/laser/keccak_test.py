@@ -0,0 +1,53 @@
+import pytest
+from z3 import BitVec, BitVecVal, Concat
+
+from mythril.laser.ethereum.keccak import KeccakFunctionManager
+
+ADDRESS = "0x0901d12ebe1b195e5aa8748e62bd7734ae19b51f"
+
+
+def _add(manager, name, argument):
+    result = BitVec("KECCAC[{}]".format(name), 256)
+    manager.add_keccak(result, argument)
+    manager.add_storage_key(ADDRESS, result)
+    return result
+
+
+def test_results_are_found_by_expression_and_name():
+    # Arrange
+    manager = KeccakFunctionManager()
+    key = BitVec("key", 256)
+
+    # Act
+    result = _add(manager, "key", key)
+
+    # Assert
+    assert manager.is_keccak(result)
+    assert manager.is_keccak(BitVec("KECCAC[key]", 256))
+    assert manager.is_keccak(str(result))
+    assert not manager.is_keccak(key)
+    assert manager.get_argument(str(result)).eq(key)
+    with pytest.raises(ValueError):
+        manager.get_argument(key)
+
+
+def test_storage_keys_are_grouped_by_base_slot():
+    # Arrange
+    manager = KeccakFunctionManager()
+    key = BitVec("key", 256)
+    slot_zero = _add(manager, "slot_0", Concat(key, BitVecVal(0, 256)))
+    slot_one = _add(manager, "slot_1", Concat(key, BitVecVal(1, 256)))
+    unknown_slot = _add(manager, "slot_x", Concat(key, BitVec("x", 256)))
+    _add(manager, "word", key)
+
+    # Act
+    keys = list(manager.get_storage_keys(ADDRESS, slot_zero))
+
+    # Assert
+    assert keys == [str(slot_zero), str(unknown_slot)]
+    assert len(list(manager.get_storage_keys(ADDRESS, unknown_slot))) == 3
+    assert list(manager.get_storage_keys(ADDRESS, slot_one)) == [
+        str(slot_one),
+        str(unknown_slot),
+    ]
+    assert list(manager.get_storage_keys("0x0", slot_zero)) == []
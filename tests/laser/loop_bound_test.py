@@ -0,0 +1,72 @@
+import mythril.laser.ethereum.svm as svm
+from tests import creation_code
+
+# PUSH1 0x03 JUMP, JUMPDEST PUSH1 0x00 CALLDATALOAD PUSH1 0x03 JUMPI STOP: loops while calldata[0] is not zero
+LOOP_CODE = "600356" "5b600035600357" "00"
+STOP_PC = 7
+
+# PUSH1 0x03 JUMP, then JUMPDEST PUSH1 <next> JUMP segments and a final JUMPDEST STOP: 31 forward jumps in a row
+JUMPS = 31
+STRAIGHT_CODE = (
+    "6003"
+    + "56"
+    + "".join("5b60{:02x}56".format(3 + 4 * (i + 1)) for i in range(JUMPS - 1))
+    + "5b00"
+)
+STRAIGHT_STOP_PC = 3 * JUMPS
+
+
+def _run(loop_bound, code=LOOP_CODE, stop_pc=STOP_PC, max_depth=8):
+    laser_evm = svm.LaserEVM(
+        {},
+        max_depth=max_depth,
+        execution_timeout=None,
+        transaction_count=1,
+        loop_bound=loop_bound,
+    )
+    laser_evm.sym_exec(creation_code=creation_code(code))
+    return [
+        state
+        for node in laser_evm.nodes.values()
+        for state in node.states
+        if state.environment.code.bytecode == code and state.mstate.pc == stop_pc
+    ]
+
+
+def test_loop_iterations_are_bounded():
+    # Act
+    exit_states = _run(loop_bound=3)
+
+    # Assert
+    iterations = [sum(state.mstate.loop_counts.values()) for state in exit_states]
+    assert len(exit_states) == 4
+    assert sorted(iterations) == [0, 1, 2, 3]
+
+
+def test_loops_are_only_bounded_by_depth_by_default():
+    # Act
+    exit_states = _run(loop_bound=None)
+
+    # Assert
+    assert len(exit_states) == 7
+
+
+def test_forward_jumps_do_not_count_towards_depth_with_loop_bound():
+    # Act
+    exit_states = _run(
+        loop_bound=3, code=STRAIGHT_CODE, stop_pc=STRAIGHT_STOP_PC, max_depth=22
+    )
+
+    # Assert
+    assert len(exit_states) == 1
+    assert exit_states[0].mstate.depth == 0
+
+
+def test_forward_jumps_count_towards_depth_by_default():
+    # Act
+    exit_states = _run(
+        loop_bound=None, code=STRAIGHT_CODE, stop_pc=STRAIGHT_STOP_PC, max_depth=22
+    )
+
+    # Assert
+    assert exit_states == []
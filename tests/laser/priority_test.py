@@ -0,0 +1,94 @@
+from mythril.disassembler.disassembly import MappingObj
+from mythril.laser.ethereum.cfg import Node
+from mythril.laser.ethereum.priority import DependencyScheduler, PriorityIndex
+from mythril.laser.ethereum.state.world_state import WorldState
+from mythril.mythril import MappingObjTuple
+
+transfer = MappingObj("transfer(address,uint256)", "0xa9059cbb", 10)
+balance_of = MappingObj("balanceOf(address)", "0x70a08231", 20)
+owner = MappingObj("owner()", "0x8da5cb5b", 30)
+
+
+def test_titles_of_function_pair():
+    # Arrange
+    index = PriorityIndex(
+        {
+            "RAW": [MappingObjTuple(transfer, balance_of)],
+            "WAR": [],
+            "WAW": [MappingObjTuple(transfer, transfer)],
+            "RAR": [MappingObjTuple(transfer, balance_of)],
+        }
+    )
+
+    # Act + Assert
+    assert index.get_titles(transfer.function_name, 0x70A08231) == ("RAW", "RAR")
+    assert index.get_titles(transfer.function_name, 0xA9059CBB) == ("WAW",)
+    assert index.get_titles(balance_of.function_name, 0xA9059CBB) == ()
+    assert index.get_titles(None, 0xA9059CBB) == ()
+
+
+def _open_state(function_name, transaction_sequence):
+    world_state = WorldState(transaction_sequence=transaction_sequence)
+    world_state.node = Node("Token")
+    world_state.node.function_name = function_name
+    return world_state
+
+
+def test_schedule_groups_and_prunes_open_states():
+    # Arrange
+    scheduler = DependencyScheduler(
+        {
+            "RAW": [MappingObjTuple(transfer, balance_of)],
+            "WAR": [MappingObjTuple(balance_of, transfer)],
+            "WAW": [],
+            "RAR": [],
+        }
+    )
+    open_states = [
+        _open_state(owner.function_name, ["creation", "tx1"]),
+        _open_state(balance_of.function_name, ["creation", "tx2"]),
+        _open_state(transfer.function_name, ["creation", "tx3"]),
+    ]
+
+    # Act
+    schedule = scheduler.schedule(open_states)
+
+    # Assert
+    assert schedule == [
+        ("RAW", [open_states[2]]),
+        ("WAR", [open_states[1]]),
+        ("WAW", []),
+        ("RAR", []),
+    ]
+
+
+def test_schedule_extends_best_sequences_within_beam():
+    # Arrange
+    scheduler = DependencyScheduler(
+        {
+            "RAW": [MappingObjTuple(transfer, balance_of)],
+            "WAR": [MappingObjTuple(balance_of, transfer)],
+            "WAW": [],
+            "RAR": [MappingObjTuple(balance_of, balance_of)],
+        },
+        beam_width=1,
+    )
+    scheduler.schedule(
+        [
+            _open_state(transfer.function_name, ["creation", "tx1"]),
+            _open_state(balance_of.function_name, ["creation", "tx2"]),
+        ]
+    )
+    open_states = [
+        # balanceOf after balanceOf follows a RAR dependency
+        _open_state(balance_of.function_name, ["creation", "tx2", "tx3"]),
+        # balanceOf after transfer follows a RAW dependency
+        _open_state(balance_of.function_name, ["creation", "tx1", "tx4"]),
+    ]
+
+    # Act
+    schedule = scheduler.schedule(open_states)
+
+    # Assert
+    assert schedule[1] == ("WAR", [open_states[1]])
+    assert sum(len(states) for _, states in schedule) == 1
@@ -0,0 +1,71 @@
+from z3 import BitVec, BitVecVal, simplify as z3_simplify
+
+from mythril.laser.ethereum.simplification import SimplificationCache
+
+
+def test_repeated_expression_is_served_from_cache():
+    # Arrange
+    cache = SimplificationCache()
+    x = BitVec("x", 256)
+
+    # Act
+    first = cache.simplify(x + 1 + 2)
+    second = cache.simplify(x + 1 + 2)
+
+    # Assert
+    assert first.eq(z3_simplify(x + 1 + 2))
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    # Arrange
+    cache = SimplificationCache(max_size=2)
+    x = BitVec("x", 256)
+    cache.simplify(x + 1)
+    cache.simplify(x + 2)
+    cache.simplify(x + 1)
+
+    # Act
+    cache.simplify(x + 3)
+
+    # Assert
+    assert len(cache) == 2
+    cache.simplify(x + 1)
+    cache.simplify(x + 2)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_clear_resets_statistics():
+    # Arrange
+    cache = SimplificationCache()
+    cache.simplify(BitVecVal(1, 256) + 1)
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert len(cache) == 0
+    assert cache.hit_rate == 0.0
+
+
+def test_eviction_between_lookup_and_reorder_is_tolerated():
+    # Arrange
+    cache = SimplificationCache()
+    x = BitVec("x", 256)
+    first = cache.simplify(x + 1 + 2)
+    move_to_end = cache._entries.move_to_end
+
+    def evict_then_move(key, last=True):
+        cache._entries.pop(key)
+        move_to_end(key, last)
+
+    cache._entries.move_to_end = evict_then_move
+
+    # Act
+    second = cache.simplify(x + 1 + 2)
+
+    # Assert
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
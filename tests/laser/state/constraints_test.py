@@ -0,0 +1,55 @@
+from copy import copy
+
+from z3 import BitVec, ULT, UGT
+
+from mythril.laser.ethereum.state.constraints import Constraints
+
+
+def test_check_possibility_satisfiable():
+    # Arrange
+    x = BitVec("x", 256)
+    constraints = Constraints([UGT(x, 10), ULT(x, 20)])
+
+    # Act + Assert
+    assert constraints.check_possibility()
+
+
+def test_check_possibility_unsatisfiable():
+    # Arrange
+    x = BitVec("x", 256)
+    constraints = Constraints([UGT(x, 10), ULT(x, 5)])
+
+    # Act + Assert
+    assert not constraints.check_possibility()
+
+
+def test_check_possibility_with_assumptions():
+    # Arrange
+    x = BitVec("x", 256)
+    constraints = Constraints([UGT(x, 10)])
+
+    # Act + Assert
+    assert not constraints.check_possibility([ULT(x, 5)])
+    assert constraints.check_possibility()
+
+
+def test_forked_constraints_share_solver():
+    # Arrange
+    x = BitVec("x", 256)
+    prefix = Constraints([UGT(x, 10)])
+
+    # Act
+    true_branch = copy(prefix)
+    true_branch.append(ULT(x, 20))
+    false_branch = copy(prefix)
+    false_branch.append(ULT(x, 5))
+    extended = prefix + [ULT(x, 30)]
+
+    # Assert
+    assert true_branch.solver is prefix.solver
+    assert false_branch.solver is prefix.solver
+    assert extended.solver is prefix.solver
+    assert true_branch.check_possibility()
+    assert not false_branch.check_possibility()
+    assert true_branch.check_possibility()
+    assert extended.check_possibility()
@@ -0,0 +1,36 @@
+from copy import copy
+
+from mythril.laser.ethereum.state.account import Account
+from mythril.laser.ethereum.state.global_state import GlobalState
+from mythril.laser.ethereum.state.world_state import WorldState
+
+
+def test_reads_do_not_copy_shared_world_state():
+    # Arrange
+    world_state = WorldState()
+    world_state.accounts["0x0"] = Account("0x0")
+    global_state = GlobalState(world_state, None, None)
+    global_state_copy = copy(global_state)
+
+    # Act
+    accounts = global_state_copy.accounts
+
+    # Assert
+    assert global_state_copy.world_state is world_state
+    assert accounts is world_state.accounts
+
+
+def test_writes_take_a_private_world_state():
+    # Arrange
+    world_state = WorldState()
+    world_state.accounts["0x0"] = Account("0x0")
+    global_state = GlobalState(world_state, None, None)
+    global_state_copy = copy(global_state)
+
+    # Act
+    global_state_copy.writable_world_state().accounts["0x1"] = Account("0x1")
+
+    # Assert
+    assert global_state.world_state is world_state
+    assert list(world_state.accounts) == ["0x0"]
+    assert list(global_state_copy.accounts) == ["0x0", "0x1"]
@@ -0,0 +1,147 @@
+import pytest
+from copy import copy
+from mythril.laser.ethereum.state.memory import Memory, PAGE_SIZE
+from z3 import BitVec, BitVecVal, Extract, is_true, simplify, substitute
+
+word_offsets = [0, 32, 5, PAGE_SIZE - 16]
+
+
+@pytest.mark.parametrize("offset", word_offsets)
+def test_concrete_word_round_trip(offset):
+    # Arrange
+    memory = Memory()
+    memory.extend(offset + 32)
+
+    # Act
+    memory.write_word_at(offset, 2 ** 255 + 7)
+
+    # Assert
+    assert memory.get_word_at(offset) == 2 ** 255 + 7
+    assert memory[offset] == 0x80
+    assert memory[offset + 31] == 7
+
+
+@pytest.mark.parametrize("offset", word_offsets)
+def test_symbolic_word_round_trip(offset):
+    # Arrange
+    memory = Memory()
+    memory.extend(offset + 32)
+    word = BitVec("word", 256)
+
+    # Act
+    memory.write_word_at(offset, word)
+
+    # Assert
+    assert memory.get_word_at(offset).eq(word)
+    assert memory[offset].eq(Extract(255, 248, word))
+
+
+def test_overlapping_words():
+    # Arrange
+    memory = Memory()
+    memory.extend(64)
+    word = BitVec("word", 256)
+    memory.write_word_at(0, word)
+
+    # Act
+    memory.write_word_at(16, 0)
+
+    # Assert
+    assert memory.get_word_at(16) == 0
+    assert memory.get_word_at(0).size() == 256
+    assert simplify(Extract(255, 128, memory.get_word_at(0))).eq(
+        simplify(Extract(255, 128, word))
+    )
+    assert simplify(Extract(127, 0, memory.get_word_at(0))).as_long() == 0
+
+
+def test_copy_shares_pages_until_write():
+    # Arrange
+    memory = Memory([1, 2, 3])
+    memory.extend(2 * PAGE_SIZE)
+    memory[PAGE_SIZE] = 4
+
+    # Act
+    memory_copy = copy(memory)
+    memory_copy[1] = 5
+
+    # Assert
+    assert memory[0:3] == [1, 2, 3]
+    assert memory_copy[0:3] == [1, 5, 3]
+    assert memory_copy._pages[1] is memory._pages[1]
+    assert memory_copy._pages[0] is not memory._pages[0]
+    assert memory.diff(memory_copy) == [1]
+
+
+def test_index_out_of_range():
+    # Arrange
+    memory = Memory([1, 2, 3])
+
+    # Act / Assert
+    with pytest.raises(IndexError):
+        memory[3] = 1
+
+
+def test_symbolic_offset_round_trip():
+    # Arrange
+    memory = Memory()
+    memory.extend(64)
+    memory.write_word_at(0, 5)
+    offset = BitVec("offset", 256)
+    word = BitVec("word", 256)
+
+    # Act
+    memory.write_word_at(offset, word)
+
+    # Assert
+    assert memory.is_symbolic
+    assert memory.get_word_at(offset).eq(word)
+    assert not isinstance(memory.get_word_at(0), int)
+
+
+def test_copy_of_symbolic_memory_is_independent():
+    # Arrange
+    memory = Memory()
+    offset = BitVec("offset", 256)
+    memory.write_word_at(offset, 1)
+
+    # Act
+    memory_copy = copy(memory)
+    memory_copy.write_word_at(offset, 2)
+
+    # Assert
+    assert memory.get_word_at(offset) == 1
+    assert memory_copy.get_word_at(offset) == 2
+    assert memory.diff(copy(memory)) == []
+
+
+def test_concrete_write_after_symbolic_write_stays_concrete():
+    # Arrange
+    memory = Memory()
+    memory.extend(64)
+    offset = BitVec("offset", 256)
+    memory.write_word_at(offset, 1)
+
+    # Act
+    memory.write_word_at(32, 7)
+
+    # Assert
+    assert memory.get_word_at(32) == 7
+    assert not isinstance(memory.get_word_at(0), int)
+
+
+def test_symbolic_read_sees_later_concrete_write():
+    # Arrange
+    memory = Memory()
+    memory.extend(64)
+    offset = BitVec("offset", 256)
+    memory.write_word_at(offset, 1)
+    memory.write_word_at(32, 7)
+
+    # Act
+    word = memory.get_word_at(offset)
+
+    # Assert
+    assert memory._as_array() is memory._as_array()
+    assert is_true(simplify(substitute(word, (offset, BitVecVal(96, 256))) == 1))
+    assert is_true(simplify(substitute(word, (offset, BitVecVal(32, 256))) == 7))
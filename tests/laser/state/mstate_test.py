@@ -1,4 +1,5 @@
 import pytest
+from copy import copy
 from mythril.laser.ethereum.state.machine_state import MachineState
 from mythril.laser.ethereum.evm_exceptions import StackUnderflowException
 
@@ -96,3 +97,41 @@ def test_memory_write(initial_size, memory_offset, data):
     # Assert
     assert len(machine_state.memory) == max(initial_size, memory_offset + len(data))
     assert machine_state.memory[memory_offset : memory_offset + len(data)] == data
+
+
+def test_copy_shares_memory_until_write():
+    # Arrange
+    machine_state = MachineState(8000000)
+    machine_state.memory_write(0, [1, 2, 3])
+    machine_state.writable_constraints().append(True)
+
+    # Act
+    machine_state_copy = copy(machine_state)
+    shared_before_write = machine_state._memory is machine_state_copy._memory
+    machine_state_copy.memory_write(0, [4])
+    machine_state_copy.writable_constraints().append(False)
+
+    # Assert
+    assert shared_before_write
+    assert machine_state.memory == [1, 2, 3]
+    assert machine_state_copy.memory == [4, 2, 3]
+    assert machine_state.constraints == [True]
+    assert machine_state_copy.constraints == [True, False]
+
+
+def test_reads_do_not_copy_shared_memory():
+    # Arrange
+    machine_state = MachineState(8000000)
+    machine_state.memory_write(0, [1, 2, 3])
+    machine_state.writable_constraints().append(True)
+    machine_state_copy = copy(machine_state)
+
+    # Act
+    memory = machine_state_copy.memory
+    constraints = machine_state_copy.constraints
+
+    # Assert
+    assert memory is machine_state.memory
+    assert constraints is machine_state.constraints
+    assert memory[0:3] == [1, 2, 3]
+    assert constraints == [True]
@@ -1,4 +1,5 @@
 import pytest
+from copy import copy
 from mythril.laser.ethereum.state.account import Storage
 from z3 import ExprRef
 
@@ -51,3 +52,37 @@ def test_storage_change_item():
 
     # Assert
     assert storage[1] == 14
+
+
+def test_storage_copy_on_write():
+    # Arrange
+    storage = Storage()
+    storage._storage = {1: 12, 2: 13}
+
+    # Act
+    storage_copy = copy(storage)
+    storage_copy[1] = 14
+    storage_copy[3] = 15
+
+    # Assert
+    assert storage[1] == 12
+    assert storage_copy[1] == 14
+    assert storage_copy[2] == 13
+    assert list(storage.keys()) == [1, 2]
+    assert list(storage_copy.keys()) == [1, 2, 3]
+
+
+def test_storage_copies_append_keys_independently():
+    # Arrange
+    storage = Storage()
+    storage._storage = {1: 12}
+    storage_copy = copy(storage)
+
+    # Act
+    storage[2] = 13
+    storage_copy[3] = 14
+
+    # Assert
+    assert list(storage.keys()) == [1, 2]
+    assert list(storage_copy.keys()) == [1, 3]
+    assert 2 not in storage_copy
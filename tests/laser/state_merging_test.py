@@ -0,0 +1,61 @@
+import mythril.laser.ethereum.svm as svm
+from tests import creation_code
+
+# if calldata[0]: push callvalue else: push caller; both branches jump to the same JUMPDEST and stop
+DIAMOND_CODE = "600035600a5733600f56" "5b34600f56" "5b00"
+# Same, but pushing the constants 2 and 1
+CONCRETE_DIAMOND_CODE = "600035600b576001601156" "5b6002601156" "5b00"
+JOIN_PC = 11
+
+
+def _join_states(laser_evm, code):
+    return [
+        state
+        for node in laser_evm.nodes.values()
+        for state in node.states
+        if state.environment.code.bytecode == code and state.mstate.pc == JOIN_PC
+    ]
+
+
+def _run(code, merge_states=True):
+    laser_evm = svm.LaserEVM(
+        {}, execution_timeout=None, transaction_count=1, merge_states=merge_states
+    )
+    laser_evm.sym_exec(creation_code=creation_code(code))
+    return laser_evm
+
+
+def test_states_are_merged_at_join_point():
+    # Act
+    laser_evm = _run(DIAMOND_CODE)
+
+    # Assert
+    join_states = _join_states(laser_evm, DIAMOND_CODE)
+    assert laser_evm.merged_states == 1
+    assert len(join_states) == 1
+    merged_state = join_states[0]
+    assert str(merged_state.mstate.stack[-1]).startswith("If(")
+    assert merged_state.mstate.constraints.check_possibility()
+    assert (
+        len([edge for edge in laser_evm.edges if edge.node_to == merged_state.node.uid])
+        == 2
+    )
+
+
+def test_states_are_not_merged_by_default():
+    # Act
+    laser_evm = _run(DIAMOND_CODE, merge_states=False)
+
+    # Assert
+    assert laser_evm.merged_states == 0
+    assert len(_join_states(laser_evm, DIAMOND_CODE)) == 2
+
+
+def test_concrete_stack_values_are_not_merged():
+    # Act
+    laser_evm = _run(CONCRETE_DIAMOND_CODE)
+
+    # Assert
+    join_states = _join_states(laser_evm, CONCRETE_DIAMOND_CODE)
+    assert laser_evm.merged_states == 0
+    assert sorted(state.mstate.stack[-1].as_long() for state in join_states) == [1, 2]
@@ -0,0 +1,151 @@
+from copy import copy
+
+import pytest
+
+from mythril.analysis.symbolic import SymExecWrapper
+from mythril.disassembler.disassembly import Disassembly
+from mythril.ethereum.evmcontract import EVMContract
+from mythril.exceptions import CriticalError
+from mythril.laser.ethereum.coverage import Coverage
+from mythril.laser.ethereum.state.account import Account
+from mythril.laser.ethereum.state.environment import Environment
+from mythril.laser.ethereum.state.global_state import GlobalState
+from mythril.laser.ethereum.state.machine_state import MachineState
+from mythril.laser.ethereum.strategy.basic import (
+    CoverageGuidedStrategy,
+    DependencyPriorityStrategy,
+)
+
+environment = Environment(
+    Account("0x0", code=Disassembly("5b5b5b5b")), None, None, None, None, None
+)
+
+
+def _coverage(*indices):
+    coverage = Coverage()
+    for index in indices:
+        coverage.mark(environment.code, index)
+    return coverage
+
+
+def _global_state(pc, depth=0, dependency_kind=None):
+    global_state = GlobalState(None, environment, None, MachineState(gas_limit=8000000))
+    global_state.mstate.pc = pc
+    global_state.mstate.depth = depth
+    global_state.dependency_kind = dependency_kind
+    return global_state
+
+
+def test_deferred_states_run_after_regular_states():
+    # Arrange
+    war = _global_state(0, dependency_kind="WAR")
+    raw = _global_state(1, dependency_kind="RAW")
+    regular = _global_state(2)
+    work_list = [war, raw, regular]
+    strategy = DependencyPriorityStrategy(work_list, max_depth=10)
+
+    # Act
+    order = list(strategy)
+
+    # Assert
+    assert order == [regular, raw, war]
+    assert work_list == []
+
+
+def test_unvisited_instructions_and_deep_states_first():
+    # Arrange
+    work_list = [_global_state(0)]
+    strategy = DependencyPriorityStrategy(work_list, max_depth=10)
+    next(strategy)
+    revisit = _global_state(0, depth=5)
+    shallow = _global_state(1, depth=1)
+    deep = _global_state(2, depth=3)
+    too_deep = _global_state(3, depth=10)
+
+    # Act
+    work_list += [revisit, shallow, too_deep, deep]
+    order = list(strategy)
+
+    # Assert
+    assert order == [deep, shallow, revisit]
+
+
+def test_queued_states_are_rescored_when_their_instruction_gets_executed():
+    # Arrange
+    first = _global_state(0, depth=5)
+    same_instruction = _global_state(0, depth=3)
+    other = _global_state(1, depth=1)
+    work_list = [first, same_instruction, other]
+    strategy = DependencyPriorityStrategy(work_list, max_depth=10)
+
+    # Act
+    order = list(strategy)
+
+    # Assert
+    assert order == [first, other, same_instruction]
+
+
+def test_priority_runs_reject_other_strategies():
+    # Act + Assert
+    with pytest.raises(CriticalError):
+        SymExecWrapper(EVMContract(code="00"), "0x0", "bfs", priority={})
+
+
+def test_deferred_kind_is_inherited_by_copies():
+    # Arrange
+    global_state = _global_state(0, dependency_kind="WAW")
+
+    # Act
+    global_state_copy = copy(global_state)
+
+    # Assert
+    assert global_state_copy.dependency_kind == "WAW"
+
+
+def test_states_in_uncovered_blocks_first():
+    # Arrange
+    # JUMPDEST JUMPDEST JUMPDEST JUMPDEST: four blocks of one instruction
+    coverage = _coverage(0, 2)
+    covered = _global_state(0, depth=3)
+    uncovered = _global_state(1)
+    work_list = [covered, uncovered]
+    strategy = CoverageGuidedStrategy(work_list, max_depth=10, coverage=coverage)
+
+    # Act
+    order = list(strategy)
+
+    # Assert
+    assert order == [uncovered, covered]
+
+
+def test_states_looping_in_covered_blocks_last():
+    # Arrange
+    coverage = _coverage(0, 1, 2, 3)
+    work_list = [_global_state(0)]
+    strategy = CoverageGuidedStrategy(work_list, max_depth=10, coverage=coverage)
+    next(strategy)
+    looping = _global_state(0, depth=5)
+    other = _global_state(2)
+
+    # Act
+    work_list += [looping, other]
+    order = list(strategy)
+
+    # Assert
+    assert order == [other, looping]
+
+
+def test_queued_states_are_rescored_when_their_block_gets_covered():
+    # Arrange
+    coverage = Coverage()
+    first = _global_state(0)
+    second = _global_state(1, depth=3)
+    work_list = [first, second]
+    strategy = CoverageGuidedStrategy(work_list, max_depth=10, coverage=coverage)
+
+    # Act
+    coverage.mark(environment.code, 1)
+    order = list(strategy)
+
+    # Assert
+    assert order == [first, second]
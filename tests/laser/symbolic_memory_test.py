@@ -0,0 +1,54 @@
+import mythril.laser.ethereum.svm as svm
+from tests import creation_code
+
+# MSTORE(calldata[0], 0x42) MLOAD(calldata[0]) STOP
+ROUND_TRIP_CODE = "6042600035526000355100"
+ROUND_TRIP_STOP_PC = 7
+# if calldata[0] == 0x20: MSTORE(calldata[0], 0x42) STOP
+FIXED_OFFSET_CODE = "600035602014600a5700" "5b60426000355200"
+FIXED_OFFSET_STOP_PC = 12
+
+
+def _run(code, stop_pc, symbolic_memory=True):
+    laser_evm = svm.LaserEVM(
+        {}, execution_timeout=None, transaction_count=1, symbolic_memory=symbolic_memory
+    )
+    laser_evm.sym_exec(creation_code=creation_code(code))
+    return [
+        state
+        for node in laser_evm.nodes.values()
+        for state in node.states
+        if state.environment.code.bytecode == code and state.mstate.pc == stop_pc
+    ]
+
+
+def test_load_from_symbolic_offset_reads_stored_word():
+    # Act
+    stop_states = _run(ROUND_TRIP_CODE, ROUND_TRIP_STOP_PC)
+
+    # Assert
+    assert len(stop_states) == 1
+    assert stop_states[0].mstate.memory.is_symbolic
+    assert stop_states[0].mstate.memory_size >= 32
+    assert stop_states[0].mstate.stack[-1] == 0x42
+
+
+def test_symbolic_offsets_are_not_modelled_by_default():
+    # Act
+    stop_states = _run(ROUND_TRIP_CODE, ROUND_TRIP_STOP_PC, symbolic_memory=False)
+
+    # Assert
+    assert len(stop_states) == 1
+    assert "mem[" in str(stop_states[0].mstate.stack[-1])
+
+
+def test_offset_fixed_by_constraints_is_concretized():
+    # Act
+    stop_states = _run(FIXED_OFFSET_CODE, FIXED_OFFSET_STOP_PC)
+
+    # Assert
+    assert len(stop_states) == 1
+    memory = stop_states[0].mstate.memory
+    assert not memory.is_symbolic
+    assert len(memory) == 64
+    assert memory.get_word_at(0x20) == 0x42
@@ -32,7 +32,7 @@ def _all_info(laser):
     accounts = {}
     for address, _account in laser.world_state.accounts.items():
         account = _account.as_dict
-        account["code"] = account["code"].instruction_list
+        account["code"] = list(account["code"].instruction_list)
         account["balance"] = str(account["balance"])
         accounts[address] = account
 
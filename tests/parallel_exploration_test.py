@@ -0,0 +1,50 @@
+from mythril.analysis.security import fire_lasers
+from mythril.analysis.symbolic import SymExecWrapper
+from mythril.ethereum import util
+from mythril.ethereum.evmcontract import EVMContract
+from tests import TESTDATA_INPUTS, creation_code
+
+
+def _issue_set(contract, workers, transaction_count=2, modules=()):
+    sym = SymExecWrapper(
+        contract,
+        "0x0000000000000000000000000000000000000001",
+        "dfs",
+        max_depth=22,
+        execution_timeout=60,
+        transaction_count=transaction_count,
+        workers=workers,
+        modules=modules,
+    )
+    return {(issue.title, issue.address) for issue in fire_lasers(sym, modules)}
+
+
+def test_parallel_exploration_finds_same_issues():
+    # Arrange
+    code = util.safe_decode(
+        (TESTDATA_INPUTS / "returnvalue.sol.o").read_text().strip()
+    ).hex()
+    contract = EVMContract(code=code, creation_code=creation_code(code))
+
+    # Act + Assert
+    assert _issue_set(contract, workers=2) == _issue_set(contract, workers=1)
+
+
+def test_calls_and_stores_of_different_partitions_are_paired():
+    # Arrange
+    # calldata 1: SSTORE(0, CALLER), calldata 2: CALL(to=SLOAD(0)), runtime code only so that storage is symbolic
+    code = (
+        "6000358060011460115760021460175700"
+        + "5b3360005500"
+        + "5b600060006000600060006000545af15000"
+    )
+    contract = EVMContract(code=code)
+    modules = ("transaction_order_dependence",)
+
+    # Act
+    # With one open state per worker, the SSTOREs and CALLs of the later transactions run in different workers
+    parallel_issues = _issue_set(contract, 8, transaction_count=3, modules=modules)
+    issues = _issue_set(contract, 1, transaction_count=3, modules=modules)
+
+    # Assert
+    assert parallel_issues == issues
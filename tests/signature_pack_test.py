@@ -0,0 +1,113 @@
+from mythril.disassembler.disassembly import Disassembly
+from mythril.support.signature_pack import (
+    SignaturePack,
+    build_signature_pack,
+    read_signature_dump,
+)
+from mythril.support.signatures import SignatureDB
+
+
+def test_build_and_get(tmpdir):
+    # Arrange
+    path = str(tmpdir.join("signatures.pack"))
+    signatures = [
+        ("0xa9059cbb", "transfer(address,uint256)"),
+        ("0x095ea7b3", "approve(address,uint256)"),
+        ("0x00000001", "b()"),
+        ("0x00000001", "a()"),
+        ("0x00000001", "a()"),
+    ]
+
+    # Act
+    count = build_signature_pack(signatures, path)
+    pack = SignaturePack(path)
+
+    # Assert
+    assert count == len(pack) == 4
+    assert pack.get("0xa9059cbb") == ["transfer(address,uint256)"]
+    assert pack.get("095ea7b3") == ["approve(address,uint256)"]
+    assert pack.get(bytes([0, 0, 0, 1])) == ["a()", "b()"]
+    assert pack.get("0x00000002") == []
+    assert pack.get("0xffffffff") == []
+
+
+def test_read_text_dump(tmpdir):
+    # Arrange
+    dump = tmpdir.join("dump.txt")
+    dump.write(
+        "# selectors\n"
+        "A9059CBB: transfer(address,uint256)\n"
+        "\n"
+        "0x095ea7b3,approve(address,uint256)\n"
+        "18160ddd totalSupply()\n"
+    )
+
+    # Act
+    signatures = list(read_signature_dump(str(dump)))
+
+    # Assert
+    assert signatures == [
+        ("0xa9059cbb", "transfer(address,uint256)"),
+        ("0x095ea7b3", "approve(address,uint256)"),
+        ("0x18160ddd", "totalSupply()"),
+    ]
+
+
+def test_read_sqlite_dump(tmpdir):
+    # Arrange
+    SignatureDB(path=str(tmpdir)).add("0xa9059cbb", "transfer(address,uint256)")
+
+    # Act
+    signatures = list(read_signature_dump(str(tmpdir.join("signatures.db"))))
+
+    # Assert
+    assert signatures == [("0xa9059cbb", "transfer(address,uint256)")]
+
+
+def test_signature_db_prefers_pack(tmpdir):
+    # Arrange
+    signature_db = SignatureDB(path=str(tmpdir))
+    signature_db.add("0xa9059cbb", "other(uint256)")
+    signature_db.add("0x095ea7b3", "approve(address,uint256)")
+    signature_db.get("0xa9059cbb")
+
+    # Act
+    build_signature_pack(
+        [("0xa9059cbb", "transfer(address,uint256)")], signature_db.pack_path
+    )
+
+    # Assert
+    assert signature_db.get_many(["0xa9059cbb", "0x095ea7b3"]) == {
+        "0xa9059cbb": ["transfer(address,uint256)"],
+        "0x095ea7b3": ["approve(address,uint256)"],
+    }
+
+
+def test_signature_db_ignores_invalid_pack(tmpdir):
+    # Arrange
+    signature_db = SignatureDB(path=str(tmpdir))
+    signature_db.add("0xa9059cbb", "transfer(address,uint256)")
+    tmpdir.join("signatures.pack").write("not a pack")
+
+    # Act
+    text_sigs = signature_db.get("0xa9059cbb")
+
+    # Assert
+    assert text_sigs == ["transfer(address,uint256)"]
+
+
+def test_disassembly_names_functions_from_pack(tmpdir, monkeypatch):
+    # Arrange
+    monkeypatch.setenv("MYTHRIL_DIR", str(tmpdir))
+    build_signature_pack(
+        [("0xa9059cbb", "transfer(address,uint256)")],
+        str(tmpdir.join("signatures.pack")),
+    )
+    # PUSH4 0xa9059cbb EQ PUSH2 0x0010 JUMPI
+    code = "63a9059cbb1461001057"
+
+    # Act
+    disassembly = Disassembly(code)
+
+    # Assert
+    assert disassembly.function_name_to_address == {"transfer(address,uint256)": 0x10}
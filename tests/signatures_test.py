@@ -0,0 +1,113 @@
+import os
+import shutil
+import sqlite3
+import multiprocessing
+
+from mythril.support import signatures
+from mythril.support.signatures import MAX_LOOKUP_BATCH, SignatureDB
+
+
+def test_add_many_and_get_many(tmpdir):
+    # Arrange
+    signature_db = SignatureDB(path=str(tmpdir))
+
+    # Act
+    signature_db.add_many(
+        [
+            ("0xa9059cbb", "transfer(address,uint256)"),
+            ("095ea7b3", "approve(address,uint256)"),
+            ("0x095ea7b3", "approve(address,uint256)"),
+        ]
+    )
+    result = signature_db.get_many(["a9059cbb", "0x095ea7b3", "0x12345678"])
+
+    # Assert
+    assert result == {
+        "0xa9059cbb": ["transfer(address,uint256)"],
+        "0x095ea7b3": ["approve(address,uint256)"],
+        "0x12345678": [],
+    }
+
+
+def test_get_after_add_skips_cached_miss(tmpdir):
+    # Arrange
+    signature_db = SignatureDB(path=str(tmpdir))
+    signature_db.get("0xa9059cbb")
+
+    # Act
+    signature_db.add("0xa9059cbb", "transfer(address,uint256)")
+
+    # Assert
+    assert signature_db["0xa9059cbb"] == ["transfer(address,uint256)"]
+
+
+def test_get_many_batches_lookups(tmpdir):
+    # Arrange
+    signature_db = SignatureDB(path=str(tmpdir))
+    count = 2 * MAX_LOOKUP_BATCH + 1
+    signature_db.add_many(
+        ("0x{:08x}".format(i), "f{}()".format(i)) for i in range(count)
+    )
+
+    # Act
+    result = signature_db.get_many("0x{:08x}".format(i) for i in range(count))
+
+    # Assert
+    assert len(result) == count
+    assert result["0x{:08x}".format(count - 1)] == ["f{}()".format(count - 1)]
+
+
+def test_instances_see_replaced_database(tmpdir):
+    # Arrange
+    other_dir = tmpdir.mkdir("other")
+    SignatureDB(path=str(other_dir)).add("0xa9059cbb", "transfer(address,uint256)")
+    signature_db = SignatureDB(path=str(tmpdir))
+    assert signature_db.get("0xa9059cbb") == []
+
+    # Act
+    os.remove(str(tmpdir.join("signatures.db")))
+    shutil.copyfile(
+        str(other_dir.join("signatures.db")), str(tmpdir.join("signatures.db"))
+    )
+
+    # Assert
+    assert SignatureDB(path=str(tmpdir)).get("0xa9059cbb") == [
+        "transfer(address,uint256)"
+    ]
+
+
+def test_instances_see_writes_of_other_connections(tmpdir):
+    # Arrange
+    signature_db = SignatureDB(path=str(tmpdir))
+    assert signature_db.get("0xa9059cbb") == []
+
+    # Act
+    conn = sqlite3.connect(str(tmpdir.join("signatures.db")))
+    conn.execute(
+        "INSERT INTO signatures VALUES (?,?)",
+        ("0xa9059cbb", "transfer(address,uint256)"),
+    )
+    conn.commit()
+    conn.close()
+
+    # Assert
+    assert SignatureDB(path=str(tmpdir)).get("0xa9059cbb") == [
+        "transfer(address,uint256)"
+    ]
+
+
+def test_forked_child_does_not_wait_for_held_locks(tmpdir):
+    # Arrange
+    signature_db = SignatureDB(path=str(tmpdir))
+    context = multiprocessing.get_context("fork")
+
+    # Act
+    with signatures._connections_lock:
+        process = context.Process(target=signature_db.get, args=("0xa9059cbb",))
+        process.start()
+        process.join(30)
+    if process.is_alive():
+        process.terminate()
+
+    # Assert
+    assert process.exitcode == 0
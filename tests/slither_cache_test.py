@@ -0,0 +1,96 @@
+from mythril.support import slither_cache
+from mythril.support.slither_cache import SlitherCache
+
+DEPENDENCIES = {
+    "Token": [["balance", ["transfer(address,uint256)"], ["balanceOf(address)"]]],
+    "Owned": [["owner", [], ["fallback()"]]],
+}
+
+
+def _count_slither_runs(monkeypatch, version):
+    runs = []
+
+    def run_slither(self, file):
+        runs.append(file)
+        return DEPENDENCIES
+
+    monkeypatch.setattr(slither_cache, "get_compiler_version", lambda _: version[0])
+    monkeypatch.setattr(SlitherCache, "_run_slither", run_slither)
+    return runs
+
+
+def test_contracts_of_a_file_share_one_slither_run(tmp_path, monkeypatch):
+    # Arrange
+    version = ["0.4.25"]
+    runs = _count_slither_runs(monkeypatch, version)
+    source = tmp_path / "token.sol"
+    source.write_text("contract Owned {} contract Token {}")
+    cache = SlitherCache(str(tmp_path / "cache"))
+
+    # Act
+    token = cache.get_dependencies(str(source), "Token")
+    owned = cache.get_dependencies(str(source), "Owned")
+    missing = cache.get_dependencies(str(source), "Missing")
+
+    # Assert
+    assert token == DEPENDENCIES["Token"]
+    assert owned == DEPENDENCIES["Owned"]
+    assert missing is None
+    assert len(runs) == 1
+
+
+def test_dependencies_are_reused_across_runs(tmp_path, monkeypatch):
+    # Arrange
+    version = ["0.4.25"]
+    runs = _count_slither_runs(monkeypatch, version)
+    source = tmp_path / "token.sol"
+    source.write_text("contract Owned {} contract Token {}")
+    SlitherCache(str(tmp_path / "cache")).get_dependencies(str(source), "Token")
+
+    # Act
+    token = SlitherCache(str(tmp_path / "cache")).get_dependencies(str(source), "Token")
+
+    # Assert
+    assert token == DEPENDENCIES["Token"]
+    assert len(runs) == 1
+
+
+def test_changed_source_or_compiler_invalidates_entry(tmp_path, monkeypatch):
+    # Arrange
+    version = ["0.4.25"]
+    runs = _count_slither_runs(monkeypatch, version)
+    source = tmp_path / "token.sol"
+    source.write_text("contract Owned {} contract Token {}")
+    SlitherCache(str(tmp_path / "cache")).get_dependencies(str(source), "Token")
+
+    # Act
+    source.write_text("contract Owned {} contract Token { uint balance; }")
+    SlitherCache(str(tmp_path / "cache")).get_dependencies(str(source), "Token")
+    version[0] = "0.5.0"
+    SlitherCache(str(tmp_path / "cache")).get_dependencies(str(source), "Token")
+
+    # Assert
+    assert len(runs) == 3
+
+
+def test_changed_import_invalidates_entry(tmp_path, monkeypatch):
+    # Arrange
+    version = ["0.4.25"]
+    runs = _count_slither_runs(monkeypatch, version)
+    (tmp_path / "lib").mkdir()
+    owned = tmp_path / "lib" / "owned.sol"
+    owned.write_text("contract Owned {}")
+    (tmp_path / "lib" / "base.sol").write_text('import "./owned.sol";')
+    source = tmp_path / "token.sol"
+    source.write_text('import {Base} from "./lib/base.sol";\ncontract Token {}')
+    cache = SlitherCache(str(tmp_path / "cache"))
+    cache.get_dependencies(str(source), "Token")
+
+    # Act
+    cache.get_dependencies(str(source), "Token")
+    owned.write_text("contract Owned { address owner; }")
+    cache.get_dependencies(str(source), "Token")
+    SlitherCache(str(tmp_path / "cache")).get_dependencies(str(source), "Token")
+
+    # Assert
+    assert len(runs) == 2
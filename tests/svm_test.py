@@ -30,7 +30,7 @@ def _all_info(laser):
     accounts = {}
     for address, _account in laser.world_state.accounts.items():
         account = _account.as_dict
-        account["code"] = account["code"].instruction_list
+        account["code"] = list(account["code"].instruction_list)
         account["balance"] = str(account["balance"])
         accounts[address] = account
 
@@ -73,10 +73,6 @@ def _all_info(laser):
 
 
 class SVMTestCase(BaseTestCase):
-    def setUp(self):
-        super(SVMTestCase, self).setUp()
-        svm.gbl_next_uid = 0
-
     def test_laser_result(self):
         for input_file in TESTDATA_INPUTS_CONTRACTS.iterdir():
             if input_file.name in ["weak_random.sol", "environments.sol"]: